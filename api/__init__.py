@@ -1,6 +1,7 @@
 """API clients package for API testing."""
 
-from .base_api import BaseAPI
+from .base_api import APIResponse, BaseAPI
 from .jsonplaceholder_api import JSONPlaceholderAPI
+from .schema import SchemaValidationError
 
-__all__ = ["BaseAPI", "JSONPlaceholderAPI"] 
\ No newline at end of file
+__all__ = ["APIResponse", "BaseAPI", "JSONPlaceholderAPI", "SchemaValidationError"] 
\ No newline at end of file
@@ -2,9 +2,64 @@
 Base API client for API testing.
 """
 
+import asyncio
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from loguru import logger
+from .cassette import CassetteAdapter
+from .http_cache import HTTPCache, lookup_key
+from .json_stream import iter_json_array, loads
+from .schema import get_validator
+from .single_flight import SingleFlight
+
+# Marks a response whose JSON body has not been parsed yet
+_UNPARSED = object()
+
+
+class APIResponse:
+    """HTTP response whose JSON body is parsed once and cached.
+    
+    Everything else is delegated to the wrapped ``requests.Response``, including
+    truthiness (``ok``), iteration and the context manager protocol. It is not a
+    ``requests.Response`` subclass; use ``.response`` where one is required.
+    """
+    
+    def __init__(self, response: requests.Response, from_cache: bool = False, coalesced: bool = False):
+        """Wrap a response."""
+        self.response = response
+        self.from_cache = from_cache
+        self.coalesced = coalesced
+        self._json = _UNPARSED
+        
+    def json(self, **kwargs) -> Any:
+        """Get the parsed JSON body."""
+        if self._json is _UNPARSED:
+            self._json = loads(self.response.content, **kwargs)
+        return self._json
+        
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the wrapped response."""
+        return getattr(self.response, name)
+        
+    def __bool__(self) -> bool:
+        """True for a status code below 400, like ``requests.Response``."""
+        return self.response.ok
+        
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the body in chunks, like ``requests.Response``."""
+        return iter(self.response)
+        
+    def __enter__(self) -> "APIResponse":
+        """Enter a ``with`` block; the response is closed on exit."""
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        """Close the wrapped response."""
+        self.response.close()
+        
+    def __repr__(self) -> str:
+        """String representation of the response."""
+        return f"<APIResponse [{self.response.status_code}]>"
 
 
 class BaseAPI:
@@ -15,6 +70,9 @@ class BaseAPI:
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.session = requests.Session()
+        self.cache: Optional[HTTPCache] = None
+        # Concurrent identical GETs on this client share one round trip; None disables
+        self.single_flight: Optional[SingleFlight] = SingleFlight()
         
         # Default headers
         self.session.headers.update({
@@ -31,65 +89,131 @@ class BaseAPI:
         """Set a custom header."""
         self.session.headers.update({key: value})
         
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
-        """Make GET request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"GET request to: {url}")
+    def enable_cache(self, cache: Optional[HTTPCache] = None, **options) -> HTTPCache:
+        """Cache GET responses, in a new ``HTTPCache(**options)`` or a shared one."""
+        self.cache = cache if cache is not None else HTTPCache(**options)
+        return self.cache
         
-        response = self.session.get(url, params=params, timeout=self.timeout)
-        logger.info(f"Response status: {response.status_code}")
-        return response
+    def use_cassette(self, path: str, mode: str = "auto", **options) -> CassetteAdapter:
+        """Record and replay this client's traffic through a ``CassetteAdapter(path, mode, **options)``."""
+        options.setdefault("live", self.session.get_adapter(self.base_url))
+        adapter = CassetteAdapter(path, mode, **options)
+        self.session.mount(self.base_url, adapter)
+        return adapter
         
-    def post(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> requests.Response:
-        """Make POST request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"POST request to: {url}")
+    def get(self, endpoint: str, params: Optional[Dict] = None) -> APIResponse:
+        """Make GET request."""
+        return self._request("GET", endpoint, params=params)
         
-        response = self.session.post(url, data=data, json=json, timeout=self.timeout)
-        logger.info(f"Response status: {response.status_code}")
-        return response
+    def post(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> APIResponse:
+        """Make POST request."""
+        return self._request("POST", endpoint, data=data, json=json)
         
-    def put(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> requests.Response:
+    def put(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> APIResponse:
         """Make PUT request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"PUT request to: {url}")
-        
-        response = self.session.put(url, data=data, json=json, timeout=self.timeout)
-        logger.info(f"Response status: {response.status_code}")
-        return response
+        return self._request("PUT", endpoint, data=data, json=json)
         
-    def patch(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> requests.Response:
+    def patch(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> APIResponse:
         """Make PATCH request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"PATCH request to: {url}")
+        return self._request("PATCH", endpoint, data=data, json=json)
         
-        response = self.session.patch(url, data=data, json=json, timeout=self.timeout)
-        logger.info(f"Response status: {response.status_code}")
-        return response
-        
-    def delete(self, endpoint: str) -> requests.Response:
+    def delete(self, endpoint: str) -> APIResponse:
         """Make DELETE request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"DELETE request to: {url}")
-        
-        response = self.session.delete(url, timeout=self.timeout)
+        return self._request("DELETE", endpoint)
+        
+    async def aget(self, endpoint: str, params: Optional[Dict] = None) -> APIResponse:
+        """Make GET request from asyncio code; concurrent identical calls share one request."""
+        if self.single_flight is None:
+            return await asyncio.to_thread(self.get, endpoint, params)
+        _, key = lookup_key(self.session, self.url_for(endpoint), params)
+        response, shared = await self.single_flight.ado(key, lambda: asyncio.to_thread(self.get, endpoint, params))
+        return APIResponse(response.response, response.from_cache, coalesced=True) if shared else response
+        
+    def iter_json(
+        self, endpoint: str, params: Optional[Dict] = None, expected_code: int = 200, chunk_size: int = 64 * 1024
+    ) -> Iterator[Any]:
+        """Stream the elements of a JSON array response without loading the whole body."""
+        response = self._request("GET", endpoint, params=params, stream=True)
+        try:
+            self.assert_status_code(response, expected_code)
+            yield from iter_json_array(response.iter_content(chunk_size), response.encoding or "utf-8")
+        finally:
+            response.close()
+        
+    def url_for(self, endpoint: str) -> str:
+        """Get the absolute URL of an endpoint."""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+        
+    def _request(self, method: str, endpoint: str, **kwargs) -> APIResponse:
+        """Send a request; every HTTP verb goes through here."""
+        url = self.url_for(endpoint)
+        if method == "GET" and not kwargs.get("stream"):
+            return self._coalesced_get(url, kwargs.get("params"))
+        # Only writes change the collection; a streamed GET must keep its cache
+        if self.cache is not None and method not in ("GET", "HEAD"):
+            self.cache.invalidate(url)
+        return APIResponse(self._send(method, url, **kwargs))
+        
+    def _coalesced_get(self, url: str, params: Optional[Dict]) -> APIResponse:
+        """Make a GET, sharing the response of an identical GET already in flight."""
+        get = self._cached_get if self.cache is not None else self._plain_get
+        if self.single_flight is None:
+            return get(url, params)
+        _, key = lookup_key(self.session, url, params)
+        response, shared = self.single_flight.do(key, lambda: get(url, params))
+        # Each caller parses its own copy of the body
+        return APIResponse(response.response, response.from_cache, coalesced=True) if shared else response
+        
+    def _plain_get(self, url: str, params: Optional[Dict]) -> APIResponse:
+        """Make a GET over the network."""
+        return APIResponse(self._send("GET", url, params=params))
+        
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request over the network."""
+        logger.info(f"{method} request to: {url}")
+        
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
         logger.info(f"Response status: {response.status_code}")
         return response
         
-    def assert_status_code(self, response: requests.Response, expected_code: int) -> None:
+    def _cached_get(self, url: str, params: Optional[Dict]) -> APIResponse:
+        """Serve a GET from the cache, revalidating or fetching as needed."""
+        cache = self.cache
+        full_url, key = lookup_key(self.session, url, params)
+        entry = cache.lookup(key)
+        if entry is not None and entry.is_fresh():
+            cache.count("hits")
+            logger.debug(f"Cache hit: {full_url}")
+            return APIResponse(entry.to_response(), from_cache=True)
+            
+        headers = entry.conditional_headers() if entry is not None else {}
+        response = self._send("GET", url, params=params, headers=headers or None)
+        if entry is not None and response.status_code == 304:
+            cache.count("revalidated")
+            return APIResponse(cache.refresh(key, entry, response).to_response(), from_cache=True)
+        cache.count("misses")
+        cache.store(key, response)
+        return APIResponse(response)
+        
+    def assert_status_code(self, response: APIResponse, expected_code: int) -> None:
         """Assert response status code."""
         assert response.status_code == expected_code, \
             f"Expected status code {expected_code}, got {response.status_code}. Response: {response.text}"
             
-    def assert_response_contains(self, response: requests.Response, key: str) -> None:
+    def assert_response_contains(self, response: APIResponse, key: str) -> None:
         """Assert response contains specific key."""
         response_json = response.json()
         assert key in response_json, f"Key '{key}' not found in response: {response_json}"
         
-    def get_json_value(self, response: requests.Response, key: str) -> Any:
+    def get_json_value(self, response: APIResponse, key: str) -> Any:
         """Get value from JSON response."""
-        response_json = response.json()
-        return response_json.get(key)
+        return response.json().get(key)
+        
+    def validate_schema(self, data: Any, schema: str) -> None:
+        """Assert that a response body (or already parsed data) matches a registered schema."""
+        if isinstance(data, (APIResponse, requests.Response)):
+            data = data.json()
+        get_validator(schema).validate(data)
         
     def close(self) -> None:
         """Close the session."""
@@ -0,0 +1,381 @@
+"""
+Record and replay of API traffic ("cassettes").
+
+A ``CassetteAdapter`` is a ``requests`` transport mounted on an API client's
+session. In ``record`` mode it forwards requests to the real transport and
+keeps every request/response pair; in ``replay`` mode it answers from the
+cassette without touching the network; ``auto`` replays what it has and
+records the rest. Cassettes are gzip-compressed JSON files in which identical
+response bodies are stored once, keyed by their SHA-1.
+
+Requests are matched ``strict``ly on method, URL (query parameters in any
+order) and request body, or ``lenient``ly on method and path when no strict
+match exists. A request recorded several times replays its responses in the
+recorded order, repeating the last one. Only the method, URL and body of a
+request are stored, never its headers.
+
+Saving merges with the file on disk under a lock file: the requests a process
+recorded replace their earlier recordings and everything else is kept, so
+xdist or orchestrator workers sharing a cassette do not overwrite each other.
+
+Usage:
+    api = JSONPlaceholderAPI()
+    api.use_cassette(
+        "tests/api/cassettes/jsonplaceholder.json.gz", mode="replay", latency_ms=20
+    )
+    api.get_posts()  # served from the cassette
+    api.close()      # writes newly recorded interactions
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from uuid import uuid4
+
+import requests
+from loguru import logger
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+MODES = ("record", "replay", "auto")
+MATCHING = ("strict", "lenient")
+
+FORMAT_VERSION = 1
+
+# Headers that describe the wire encoding rather than the stored (decoded) body
+_TRANSPORT_HEADERS = frozenset(
+    {
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+        "connection",
+        "keep-alive",
+    }
+)
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Raised in replay mode for a request the cassette has no answer for."""
+
+
+def _digest(body: Union[bytes, str, None]) -> Optional[str]:
+    """Get the SHA-1 of a body, or None when there is none."""
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode()
+    return hashlib.sha1(body).hexdigest()
+
+
+@contextmanager
+def _file_lock(path: Path, timeout: float = 30.0) -> Iterator[None]:
+    """Hold a lock file across processes, taking over locks older than ``timeout``."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - path.stat().st_mtime > timeout:
+                    path.unlink(missing_ok=True)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {path}")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        path.unlink(missing_ok=True)
+
+
+def _normalize_url(url: str) -> str:
+    """Get a URL with its query parameters sorted."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{parts.scheme}://{parts.netloc}{parts.path}" + (
+        f"?{query}" if query else ""
+    )
+
+
+@dataclass
+class Interaction:
+    """Recorded request and the response it got; bodies are digests."""
+
+    method: str
+    url: str
+    request_body: Optional[str]
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    response_body: Optional[str]
+    elapsed_ms: float = 0.0
+
+    @property
+    def strict_key(self) -> Tuple[str, str, Optional[str]]:
+        """Get the key matched in strict mode."""
+        return self.method, _normalize_url(self.url), self.request_body
+
+    @property
+    def lenient_key(self) -> Tuple[str, str]:
+        """Get the key matched in lenient mode."""
+        return self.method, urlsplit(self.url).path
+
+
+@dataclass
+class CassetteStats:
+    """Counters of replayed, recorded and unmatched requests."""
+
+    played: int = 0
+    recorded: int = 0
+    missed: int = 0
+
+
+class Cassette:
+    """Recorded interactions with their deduplicated bodies."""
+
+    def __init__(self, path: Union[str, Path], match: str = "strict"):
+        """Initialize an empty cassette stored at ``path``."""
+        if match not in MATCHING:
+            raise ValueError(
+                f"Unknown matching mode '{match}', expected one of {MATCHING}"
+            )
+        self.path = Path(path)
+        self.match = match
+        self.interactions: List[Interaction] = []
+        self.bodies: Dict[str, bytes] = {}
+        self.dirty = False
+        # Interactions recorded by this process, merged into the file on save
+        self.recorded: List[Interaction] = []
+        self._index: Dict[tuple, List[Interaction]] = {}
+        self._cursors: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, Path], match: str = "strict") -> "Cassette":
+        """Read a cassette file; a missing file gives an empty cassette."""
+        cassette = cls(path, match)
+        if not cassette.path.exists():
+            return cassette
+        with gzip.open(cassette.path, "rt", encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported cassette version in {cassette.path}: "
+                f"{data.get('version')!r}"
+            )
+        cassette.bodies = {
+            digest: text.encode("utf-8", "surrogateescape")
+            for digest, text in data["bodies"].items()
+        }
+        for record in data["interactions"]:
+            cassette._add(Interaction(**record))
+        return cassette
+
+    def find(self, request: requests.PreparedRequest) -> Optional[Interaction]:
+        """Get the next recorded interaction matching a request."""
+        method, url = request.method, request.url
+        keys = [(method, _normalize_url(url), _digest(request.body))]
+        if self.match == "lenient":
+            keys.append((method, urlsplit(url).path))
+        with self._lock:
+            for key in keys:
+                candidates = self._index.get(key)
+                if candidates:
+                    position = self._cursors.get(key, 0)
+                    self._cursors[key] = min(position + 1, len(candidates) - 1)
+                    return candidates[position]
+        return None
+
+    def append(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> Interaction:
+        """Record a request and its response, reading the whole body."""
+        content = response.content
+        with self._lock:
+            interaction = Interaction(
+                method=request.method,
+                url=request.url,
+                request_body=self._keep(request.body),
+                status_code=response.status_code,
+                reason=response.reason or "",
+                headers={
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in _TRANSPORT_HEADERS
+                },
+                response_body=self._keep(content),
+                elapsed_ms=(
+                    round(response.elapsed.total_seconds() * 1000, 1)
+                    if response.elapsed
+                    else 0.0
+                ),
+            )
+            self._add(interaction)
+            self.recorded.append(interaction)
+            self.dirty = True
+        return interaction
+
+    def to_response(
+        self, interaction: Interaction, request: requests.PreparedRequest
+    ) -> requests.Response:
+        """Build the response of a recorded interaction."""
+        response = requests.Response()
+        response.status_code = interaction.status_code
+        response.reason = interaction.reason
+        response.headers = CaseInsensitiveDict(interaction.headers)
+        response._content = self.bodies.get(interaction.response_body, b"")
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(milliseconds=interaction.elapsed_ms)
+        return response
+
+    def save(self) -> None:
+        """Merge what was recorded since loading into the cassette file.
+
+        The file is re-read under a lock, so recordings saved by other
+        processes in the meantime are kept.
+        """
+        with self._lock:
+            if not self.dirty:
+                return
+            recorded = list(self.recorded)
+            bodies = dict(self.bodies)
+            self.dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _file_lock(self.path.with_name(self.path.name + ".lock")):
+            on_disk = Cassette.load(self.path, self.match)
+            replaced = {interaction.strict_key for interaction in recorded}
+            interactions = [
+                interaction
+                for interaction in on_disk.interactions
+                if interaction.strict_key not in replaced
+            ] + recorded
+            bodies = {**on_disk.bodies, **bodies}
+            used = {
+                digest
+                for interaction in interactions
+                for digest in (interaction.request_body, interaction.response_body)
+                if digest is not None
+            }
+            data = {
+                "version": FORMAT_VERSION,
+                "interactions": [asdict(interaction) for interaction in interactions],
+                "bodies": {
+                    digest: content.decode("utf-8", "surrogateescape")
+                    for digest, content in bodies.items()
+                    if digest in used
+                },
+            }
+            # Unique per process and write, so workers saving one cassette never collide
+            temporary = self.path.with_suffix(f".{os.getpid()}.{uuid4().hex}.tmp")
+            with gzip.open(temporary, "wt", encoding="utf-8") as handle:
+                json.dump(data, handle, separators=(",", ":"))
+            temporary.replace(self.path)
+        logger.info(
+            f"Saved {len(recorded)} recorded of {len(interactions)} interactions "
+            f"to {self.path}"
+        )
+
+    def __len__(self) -> int:
+        """Get the number of recorded interactions."""
+        return len(self.interactions)
+
+    def _keep(self, body: Union[bytes, str, None]) -> Optional[str]:
+        """Store a body once and get its digest."""
+        digest = _digest(body)
+        if digest is not None and digest not in self.bodies:
+            self.bodies[digest] = body.encode() if isinstance(body, str) else body
+        return digest
+
+    def _add(self, interaction: Interaction) -> None:
+        """Add an interaction to the lookup index."""
+        self.interactions.append(interaction)
+        self._index.setdefault(interaction.strict_key, []).append(interaction)
+        self._index.setdefault(interaction.lenient_key, []).append(interaction)
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport that records to and replays from a cassette."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: str = "auto",
+        match: str = "strict",
+        latency_ms: float = 0.0,
+        live: Optional[BaseAdapter] = None,
+    ):
+        """Initialize adapter.
+
+        ``record`` sends every request to the network and replaces its earlier
+        recordings, ``replay`` never goes to the network and ``auto`` records
+        only requests the cassette cannot answer.
+        ``latency_ms`` delays every replayed response; ``live`` is the
+        transport used for recording (a plain ``HTTPAdapter`` by default).
+        """
+        super().__init__()
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}', expected one of {MODES}")
+        if latency_ms < 0:
+            raise ValueError(f"latency_ms must not be negative, got {latency_ms}")
+        self.mode = mode
+        self.latency_ms = latency_ms
+        self.live = live if live is not None else HTTPAdapter()
+        self.cassette = (
+            Cassette(path, match) if mode == "record" else Cassette.load(path, match)
+        )
+        self.stats = CassetteStats()
+        self._stats_lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Answer from the cassette or forward to the live transport and record."""
+        if self.mode != "record":
+            interaction = self.cassette.find(request)
+            if interaction is not None:
+                self._count("played")
+                if self.latency_ms:
+                    time.sleep(self.latency_ms / 1000)
+                response = self.cassette.to_response(interaction, request)
+                response.connection = self
+                return response
+            self._count("missed")
+            if self.mode == "replay":
+                raise CassetteMiss(
+                    f"No recorded response for {request.method} {request.url} "
+                    f"in {self.cassette.path} ({self.cassette.match} matching); "
+                    "record it with mode='auto' or 'record'",
+                    request=request,
+                )
+        response = self.live.send(request, **kwargs)
+        self.cassette.append(request, response)
+        self._count("recorded")
+        return response
+
+    def save(self) -> None:
+        """Write newly recorded interactions to the cassette file."""
+        self.cassette.save()
+
+    def close(self) -> None:
+        """Save the cassette and close the live transport."""
+        self.save()
+        self.live.close()
+
+    def _count(self, counter: str) -> None:
+        """Increment one of the ``stats`` counters."""
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
@@ -0,0 +1,333 @@
+"""
+Client-side HTTP cache for API clients.
+
+GET responses are kept in an in-memory LRU and, optionally, on disk so cached
+reference data survives between runs and xdist workers. Freshness follows
+``Cache-Control`` (``max-age``, ``no-cache``, ``no-store``) unless a per-endpoint
+TTL override applies. Stale entries with an ``ETag`` or ``Last-Modified`` are
+revalidated with a conditional request; a ``304 Not Modified`` reuses the
+cached body. Mutating requests bypass the cache and invalidate the entries of
+the collection they touch.
+
+Usage:
+    api = JSONPlaceholderAPI()
+    api.enable_cache(ttl_overrides={"/users*": 300}, directory="reports/.http-cache")
+    api.get_users()  # network
+    api.get_users()  # memory
+    print(api.cache.stats)
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Request headers that select a different representation of the same URL
+VARY_HEADERS = ("Accept", "Authorization")
+
+# Response headers a 304 Not Modified may update
+_REVALIDATION_HEADERS = frozenset(
+    {"cache-control", "etag", "last-modified", "date", "expires"}
+)
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CacheEntry:
+    """Stored response with its freshness lifetime and validators."""
+
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes = field(repr=False)
+    expires_at: float = 0.0
+
+    def __post_init__(self):
+        """Make header lookups case-insensitive."""
+        self.headers = CaseInsensitiveDict(self.headers)
+
+    @property
+    def etag(self) -> Optional[str]:
+        """Get the entity tag, if any."""
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Get the last modification date, if any."""
+        return self.headers.get("Last-Modified")
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Check if the entry can be used without revalidation."""
+        return (time.time() if now is None else now) < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get headers that revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Build a response from the entry."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers.update(self.headers)
+        response._content = self.content
+        response.url = self.url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss counters."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the share of lookups served without a full download."""
+        lookups = self.hits + self.misses + self.revalidated
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        """String representation of the counters."""
+        return (
+            f"{self.hits} hits, {self.revalidated} revalidated, {self.misses} misses "
+            f"({self.hit_rate:.0%} hit rate), {self.stores} stored, "
+            f"{self.invalidations} invalidated"
+        )
+
+
+class HTTPCache:
+    """LRU (and optional on-disk) cache of GET responses, shared across threads."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        directory: Optional[str] = None,
+        ttl_overrides: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0.0,
+    ):
+        """Initialize cache.
+
+        ``ttl_overrides`` maps URL path patterns (``fnmatch``, e.g. ``"/users*"``)
+        to a lifetime in seconds that replaces the server's ``Cache-Control``.
+        Overrides also allow storing ``no-store`` responses. ``default_ttl``
+        applies to responses without ``max-age``.
+        """
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, headers: Mapping[str, str]) -> str:
+        """Get the cache key of a GET request: final URL and representation headers."""
+        vary = "|".join(f"{name}={headers.get(name, '')}" for name in VARY_HEADERS)
+        return hashlib.sha1(f"GET {url}|{vary}".encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry from memory, falling back to disk."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._load(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def store(self, key: str, response: requests.Response) -> Optional[CacheEntry]:
+        """Store a successful response unless it forbids caching."""
+        cache_control = response.headers.get("Cache-Control", "")
+        if response.status_code != 200:
+            return None
+        if "no-store" in cache_control.lower() and self._override(response.url) is None:
+            return None
+        entry = CacheEntry(
+            url=response.url,
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response.content,
+            expires_at=time.time() + self._ttl(response.url, cache_control),
+        )
+        self._remember(key, entry)
+        self._save(key, entry)
+        self.count("stores")
+        return entry
+
+    def refresh(
+        self, key: str, entry: CacheEntry, not_modified: requests.Response
+    ) -> CacheEntry:
+        """Extend an entry after a ``304 Not Modified`` revalidation."""
+        entry.headers.update(
+            {
+                name: value
+                for name, value in not_modified.headers.items()
+                if name.lower() in _REVALIDATION_HEADERS
+            }
+        )
+        entry.expires_at = time.time() + self._ttl(
+            entry.url, entry.headers.get("Cache-Control", "")
+        )
+        self._remember(key, entry)
+        self._save(key, entry)
+        return entry
+
+    def invalidate(self, url: str) -> int:
+        """Drop entries of the collection a URL belongs to.
+
+        ``/posts/1`` drops ``/posts*``, for example.
+
+        Entries on disk are dropped too, including ones evicted from memory or
+        written by another session or worker sharing the directory.
+        """
+        parts = urlsplit(url)
+        collection = "/" + parts.path.strip("/").split("/")[0]
+        prefix = f"{parts.scheme}://{parts.netloc}{collection}"
+
+        def in_collection(entry_url: str) -> bool:
+            return entry_url == prefix or entry_url.startswith(
+                (prefix + "/", prefix + "?")
+            )
+
+        with self._lock:
+            keys = {
+                key for key, entry in self._entries.items() if in_collection(entry.url)
+            }
+            for key in keys:
+                del self._entries[key]
+        keys.update(self._stored_keys(in_collection))
+        for key in keys:
+            self._delete(key)
+        self.count("invalidations", len(keys))
+        return len(keys)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Increment one of the ``stats`` counters."""
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + amount)
+
+    def clear(self) -> None:
+        """Drop all entries, including those on disk."""
+        with self._lock:
+            self._entries.clear()
+        if self.directory:
+            for path in self.directory.glob("*.cache"):
+                path.unlink()
+
+    def __len__(self) -> int:
+        """Get the number of entries in memory."""
+        return len(self._entries)
+
+    def _ttl(self, url: str, cache_control: str) -> float:
+        """Get the freshness lifetime of a response."""
+        override = self._override(url)
+        if override is not None:
+            return override
+        if "no-cache" in cache_control.lower():
+            return 0.0
+        match = _MAX_AGE.search(cache_control)
+        return float(match.group(1)) if match else self.default_ttl
+
+    def _override(self, url: str) -> Optional[float]:
+        """Get the TTL override of the first pattern matching a URL's path, if any."""
+        path = urlsplit(url).path
+        for pattern, ttl in self.ttl_overrides.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Put an entry into the LRU, evicting the least recently used."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        """Get the disk location of an entry."""
+        return self.directory / f"{key}.cache"
+
+    def _save(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry to disk: a JSON header line followed by the raw body."""
+        if not self.directory:
+            return
+        meta = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": dict(entry.headers),
+            "expires_at": entry.expires_at,
+        }
+        # Unique per process and write, so workers sharing the directory never collide
+        temporary = self._path(key).with_suffix(f".{os.getpid()}.{uuid4().hex}.tmp")
+        temporary.write_bytes(json.dumps(meta).encode() + b"\n" + entry.content)
+        temporary.replace(self._path(key))
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        """Read an entry from disk, if stored."""
+        if not self.directory:
+            return None
+        try:
+            meta, _, content = self._path(key).read_bytes().partition(b"\n")
+            return CacheEntry(content=content, **json.loads(meta))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _stored_keys(self, matches: Callable[[str], bool]) -> Iterator[str]:
+        """Get keys of entries on disk whose URL matches, reading only header lines."""
+        if not self.directory:
+            return
+        for path in self.directory.glob("*.cache"):
+            try:
+                with path.open("rb") as stored:
+                    url = json.loads(stored.readline())["url"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if matches(url):
+                yield path.stem
+
+    def _delete(self, key: str) -> None:
+        """Remove an entry from disk."""
+        if self.directory:
+            self._path(key).unlink(missing_ok=True)
+
+
+def lookup_key(
+    session: requests.Session,
+    url: str,
+    params: Optional[Mapping],
+    headers: Optional[Mapping] = None,
+) -> Tuple[str, str]:
+    """Get the final URL and cache key of a GET request made through a session."""
+    prepared = session.prepare_request(
+        requests.Request("GET", url, params=params, headers=headers)
+    )
+    return prepared.url, HTTPCache.key(prepared.url, prepared.headers)
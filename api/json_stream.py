@@ -0,0 +1,87 @@
+"""
+Streaming JSON parsing for large list endpoints.
+
+``iter_json_array`` turns the byte chunks of a response (``iter_content``) into
+the elements of its top-level JSON array one at a time, so callers can count,
+sample or assert on a collection without holding the whole list in memory.
+Elements are decoded with the C-accelerated ``JSONDecoder.raw_decode`` as soon
+as they are complete in the buffer; only the current, partial element is kept.
+
+``loads`` parses a whole body with orjson when it is installed, falling back
+to the standard library.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional, faster backend
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+def loads(data, **kwargs) -> Any:
+    """Parse a JSON document (bytes or str) with the fastest available backend."""
+    if orjson is not None and not kwargs:
+        return orjson.loads(data)
+    return json.loads(data, **kwargs)
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array from a stream of byte chunks."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    position = 0
+    started = finished = False
+    for chunk in chunks:
+        buffer = buffer[position:] + decoder.decode(chunk)
+        position = 0
+        while True:
+            position = _skip(buffer, position, ",")
+            if position >= len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError(
+                        f"Expected a JSON array, got {buffer[position:position + 20]!r}"
+                    )
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                finished = True
+                position += 1
+                break
+            try:
+                element, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # element continues in the next chunk
+            # A number at the end of the buffer may continue in the next chunk too
+            if end >= len(buffer):
+                break
+            position = end
+            yield element
+        if finished:
+            break
+
+    tail = buffer[position:] + decoder.decode(b"", final=True)
+    if not finished:
+        raise ValueError(f"Truncated JSON array, unparsed data: {tail[:40]!r}")
+    if tail.strip(_WHITESPACE):
+        raise ValueError(
+            f"Unexpected data after JSON array: {tail.strip(_WHITESPACE)[:40]!r}"
+        )
+
+
+def _skip(buffer: str, position: int, separators: str = "") -> int:
+    """Skip whitespace (and separators) starting at a position."""
+    skipped = _WHITESPACE + separators
+    while position < len(buffer) and buffer[position] in skipped:
+        position += 1
+    return position
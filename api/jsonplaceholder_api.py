@@ -1,9 +1,73 @@
 """
 JSONPlaceholder API client for testing.
+
+Collections can be read page by page with the json-server ``_page``/``_limit``
+parameters: ``iter_collection`` reads the total from the ``X-Total-Count``
+header of the first page and fetches the remaining pages concurrently on a
+bounded thread pool, yielding records in order. ``get_many`` fetches records
+by id in batches (``?id=1&id=2...``), also concurrently.
 """
 
-from typing import List, Dict, Any
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from .base_api import BaseAPI
+from .schema import array_of, register_schema
+
+ID = {"type": "integer", "minimum": 1}
+TEXT = {"type": "string"}
+
+SCHEMAS = {
+    "post": {
+        "type": "object",
+        "required": ["id", "userId", "title", "body"],
+        "properties": {"id": ID, "userId": ID, "title": TEXT, "body": TEXT},
+    },
+    "user": {
+        "type": "object",
+        "required": ["id", "name", "username", "email", "address", "company"],
+        "properties": {
+            "id": ID,
+            "name": TEXT,
+            "username": TEXT,
+            "email": {"type": "string", "format": "email"},
+            "address": {
+                "type": "object",
+                "required": ["street", "city", "zipcode"],
+                "properties": {"street": TEXT, "suite": TEXT, "city": TEXT, "zipcode": TEXT},
+            },
+            "phone": TEXT,
+            "website": TEXT,
+            "company": {"type": "object", "required": ["name"], "properties": {"name": TEXT}},
+        },
+    },
+    "comment": {
+        "type": "object",
+        "required": ["id", "postId", "name", "email", "body"],
+        "properties": {"id": ID, "postId": ID, "name": TEXT, "email": {"type": "string", "format": "email"}, "body": TEXT},
+    },
+    "album": {
+        "type": "object",
+        "required": ["id", "userId", "title"],
+        "properties": {"id": ID, "userId": ID, "title": TEXT},
+    },
+    "photo": {
+        "type": "object",
+        "required": ["id", "albumId", "title", "url", "thumbnailUrl"],
+        "properties": {
+            "id": ID,
+            "albumId": ID,
+            "title": TEXT,
+            "url": {"type": "string", "format": "uri"},
+            "thumbnailUrl": {"type": "string", "format": "uri"},
+        },
+    },
+}
+
+# Each resource as a single item ("post") and as a collection ("posts")
+for _name, _schema in SCHEMAS.items():
+    register_schema(_name, _schema)
+    register_schema(f"{_name}s", array_of(_schema))
 
 
 class JSONPlaceholderAPI(BaseAPI):
@@ -79,6 +143,11 @@ class JSONPlaceholderAPI(BaseAPI):
         self.assert_status_code(response, 200)
         return response.json()
         
+    def iter_comments(self, post_id: int = None) -> Iterator[Dict[str, Any]]:
+        """Stream all comments or comments for a specific post, one at a time."""
+        params = {"postId": post_id} if post_id else None
+        return self.iter_json("/comments", params=params)
+        
     def get_albums(self, user_id: int = None) -> List[Dict[str, Any]]:
         """Get all albums or albums by user ID."""
         params = {"userId": user_id} if user_id else None
@@ -91,4 +160,71 @@ class JSONPlaceholderAPI(BaseAPI):
         params = {"albumId": album_id} if album_id else None
         response = self.get("/photos", params=params)
         self.assert_status_code(response, 200)
-        return response.json() 
\ No newline at end of file
+        return response.json()
+        
+    def iter_photos(self, album_id: int = None) -> Iterator[Dict[str, Any]]:
+        """Stream all photos or photos from a specific album, one at a time."""
+        params = {"albumId": album_id} if album_id else None
+        return self.iter_json("/photos", params=params)
+        
+    # ========== PAGINATION AND BULK FETCH ==========
+    
+    def get_page(
+        self, resource: str, page: int, page_size: int, params: Optional[Dict] = None
+    ) -> List[Dict[str, Any]]:
+        """Get one page (1-based) of a collection."""
+        return self._get_page(resource, page, page_size, params).json()
+        
+    def iter_collection(
+        self, resource: str = "/posts", page_size: int = 20, params: Optional[Dict] = None, max_workers: int = 4
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield all records of a collection in order, fetching pages concurrently."""
+        first = self._get_page(resource, 1, page_size, params)
+        yield from first.json()
+        total = first.headers.get("X-Total-Count")
+        if total is None:
+            # No total: read sequentially until a short page
+            page, records = 1, first.json()
+            while len(records) == page_size:
+                page += 1
+                records = self.get_page(resource, page, page_size, params)
+                yield from records
+            return
+        
+        pages = range(2, math.ceil(int(total) / page_size) + 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for records in executor.map(lambda page: self.get_page(resource, page, page_size, params), pages):
+                yield from records
+                
+    def get_many(
+        self, resource: str, ids: Iterable[int], batch_size: int = 50, max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Get records by id in the order given, with a few concurrent batched requests."""
+        ids = list(ids)
+        unique = list(dict.fromkeys(ids))
+        batches = [unique[start:start + batch_size] for start in range(0, len(unique), batch_size)]
+        
+        def fetch(batch: List[int]) -> List[Dict[str, Any]]:
+            response = self.get(resource, params={"id": batch})
+            self.assert_status_code(response, 200)
+            return response.json()
+            
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            by_id = {record["id"]: record for records in executor.map(fetch, batches) for record in records}
+        missing = [record_id for record_id in unique if record_id not in by_id]
+        assert not missing, f"Records not found in {resource}: {missing}"
+        return [by_id[record_id] for record_id in ids]
+        
+    def get_posts_many(self, post_ids: Iterable[int], max_workers: int = 4) -> List[Dict[str, Any]]:
+        """Get several posts by ID."""
+        return self.get_many("/posts", post_ids, max_workers=max_workers)
+        
+    def get_users_many(self, user_ids: Iterable[int], max_workers: int = 4) -> List[Dict[str, Any]]:
+        """Get several users by ID."""
+        return self.get_many("/users", user_ids, max_workers=max_workers)
+        
+    def _get_page(self, resource: str, page: int, page_size: int, params: Optional[Dict] = None):
+        """Request one page of a collection."""
+        response = self.get(resource, params={**(params or {}), "_page": page, "_limit": page_size})
+        self.assert_status_code(response, 200)
+        return response
\ No newline at end of file
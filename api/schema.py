@@ -0,0 +1,271 @@
+"""
+Response schema validation for API tests.
+
+Schemas are a subset of JSON Schema (type, properties, required,
+additionalProperties, items, enum, minimum, maximum, minLength, maxLength,
+minItems, pattern, format). Each schema is compiled once into a tree of
+closures with type sets, compiled regexes and required-field tuples resolved
+up front, so validating a whole collection (e.g. 5,000 ``/photos``) is a tight
+loop of function calls rather than a walk over the schema per element.
+
+Schemas are registered by name and compiled on first use:
+
+    register_schema("post", {"type": "object", "required": ["id"], ...})
+    get_validator("post").validate(response.json())
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+# Validation function: (instance, path, errors) -> None, appending error messages
+Check = Callable[[Any, Tuple, List[str]], None]
+
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+_FORMATS = {
+    "email": re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+    "uri": re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://\S+$"),
+}
+
+_KEYWORDS = {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "items",
+    "enum",
+    "minimum",
+    "maximum",
+    "minLength",
+    "maxLength",
+    "minItems",
+    "pattern",
+    "format",
+    "title",
+    "description",
+}
+
+# Registered schemas and their compiled validators
+_schemas: Dict[str, Mapping] = {}
+_validators: Dict[str, "Validator"] = {}
+
+
+class SchemaValidationError(AssertionError):
+    """Instance does not match its schema."""
+
+    def __init__(self, name: str, errors: Sequence[str], limit: int = 10):
+        """Initialize error with the first ``limit`` messages."""
+        self.errors = list(errors)
+        shown = "\n  ".join(self.errors[:limit])
+        more = (
+            f"\n  ... and {len(self.errors) - limit} more"
+            if len(self.errors) > limit
+            else ""
+        )
+        super().__init__(
+            f"Response does not match schema '{name}' "
+            f"({len(self.errors)} errors):\n  {shown}{more}"
+        )
+
+
+class Validator:
+    """Compiled schema."""
+
+    def __init__(self, schema: Mapping, name: str = "<schema>"):
+        """Compile a schema."""
+        self.name = name
+        self.schema = schema
+        self._check = _compile(schema, ())
+
+    def errors(self, instance: Any) -> List[str]:
+        """Get all validation errors of an instance."""
+        errors: List[str] = []
+        self._check(instance, (), errors)
+        return errors
+
+    def is_valid(self, instance: Any) -> bool:
+        """Check if an instance matches the schema."""
+        return not self.errors(instance)
+
+    def validate(self, instance: Any) -> None:
+        """Raise ``SchemaValidationError`` if an instance does not match the schema."""
+        errors = self.errors(instance)
+        if errors:
+            raise SchemaValidationError(self.name, errors)
+
+
+def register_schema(name: str, schema: Mapping) -> None:
+    """Register a schema under a name, replacing any compiled validator."""
+    _schemas[name] = schema
+    _validators.pop(name, None)
+
+
+def get_validator(name: str) -> Validator:
+    """Get the compiled validator of a registered schema (compiled once and shared)."""
+    if name not in _validators:
+        if name not in _schemas:
+            raise ValueError(f"Unknown schema '{name}', registered: {sorted(_schemas)}")
+        _validators[name] = Validator(_schemas[name], name)
+    return _validators[name]
+
+
+def array_of(schema: Mapping, min_items: int = 0) -> Dict[str, Any]:
+    """Get the schema of a list of ``schema`` items."""
+    return {"type": "array", "items": schema, "minItems": min_items}
+
+
+def _format_path(path: Tuple) -> str:
+    """Format a path like ``$[3].address.city``."""
+    return "$" + "".join(
+        f"[{part}]" if isinstance(part, int) else f".{part}" for part in path
+    )
+
+
+def _compile(schema: Mapping, location: Tuple) -> Check:
+    """Compile a schema node into one check function."""
+    unknown = set(schema) - _KEYWORDS
+    if unknown:
+        raise ValueError(
+            f"Unsupported schema keywords at {_format_path(location)}: "
+            f"{sorted(unknown)}"
+        )
+    checks: List[Check] = []
+
+    if "type" in schema:
+        names = (
+            [schema["type"]]
+            if isinstance(schema["type"], str)
+            else list(schema["type"])
+        )
+        types = tuple(t for name in names for t in _TYPES[name])
+        # bool is an int subclass; it is an integer/number only if asked for explicitly
+        reject_bool = "boolean" not in names
+
+        def check_type(value, path, errors):
+            if not isinstance(value, types) or (
+                reject_bool and isinstance(value, bool)
+            ):
+                errors.append(
+                    f"{_format_path(path)}: expected {'/'.join(names)}, "
+                    f"got {type(value).__name__}"
+                )
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append(
+                    f"{_format_path(path)}: {value!r} is not one of {allowed}"
+                )
+
+        checks.append(check_enum)
+
+    for keyword, measure, kinds, below in (
+        ("minimum", None, (int, float), True),
+        ("maximum", None, (int, float), False),
+        ("minLength", len, str, True),
+        ("maxLength", len, str, False),
+        ("minItems", len, list, True),
+    ):
+        if keyword in schema:
+            checks.append(_bound(keyword, schema[keyword], measure, kinds, below))
+
+    for keyword in ("pattern", "format"):
+        if keyword in schema:
+            regex = (
+                re.compile(schema["pattern"])
+                if keyword == "pattern"
+                else _FORMATS[schema["format"]]
+            )
+            checks.append(_matches(regex, keyword))
+
+    if {"properties", "required", "additionalProperties"} & set(schema):
+        checks.append(_compile_object(schema, location))
+
+    if "items" in schema:
+        check_item = _compile(schema["items"], location + ("items",))
+
+        def check_items(value, path, errors):
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    check_item(item, path + (index,), errors)
+
+        checks.append(check_items)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value, path, errors):
+        for check in checks:
+            check(value, path, errors)
+
+    return check_all
+
+
+def _compile_object(schema: Mapping, location: Tuple) -> Check:
+    """Compile the object keywords of a schema node."""
+    required = tuple(schema.get("required", ()))
+    properties = tuple(
+        (name, _compile(subschema, location + (name,)))
+        for name, subschema in schema.get("properties", {}).items()
+    )
+    known = frozenset(schema.get("properties", {}))
+    closed = schema.get("additionalProperties", True) is False
+
+    def check_object(value, path, errors):
+        if not isinstance(value, dict):
+            return
+        for name in required:
+            if name not in value:
+                errors.append(f"{_format_path(path)}: missing required field '{name}'")
+        for name, check in properties:
+            if name in value:
+                check(value[name], path + (name,), errors)
+        if closed:
+            extra = value.keys() - known
+            if extra:
+                errors.append(
+                    f"{_format_path(path)}: unexpected fields {sorted(extra)}"
+                )
+
+    return check_object
+
+
+def _bound(keyword: str, limit, measure, types, below: bool) -> Check:
+    """Compile a numeric bound, or a length bound if ``measure`` is given."""
+
+    def check_bound(value, path, errors):
+        if not isinstance(value, types) or isinstance(value, bool):
+            return
+        measured = measure(value) if measure else value
+        if (measured < limit) if below else (measured > limit):
+            label = "length " if measure else ""
+            errors.append(
+                f"{_format_path(path)}: {label}{measured!r} violates {keyword} {limit}"
+            )
+
+    return check_bound
+
+
+def _matches(regex, keyword: str) -> Check:
+    """Compile a pattern or format check for strings."""
+
+    def check_match(value, path, errors):
+        if isinstance(value, str) and not regex.search(value):
+            errors.append(
+                f"{_format_path(path)}: {value!r} does not match "
+                f"{keyword} {regex.pattern!r}"
+            )
+
+    return check_match
@@ -0,0 +1,102 @@
+"""
+Request coalescing ("single flight") for identical in-flight calls.
+
+When several threads (or asyncio tasks) make the same call while one is
+already running, they wait for that call and share its result instead of
+issuing their own. Only calls that overlap in time are coalesced; nothing is
+cached once the call completes.
+
+``BaseAPI`` routes GET requests through a shared ``SingleFlight`` keyed by
+method, final URL (including query parameters) and the ``Accept`` and
+``Authorization`` headers.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """Call in flight and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+@dataclass
+class FlightStats:
+    """Counters of executed and coalesced calls."""
+
+    executed: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution."""
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self.stats = FlightStats()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[int, Hashable], "asyncio.Task"] = {}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run ``function`` unless an identical call is in flight.
+
+        Returns ``(result, shared)``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.executed += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    async def ado(
+        self, key: Hashable, function: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Await ``function()`` unless an identical call is in flight on this loop.
+
+        Returns ``(result, shared)``.
+        """
+        loop_key = (id(asyncio.get_running_loop()), key)
+        task = self._tasks.get(loop_key)
+        shared = task is not None
+        if shared:
+            self.stats.coalesced += 1
+        else:
+            task = self._tasks[loop_key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda _: self._tasks.pop(loop_key, None))
+            self.stats.executed += 1
+        # A cancelled caller must not cancel the call other callers are waiting for
+        return await asyncio.shield(task), shared
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of calls currently running."""
+        return len(self._calls) + len(self._tasks)
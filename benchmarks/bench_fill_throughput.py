@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Fill throughput benchmark: page.fill() vs chunked insertion by payload size.
+
+Fills a local input (no network) with generated buffer payloads from 1KB to
+10MB and prints throughput for both strategies, which is what
+``CHUNKED_FILL_THRESHOLD`` in ``pages.base_page`` is tuned from.
+
+Usage:
+    python benchmarks/bench_fill_throughput.py [--browser chromium] [--runs 3]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pages.base_page import BasePage  # noqa: E402
+from utils.security_payloads import (  # noqa: E402
+    generate_buffer_payload,
+    iter_buffer_chunks,
+)
+
+SIZES = ["1KB", "16KB", "64KB", "256KB", "1MB", "4MB", "10MB"]
+CHUNK_SIZES = [16 * 1024, 64 * 1024, 256 * 1024]
+HTML = "<input id='target'>"
+
+
+class FormPage(BasePage):
+    """Blank page with a single input."""
+
+    __slots__ = ()
+
+
+def timed(action) -> float:
+    """Run an action and return elapsed seconds."""
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run fill strategies for every size and print a throughput table."""
+    from playwright.sync_api import sync_playwright
+
+    parser = argparse.ArgumentParser(description="Input fill throughput benchmark")
+    parser.add_argument(
+        "--browser", default="chromium", choices=["chromium", "firefox", "webkit"]
+    )
+    parser.add_argument(
+        "--runs", type=int, default=3, help="Runs per size and strategy"
+    )
+    args = parser.parse_args()
+
+    strategies = {
+        "fill": None,
+        **{f"chunked {size // 1024}KB": size for size in CHUNK_SIZES},
+    }
+    print(
+        f"{'size':>6} "
+        + " ".join(f"{name:>14}" for name in strategies)
+        + "   (MB/s, median)"
+    )
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch()
+        page = browser.new_page()
+        form = FormPage(page)
+        for size in SIZES:
+            payload = generate_buffer_payload(size, "printable")
+            megabytes = len(payload) / (1024 * 1024)
+            row = []
+            for chunk_size in strategies.values():
+                samples = []
+                for _ in range(args.runs):
+                    page.set_content(HTML)
+                    if chunk_size is None:
+                        samples.append(timed(lambda: page.fill("#target", payload)))
+                    else:
+                        chunks = iter_buffer_chunks(size, "printable", chunk_size)
+                        samples.append(
+                            timed(
+                                lambda: form.fill_large("#target", chunks, chunk_size)
+                            )
+                        )
+                    assert page.input_value("#target") == payload
+                row.append(megabytes / statistics.median(samples))
+            print(f"{size:>6} " + " ".join(f"{value:14.1f}" for value in row))
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
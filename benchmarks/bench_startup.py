@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: time from launching pytest to the first test starting.
+
+Runs each scenario several times in a fresh interpreter and prints the median,
+covering interpreter start, plugin loading, conftest imports and collection.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 7]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from run_tests import plugin_args  # noqa: E402
+
+API_PLUGINS = plugin_args(argparse.Namespace(api=True, html_report=False))
+UI_PLUGINS = plugin_args(argparse.Namespace(api=False, html_report=False))
+
+SCENARIOS = {
+    "api (run_tests.py --api)": ["tests/api", "-m", "api", *API_PLUGINS],
+    "api (plain pytest)": ["tests/api", "-m", "api"],
+    "ui (run_tests.py --ui)": ["tests/ui", "-m", "ui", *UI_PLUGINS],
+    "ui (plain pytest)": ["tests/ui", "-m", "ui"],
+}
+
+
+def time_to_first_test(args: list) -> float:
+    """Run pytest once and return seconds until the first test started."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "elapsed")
+        env = dict(os.environ, BENCH_OUTPUT=output)
+        command = [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "--setup-only",
+            "-p",
+            "benchmarks.first_test_probe",
+            *args,
+        ]
+        env["BENCH_T0"] = repr(time.time())
+        subprocess.run(
+            command,
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        with open(output) as handle:
+            return float(handle.read())
+
+
+def main() -> None:
+    """Run all scenarios and print a summary table."""
+    parser = argparse.ArgumentParser(description="Pytest startup benchmark")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<32} {'median':>9} {'min':>9}")
+    for name, pytest_args in SCENARIOS.items():
+        timings = [time_to_first_test(pytest_args) for _ in range(args.runs)]
+        print(
+            f"{name:<32} {statistics.median(timings) * 1000:>7.0f}ms "
+            f"{min(timings) * 1000:>7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+Pytest plugin that records time-to-first-test and stops the session.
+
+Loaded by ``benchmarks/bench_startup.py`` with ``-p benchmarks.first_test_probe``.
+The launcher exports ``BENCH_T0`` (wall-clock start) and ``BENCH_OUTPUT``.
+"""
+
+import os
+import time
+
+import pytest
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Record elapsed time when the first test starts and exit immediately."""
+    elapsed = time.time() - float(os.environ["BENCH_T0"])
+    with open(os.environ["BENCH_OUTPUT"], "w") as output:
+        output.write(f"{elapsed:.6f}")
+    pytest.exit("first test reached", returncode=0)
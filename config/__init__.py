@@ -1,5 +1,5 @@
 """Configuration package for automation framework."""
 
-from .settings import Settings
+from .settings import Settings, SettingsError, get_settings, switch_profile
 
-__all__ = ["Settings"] 
\ No newline at end of file
+__all__ = ["Settings", "SettingsError", "get_settings", "switch_profile"] 
\ No newline at end of file
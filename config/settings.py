@@ -1,50 +1,266 @@
 """
 Configuration settings for the automation framework.
+
+Settings are layered: built-in defaults, then the selected profile
+(``local``, ``ci`` or ``load``), then explicit environment variables. They are
+parsed once per process with ``get_settings()`` and are immutable afterwards.
 """
 
+import dataclasses
+import json
 import os
-from typing import Optional
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+BROWSERS = ("chromium", "firefox", "webkit")
+ARTIFACT_POLICIES = ("always", "on-failure", "never")
+# "off" talks to the live API; the others record/replay through api.cassette
+CASSETTE_MODES = ("off", "record", "replay", "auto")
+CASSETTE_MATCHING = ("strict", "lenient")
+LOG_LEVELS = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+
+# Performance knobs per profile; environment variables still override them.
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "local": {
+        "slow_mo": 100,
+        "workers": 1,
+        "artifact_policy": "on-failure",
+    },
+    "ci": {
+        "headless": True,
+        "slow_mo": 0,
+        "workers": 0,
+        "default_timeout": 15000,
+        "navigation_timeout": 30000,
+        "artifact_policy": "on-failure",
+    },
+    "load": {
+        "headless": True,
+        "slow_mo": 0,
+        "workers": 0,
+        "default_timeout": 10000,
+        "navigation_timeout": 15000,
+        "api_timeout": 5,
+        "adaptive_timeouts": True,
+        "artifact_policy": "never",
+        "take_screenshots": False,
+        "record_videos": False,
+    },
+}
+
+
+class SettingsError(ValueError):
+    """Raised when settings fail validation."""
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_browsers(value: str) -> Tuple[str, ...]:
+    return tuple(name.strip() for name in value.split(",") if name.strip())
+
+
+# Settings field -> (environment variable, parser)
+_ENV_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "base_url": ("BASE_URL", str),
+    "api_base_url": ("API_BASE_URL", str),
+    "browser": ("BROWSER", str),
+    "browsers": ("BROWSERS", _parse_browsers),
+    "headless": ("HEADLESS", _parse_bool),
+    "slow_mo": ("SLOW_MO", int),
+    "browser_server": ("BROWSER_SERVER", _parse_bool),
+    "browser_server_port": ("BROWSER_SERVER_PORT", int),
+    "environment": ("ENVIRONMENT", str),
+    "ci": ("CI", _parse_bool),
+    "workers": ("WORKERS", int),
+    "api_workers": ("API_WORKERS", int),
+    "ui_workers": ("UI_WORKERS", int),
+    "default_timeout": ("DEFAULT_TIMEOUT", int),
+    "navigation_timeout": ("NAVIGATION_TIMEOUT", int),
+    "adaptive_timeouts": ("ADAPTIVE_TIMEOUTS", _parse_bool),
+    "artifact_policy": ("ARTIFACT_POLICY", str),
+    "take_screenshots": ("TAKE_SCREENSHOTS", _parse_bool),
+    "record_videos": ("RECORD_VIDEOS", _parse_bool),
+    "username": ("TEST_USERNAME", str),
+    "password": ("TEST_PASSWORD", str),
+    "api_timeout": ("API_TIMEOUT", int),
+    "api_cassette_mode": ("API_CASSETTE_MODE", str.lower),
+    "api_cassette_dir": ("API_CASSETTE_DIR", str),
+    "api_cassette_match": ("API_CASSETTE_MATCH", str.lower),
+    "api_cassette_latency_ms": ("API_CASSETTE_LATENCY_MS", int),
+    "payload_corpus": ("PAYLOAD_CORPUS", str),
+    "payload_sample_size": ("PAYLOAD_SAMPLE_SIZE", int),
+    "payload_seed": ("PAYLOAD_SEED", int),
+    "log_level": ("LOG_LEVEL", str.upper),
+}
+
 
-# Load environment variables
-load_dotenv()
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load environment variables from .env once, on first use."""
+    from dotenv import load_dotenv
 
+    load_dotenv()
 
+
+@dataclass(frozen=True)
 class Settings:
     """Application settings and configuration."""
-    
-    def __init__(self):
-        """Initialize settings from environment variables."""
-        # Base URLs
-        self.base_url: str = os.getenv("BASE_URL", "https://playwright.dev")
-        self.api_base_url: str = os.getenv("API_BASE_URL", "https://jsonplaceholder.typicode.com")
-        
-        # Browser settings
-        self.browser: str = os.getenv("BROWSER", "chromium")
-        self.headless: bool = os.getenv("HEADLESS", "true").lower() == "true"
-        self.slow_mo: int = int(os.getenv("SLOW_MO", "100"))
-        
-        # Test environment
-        self.environment: str = os.getenv("ENVIRONMENT", "test")
-        
-        # Timeouts (in milliseconds)
-        self.default_timeout: int = int(os.getenv("DEFAULT_TIMEOUT", "30000"))
-        self.navigation_timeout: int = int(os.getenv("NAVIGATION_TIMEOUT", "30000"))
-        
-        # Screenshot and video settings
-        self.take_screenshots: bool = os.getenv("TAKE_SCREENSHOTS", "true").lower() == "true"
-        self.record_videos: bool = os.getenv("RECORD_VIDEOS", "false").lower() == "true"
-        
-        # Authentication (example)
-        self.username: Optional[str] = os.getenv("TEST_USERNAME")
-        self.password: Optional[str] = os.getenv("TEST_PASSWORD")
-        
-        # API settings
-        self.api_timeout: int = int(os.getenv("API_TIMEOUT", "10"))
-        
-        # Logging
-        self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
-        
+
+    profile: str = "local"
+
+    # Base URLs
+    base_url: str = "https://playwright.dev"
+    api_base_url: str = "https://jsonplaceholder.typicode.com"
+
+    # Browser settings
+    browser: str = "chromium"
+    # Engines to fan UI tests out to in a single session (defaults to browser)
+    browsers: Tuple[str, ...] = ()
+    headless: bool = True
+    slow_mo: int = 100
+
+    # Persistent browser server (reused across pytest invocations)
+    browser_server: bool = False
+    browser_server_port: int = 9400
+
+    # Test environment
+    environment: str = "test"
+    ci: bool = False
+    # Parallel workers, 0 lets xdist pick ("auto")
+    workers: int = 1
+    # Orchestrator pools (utils.orchestrator), 0 sizes them from the CPU count
+    api_workers: int = 0
+    ui_workers: int = 0
+
+    # Timeouts (in milliseconds)
+    default_timeout: int = 30000
+    navigation_timeout: int = 30000
+    # Derive UI timeouts from recorded latency history (utils.adaptive_timeouts)
+    adaptive_timeouts: bool = False
+
+    # Screenshot and video settings
+    artifact_policy: str = "on-failure"
+    take_screenshots: bool = True
+    record_videos: bool = False
+
+    # Authentication (example)
+    username: Optional[str] = None
+    password: Optional[str] = field(default=None, repr=False)
+
+    # API settings
+    api_timeout: int = 10
+    # Recorded API traffic (api.cassette), one cassette per client under the directory
+    api_cassette_mode: str = "off"
+    api_cassette_dir: str = "tests/api/cassettes"
+    api_cassette_match: str = "strict"
+    api_cassette_latency_ms: int = 0
+
+    # Security payload corpus (utils.payload_corpus); None keeps it in memory
+    payload_corpus: Optional[str] = None
+    payload_sample_size: int = 8
+    payload_seed: int = 0
+
+    # Logging
+    log_level: str = "INFO"
+
+    # Raw environment overrides, kept so profiles can be switched without re-parsing
+    overrides: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Fill derived fields and validate."""
+        if not self.browsers:
+            object.__setattr__(self, "browsers", (self.browser,))
+        self.validate()
+
+    @classmethod
+    def from_env(cls, profile: Optional[str] = None, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Parse settings from environment variables and the selected profile."""
+        if environ is None:
+            load_env()
+            environ = os.environ
+        overrides: Dict[str, Any] = {}
+        for name, (variable, parse) in _ENV_FIELDS.items():
+            raw = environ.get(variable)
+            if raw is None or raw == "":
+                continue
+            try:
+                overrides[name] = parse(raw)
+            except ValueError as e:
+                raise SettingsError(f"Invalid value for {variable}: {raw!r} ({e})") from None
+        if profile is None:
+            profile = environ.get("TEST_PROFILE") or ("ci" if overrides.get("ci") else "local")
+        return cls.build(profile, overrides)
+
+    @classmethod
+    def build(cls, profile: str, overrides: Optional[Mapping[str, Any]] = None) -> "Settings":
+        """Layer defaults, profile knobs and overrides into a Settings instance."""
+        if profile not in PROFILES:
+            raise SettingsError(f"Unknown profile '{profile}', expected one of {tuple(PROFILES)}")
+        overrides = dict(overrides or {})
+        values = {**PROFILES[profile], **overrides}
+        return cls(profile=profile, overrides=overrides, **values)
+
+    def with_profile(self, profile: str) -> "Settings":
+        """Get settings for another profile, keeping the same environment overrides."""
+        return self.build(profile, self.overrides)
+
+    def validate(self) -> None:
+        """Validate field values, raising SettingsError on the first problem."""
+        for name in ("base_url", "api_base_url"):
+            url = getattr(self, name)
+            if not url.startswith(("http://", "https://")):
+                raise SettingsError(f"{name} must be an http(s) URL, got {url!r}")
+        for name in (self.browser, *self.browsers):
+            if name not in BROWSERS:
+                raise SettingsError(f"Unsupported browser '{name}', expected one of {BROWSERS}")
+        for name in ("default_timeout", "navigation_timeout", "api_timeout"):
+            if getattr(self, name) <= 0:
+                raise SettingsError(f"{name} must be positive, got {getattr(self, name)}")
+        if self.slow_mo < 0:
+            raise SettingsError(f"slow_mo must not be negative, got {self.slow_mo}")
+        if self.payload_sample_size <= 0:
+            raise SettingsError(f"payload_sample_size must be positive, got {self.payload_sample_size}")
+        for name in ("workers", "api_workers", "ui_workers"):
+            if getattr(self, name) < 0:
+                raise SettingsError(f"{name} must not be negative, got {getattr(self, name)}")
+        if not 0 < self.browser_server_port < 65536:
+            raise SettingsError(f"browser_server_port out of range: {self.browser_server_port}")
+        if self.artifact_policy not in ARTIFACT_POLICIES:
+            raise SettingsError(
+                f"Unknown artifact_policy '{self.artifact_policy}', expected one of {ARTIFACT_POLICIES}"
+            )
+        if self.api_cassette_mode not in CASSETTE_MODES:
+            raise SettingsError(
+                f"Unknown api_cassette_mode '{self.api_cassette_mode}', expected one of {CASSETTE_MODES}"
+            )
+        if self.api_cassette_match not in CASSETTE_MATCHING:
+            raise SettingsError(
+                f"Unknown api_cassette_match '{self.api_cassette_match}', expected one of {CASSETTE_MATCHING}"
+            )
+        if self.api_cassette_latency_ms < 0:
+            raise SettingsError(f"api_cassette_latency_ms must not be negative, got {self.api_cassette_latency_ms}")
+        if self.log_level not in LOG_LEVELS:
+            raise SettingsError(f"Unknown log_level '{self.log_level}', expected one of {LOG_LEVELS}")
+
+    def to_json(self) -> str:
+        """Serialize settings, e.g. to hand them to xdist workers."""
+        data = dataclasses.asdict(self)
+        data["overrides"] = dict(self.overrides)
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, payload: str) -> "Settings":
+        """Restore settings serialized with to_json without re-reading the environment."""
+        data = json.loads(payload)
+        data["browsers"] = tuple(data["browsers"])
+        overrides = data.get("overrides", {})
+        if "browsers" in overrides:
+            overrides["browsers"] = tuple(overrides["browsers"])
+        return cls(**data)
+
     def get_browser_args(self) -> dict:
         """Get browser launch arguments."""
         return {
@@ -56,17 +272,64 @@ class Settings:
                 "--disable-gpu",
                 "--no-sandbox",
                 "--disable-setuid-sandbox",
-            ] if os.getenv("CI") else []
+            ] if self.ci else []
         }
-    
+
     def get_context_args(self) -> dict:
         """Get browser context arguments."""
-        return {
+        context_args = {
             "viewport": {"width": 1920, "height": 1080},
             "ignore_https_errors": True,
-            "record_video_dir": "reports/videos/" if self.record_videos else None,
         }
-    
+        if self.record_videos:
+            context_args["record_video_dir"] = "reports/videos/"
+            context_args["record_video_size"] = {"width": 1920, "height": 1080}
+        return context_args
+
+    def screenshot_on(self, failed: bool) -> bool:
+        """Check if a screenshot should be taken for a test outcome."""
+        if not self.take_screenshots or self.artifact_policy == "never":
+            return False
+        return failed or self.artifact_policy == "always"
+
     def __str__(self) -> str:
         """String representation of settings."""
-        return f"Settings(base_url={self.base_url}, browser={self.browser}, env={self.environment})" 
\ No newline at end of file
+        return (
+            f"Settings(profile={self.profile}, base_url={self.base_url}, "
+            f"browser={self.browser}, env={self.environment})"
+        )
+
+
+_active: Dict[str, Settings] = {}
+
+
+def get_settings(profile: Optional[str] = None) -> Settings:
+    """Get process-wide settings, parsing the environment only once.
+
+    Without a profile the active one is returned; passing a profile returns
+    that profile layered over the same environment overrides.
+    """
+    current = _active.get("current")
+    if current is None:
+        current = _active["current"] = Settings.from_env()
+    if profile is None or profile == current.profile:
+        return current
+    return _profile_settings(profile, tuple(sorted(current.overrides.items())))
+
+
+def switch_profile(profile: str) -> Settings:
+    """Make another profile the active one for the rest of the process."""
+    settings = get_settings(profile)
+    _active["current"] = settings
+    return settings
+
+
+def install_settings(settings: Settings) -> None:
+    """Use already-parsed settings, e.g. received from the xdist controller."""
+    _active["current"] = settings
+
+
+@lru_cache(maxsize=None)
+def _profile_settings(profile: str, overrides: Tuple[Tuple[str, Any], ...]) -> Settings:
+    # Keyed on the overrides themselves: they are excluded from Settings equality
+    return Settings.build(profile, dict(overrides))
@@ -1,29 +1,51 @@
 """
 Global pytest configuration and fixtures for Playwright automation framework.
+
+Playwright and the page objects are only imported by the fixtures that need
+them, so API-only sessions never pay for the UI stack.
 """
 
+from __future__ import annotations
+
 import pytest
 import os
-from typing import Generator
-from playwright.sync_api import Playwright, Browser, BrowserContext, Page
+from typing import TYPE_CHECKING, Callable, Generator, Optional
 from loguru import logger
-from config.settings import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+    from config.settings import Settings
+    from pages.registry import PageRegistry
+    from pages.saucedemo import LoginPage
+    from utils.payload_corpus import PayloadCorpus
+    from utils.state_seeding import AppState
+    from utils.xss_sentinel import XssSentinel
 
 
 @pytest.fixture(scope="session")
 def settings() -> Settings:
-    """Load test settings."""
-    return Settings()
+    """Load test settings (parsed once per process and shared)."""
+    from config.settings import get_settings
+    
+    return get_settings()
+
+
+@pytest.fixture(scope="session")
+def connect_options(browser_name: str, settings: Settings) -> Optional[dict]:
+    """Attach to a persistent browser server instead of launching, if enabled."""
+    if not settings.browser_server:
+        return None
+    from utils.browser_server import BrowserServer
+    
+    server = BrowserServer(settings, browser_name)
+    server.ensure()
+    return server.connect_options()
 
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_name: str) -> dict:
+def browser_context_args(settings: Settings) -> dict:
     """Configure browser context arguments."""
-    return {
-        "viewport": {"width": 1920, "height": 1080},
-        "record_video_dir": "reports/videos/" if os.getenv("RECORD_VIDEO") == "true" else None,
-        "record_video_size": {"width": 1920, "height": 1080},
-    }
+    return settings.get_context_args()
 
 
 @pytest.fixture(scope="function")
@@ -38,6 +60,50 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     page.close()
 
 
+@pytest.fixture(scope="function")
+def pages(page: Page) -> PageRegistry:
+    """Page objects for the current page, constructed lazily on first access."""
+    from pages.registry import PageRegistry
+    from pages import saucedemo  # noqa: F401  (registers SauceDemo page objects)
+    
+    return PageRegistry(page)
+
+
+@pytest.fixture(scope="function")
+def login_page(pages: PageRegistry) -> LoginPage:
+    """SauceDemo login page, opened in the test's own browser context."""
+    pages.login.open()
+    return pages.login
+
+
+@pytest.fixture(scope="session")
+def payload_corpus() -> PayloadCorpus:
+    """Security payload corpus, sampled per test (PAYLOAD_SAMPLE_SIZE, PAYLOAD_SEED)."""
+    from utils.payload_corpus import get_corpus
+    
+    return get_corpus()
+
+
+@pytest.fixture(scope="function")
+def xss_sentinel(context: BrowserContext) -> XssSentinel:
+    """XSS execution sentinel installed in the test's browser context."""
+    from utils.xss_sentinel import XssSentinel
+    
+    return XssSentinel(context).install()
+
+
+@pytest.fixture(scope="function")
+def seed_state(context: BrowserContext) -> Callable[[AppState], AppState]:
+    """Seed application state (session cookie, cart) into the test's browser context.
+    
+    Call it with a ``utils.state_seeding.AppState`` before opening the page under test.
+    """
+    def seed(state: AppState) -> AppState:
+        return state.apply(context)
+    
+    return seed
+
+
 @pytest.fixture(scope="function")
 def authenticated_page(page: Page, settings: Settings) -> Page:
     """Create an authenticated page (example for login)."""
@@ -48,6 +114,19 @@ def authenticated_page(page: Page, settings: Settings) -> Page:
 
 def pytest_configure(config):
     """Configure pytest with custom settings."""
+    from config.settings import Settings, get_settings, install_settings
+    
+    # xdist workers reuse the settings the controller already parsed
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput and "settings" in workerinput:
+        install_settings(Settings.from_json(workerinput["settings"]))
+    
+    # Without --browser, fan UI tests out to every engine listed in BROWSERS.
+    # pytest-playwright parametrizes on the session-scoped browser_name, so each
+    # engine is launched once per worker and every test still gets its own context.
+    if hasattr(config.option, "browser") and not config.option.browser:
+        config.option.browser = list(get_settings().browsers)
+    
     # Create reports directory
     os.makedirs("reports/screenshots", exist_ok=True)
     os.makedirs("reports/videos", exist_ok=True)
@@ -57,14 +136,78 @@ def pytest_configure(config):
     logger.info("Playwright automation framework initialized")
 
 
+def pytest_generate_tests(metafunc):
+    """Turn ``@pytest.mark.payloads(...)`` into one ``payload`` item per sampled payload.
+    
+    The marker takes ``PayloadCorpus.sample`` arguments. Sampling is seeded, so
+    every xdist worker collects the same items.
+    """
+    marker = metafunc.definition.get_closest_marker("payloads")
+    if marker is None or "payload" not in metafunc.fixturenames:
+        return
+    from utils.payload_corpus import get_corpus
+    
+    entries = get_corpus().sample(*marker.args, **marker.kwargs)
+    metafunc.parametrize(
+        "payload",
+        [entry.payload for entry in entries],
+        ids=[f"{entry.subcategory or entry.category}-{index}" for index, entry in enumerate(entries)],
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep each test class on one xdist worker unless it is marked ``isolated``.
+    
+    With ``--dist loadgroup`` isolated items are spread one by one, while other
+    classes, which may share class-scoped fixtures or ordering, stay together.
+    """
+    for item in items:
+        if item.cls is not None and item.get_closest_marker("isolated") is None:
+            item.add_marker(pytest.mark.xdist_group(f"{item.module.__name__}::{item.cls.__qualname__}"))
+
+
+def pytest_runtest_teardown(item):
+    """Enforce the isolation contract: isolated tests keep no state on the test instance."""
+    instance = getattr(item, "instance", None)
+    if instance is not None and vars(instance) and item.get_closest_marker("isolated") is not None:
+        pytest.fail(
+            f"{item.nodeid} is marked isolated but stored {sorted(vars(instance))} on self; "
+            "pass state through fixtures instead"
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the parsed settings to each xdist worker."""
+    from config.settings import get_settings
+    
+    node.workerinput["settings"] = get_settings().to_json()
+
+
 def pytest_runtest_makereport(item, call):
     """Create test reports and handle failures."""
-    if call.when == "call":
-        if call.excinfo is not None and "page" in item.fixturenames:
+    if call.when == "call" and "page" in item.fixturenames:
+        from config.settings import get_settings
+        
+        failed = call.excinfo is not None
+        if get_settings().screenshot_on(failed):
             page = item.funcargs["page"]
             screenshot_name = f"screenshots/{item.name}_{call.when}.png"
             page.screenshot(path=f"reports/{screenshot_name}")
-            logger.error(f"Test failed, screenshot saved: {screenshot_name}")
+            if failed:
+                logger.error(f"Test failed, screenshot saved: {screenshot_name}")
+            else:
+                logger.info(f"Screenshot saved: {screenshot_name}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Persist action latencies recorded for adaptive timeouts."""
+    import sys
+    
+    # Only UI runs import the page objects, and with them the latency store
+    adaptive_timeouts = sys.modules.get("utils.adaptive_timeouts")
+    if adaptive_timeouts is not None:
+        adaptive_timeouts.get_latency_store().save()
 
 
 @pytest.fixture(autouse=True)
@@ -75,8 +218,31 @@ def setup_test_environment(request):
     
     yield
     
+    # Reported through the teardown report so xdist workers' waits reach the controller
+    from utils.wait_profiler import get_wait_profiler
+    
+    waits = get_wait_profiler().drain()
+    if waits:
+        request.node.user_properties.append(("negative_waits", waits))
     logger.info(f"Finished test: {test_name}")
 
 
-# Custom markers for better test organization
-pytest_plugins = ["pytest_html"] 
\ No newline at end of file
+def pytest_runtest_logreport(report):
+    """Collect negative waits reported by tests."""
+    for name, value in report.user_properties:
+        if name == "negative_waits" and report.when == "teardown":
+            from utils.wait_profiler import get_wait_profiler
+            
+            get_wait_profiler().add(report.nodeid, [tuple(wait) for wait in value])
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report how much time the session spent in negative waits."""
+    from utils.wait_profiler import get_wait_profiler
+    
+    lines = get_wait_profiler().summary()
+    if lines:
+        terminalreporter.section("negative waits")
+        for line in lines:
+            terminalreporter.write_line(line)
+
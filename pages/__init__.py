@@ -1,5 +1,6 @@
 """Page objects package for UI automation."""
 
-from .base_page import BasePage
+from .base_page import BasePage, Element
+from .registry import PageRegistry
 
-__all__ = ["BasePage"] 
\ No newline at end of file
+__all__ = ["BasePage", "Element", "PageRegistry"] 
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""Asyncio page objects (``playwright.async_api``) sharing the sync ones' locators."""
+
+from .base_page import AsyncBasePage, mirror
+from .registry import AsyncPageRegistry, open_pages
+
+__all__ = ["AsyncBasePage", "AsyncPageRegistry", "mirror", "open_pages"]
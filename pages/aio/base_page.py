@@ -0,0 +1,254 @@
+"""
+Base page class for asyncio page objects (``playwright.async_api``).
+
+Async page objects share their definition with the sync ones: ``mirror``
+copies the locators (``Element``), row lists and data attributes of a sync page
+class onto its async counterpart and checks that every public method of the
+sync class has an async implementation, so the two cannot drift apart.
+"""
+
+import inspect
+from abc import ABC
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Optional, Type, TypeVar, Union
+
+from loguru import logger
+from playwright.async_api import Locator, Page
+
+from config.settings import get_settings
+from utils.wait_profiler import get_wait_profiler
+
+from ..base_page import (
+    _APPEND_CHUNK_SCRIPT,
+    _COMMIT_CHUNKS_SCRIPT,
+    CHUNKED_FILL_THRESHOLD,
+    BasePage,
+    Element,
+)
+from ..components import RowList
+from .components import AsyncRowList
+
+AsyncPageT = TypeVar("AsyncPageT", bound="AsyncBasePage")
+
+
+def mirror(
+    sync_class: Type[BasePage],
+) -> Callable[[Type[AsyncPageT]], Type[AsyncPageT]]:
+    """Share a sync page class's locators and data with an async page class.
+
+    Raises TypeError when a public method of the sync class (or its bases)
+    has no counterpart on the async class.
+    """
+
+    def decorator(async_class: Type[AsyncPageT]) -> Type[AsyncPageT]:
+        for name, value in vars(sync_class).items():
+            if name.startswith("_") or name in vars(async_class):
+                continue
+            if isinstance(value, Element):
+                setattr(async_class, name, value)
+            elif isinstance(value, RowList):
+                rows = AsyncRowList(
+                    value.root, value.name_selector, value.price_selector
+                )
+                rows.__set_name__(async_class, name)
+                setattr(async_class, name, rows)
+            elif not callable(value) and not isinstance(
+                value, (property, classmethod, staticmethod)
+            ):
+                setattr(async_class, name, value)
+        missing = sorted(
+            name
+            for name, _ in inspect.getmembers(sync_class, inspect.isfunction)
+            if not name.startswith("_") and not hasattr(async_class, name)
+        )
+        if missing:
+            raise TypeError(
+                f"{async_class.__name__} lacks {sync_class.__name__} methods: {missing}"
+            )
+        async_class.sync_class = sync_class
+        return async_class
+
+    return decorator
+
+
+class AsyncBasePage(ABC):
+    """Base class of asyncio page objects; mirrors ``BasePage`` with awaitable actions.
+
+    Subclasses are declared with ``@mirror(SyncPage)`` and define ``__slots__``.
+    """
+
+    __slots__ = ("page", "timeout", "_components")
+
+    sync_class: Type[BasePage] = BasePage
+
+    def __init__(self, page: Page):
+        """Initialize base page."""
+        self.page = page
+        self.timeout = (
+            get_settings().default_timeout
+        )  # static fallback for adaptive timeouts
+        self._components: Dict[str, object] = {}
+
+    # Bookkeeping is I/O-free and shared with the sync pages as-is
+    elements = classmethod(BasePage.elements.__func__)
+    timeout_for = BasePage.timeout_for
+    measure = BasePage.measure
+
+    async def navigate_to(self, url: str) -> None:
+        """Navigate to a specific URL."""
+        logger.info(f"Navigating to: {url}")
+        await self.page.goto(url, wait_until="domcontentloaded")
+
+    async def get_title(self) -> str:
+        """Get page title."""
+        return await self.page.title()
+
+    def get_url(self) -> str:
+        """Get current page URL."""
+        return self.page.url
+
+    async def wait_for_load_state(
+        self,
+        state: str = "domcontentloaded",
+        timeout: Optional[int] = None,
+        default: Optional[int] = None,
+    ) -> None:
+        """Wait for page load state."""
+        timeout = timeout or self.timeout_for("load_state", state, default)
+        with self.measure("load_state", state):
+            await self.page.wait_for_load_state(state, timeout=timeout)
+
+    async def wait_for_element(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> Locator:
+        """Wait for element to be visible."""
+        timeout = timeout or self.timeout_for("wait", selector)
+        logger.debug(f"Waiting for element: {selector}")
+        with self.measure("wait", selector):
+            return await self.page.wait_for_selector(selector, timeout=timeout)
+
+    async def click_element(self, selector: str, timeout: Optional[int] = None) -> None:
+        """Click on an element."""
+        timeout = timeout or self.timeout_for("click", selector)
+        logger.info(f"Clicking element: {selector}")
+        with self.measure("click", selector):
+            await self.page.click(selector, timeout=timeout)
+
+    async def fill_input(
+        self, selector: str, text: str, timeout: Optional[int] = None
+    ) -> None:
+        """Fill input field with text."""
+        timeout = timeout or self.timeout_for("fill", selector)
+        logger.info(f"Filling input {selector} with: {text}")
+        with self.measure("fill", selector):
+            await self.page.fill(selector, text, timeout=timeout)
+
+    async def fill_large(
+        self,
+        selector: str,
+        payload: Union[str, Iterable[str]],
+        chunk_size: int = CHUNKED_FILL_THRESHOLD,
+    ) -> int:
+        """Fill input with a payload, streaming it in chunks above the threshold."""
+        if isinstance(payload, str):
+            if len(payload) <= chunk_size:
+                await self.fill_input(selector, payload)
+                return len(payload)
+            payload = (
+                payload[start : start + chunk_size]
+                for start in range(0, len(payload), chunk_size)
+            )
+        locator = self.page.locator(selector)
+        await locator.wait_for(timeout=self.timeout_for("wait", selector))
+        with self.measure("fill_large", selector):
+            chunks = 0
+            for chunk in payload:
+                await locator.evaluate(_APPEND_CHUNK_SCRIPT, chunk)
+                chunks += 1
+            length = await locator.evaluate(_COMMIT_CHUNKS_SCRIPT)
+        logger.info(
+            f"Filled input {selector} with {length} characters in {chunks} chunks"
+        )
+        return length
+
+    async def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
+        """Get text content of an element."""
+        timeout = timeout or self.timeout_for("text", selector)
+        with self.measure("text", selector):
+            return await self.page.text_content(selector, timeout=timeout) or ""
+
+    async def is_visible(self, selector: str) -> bool:
+        """Check if element is visible right now, without waiting."""
+        return await self.page.is_visible(selector)
+
+    async def is_hidden(self, selector: str) -> bool:
+        """Check if element is hidden or absent right now, without waiting."""
+        return await self.page.is_hidden(selector)
+
+    async def count(self, selector: str) -> int:
+        """Get number of elements matching selector right now, without waiting."""
+        return await self.page.locator(selector).count()
+
+    async def eventually_visible(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> bool:
+        """Wait until element is visible, returning False on timeout."""
+        return await self._eventually(selector, "visible", timeout)
+
+    async def eventually_hidden(
+        self, selector: str, timeout: Optional[int] = None
+    ) -> bool:
+        """Wait until element is hidden or detached, returning False on timeout."""
+        return await self._eventually(selector, "hidden", timeout)
+
+    async def _eventually(
+        self, selector: str, state: str, timeout: Optional[int]
+    ) -> bool:
+        """Wait for element state, profiling waits that end in the timeout."""
+        timeout = timeout or self.timeout_for(state, selector, 5000)
+        start = perf_counter()
+        try:
+            with self.measure(state, selector):
+                await self.page.wait_for_selector(
+                    selector, state=state, timeout=timeout
+                )
+            return True
+        except Exception:
+            key = f"{type(self).__name__}.{state}:{selector}"
+            get_wait_profiler().record(key, (perf_counter() - start) * 1000)
+            return False
+
+    async def take_screenshot(self, name: Optional[str] = None) -> str:
+        """Take a screenshot of the current page."""
+        if not name:
+            name = f"screenshot_{self.__class__.__name__}.png"
+
+        screenshot_path = f"reports/screenshots/{name}"
+        await self.page.screenshot(path=screenshot_path)
+        logger.info(f"Screenshot saved: {screenshot_path}")
+        return screenshot_path
+
+    async def scroll_to_element(self, selector: str) -> None:
+        """Scroll to make element visible."""
+        logger.info(f"Scrolling to element: {selector}")
+        await self.page.locator(selector).scroll_into_view_if_needed()
+
+    async def wait_for_url_contains(
+        self, url_part: str, timeout: Optional[int] = None
+    ) -> None:
+        """Wait for URL to contain specific text."""
+        timeout = timeout or self.timeout_for("url", url_part)
+        with self.measure("url", url_part):
+            await self.page.wait_for_url(f"**/*{url_part}*", timeout=timeout)
+
+    async def press_key(self, key: str) -> None:
+        """Press a keyboard key."""
+        logger.info(f"Pressing key: {key}")
+        await self.page.keyboard.press(key)
+
+    async def hover_element(self, selector: str, timeout: Optional[int] = None) -> None:
+        """Hover over an element."""
+        timeout = timeout or self.timeout_for("hover", selector)
+        logger.info(f"Hovering over element: {selector}")
+        with self.measure("hover", selector):
+            await self.page.hover(selector, timeout=timeout)
@@ -0,0 +1,86 @@
+"""
+Asyncio counterparts of the repeated-row components.
+"""
+
+from typing import Optional
+
+from loguru import logger
+from playwright.async_api import Locator, Page
+
+from ..components import _READ_ROWS_SCRIPT, Row, RowList, RowSnapshot
+
+
+class AsyncRow(Row):
+    """Single list row whose actions are awaitable."""
+
+    __slots__ = ()
+
+    async def click(self, selector: str, timeout: Optional[int] = None) -> None:
+        """Click an element inside this row."""
+        logger.info(f"Clicking {selector} in row {self.index} ({self.name})")
+        await self.locator.locator(selector).click(timeout=timeout)
+
+
+class AsyncRows:
+    """List-of-rows component bound to an async page object (see ``Rows``)."""
+
+    __slots__ = ("page", "spec", "_snapshot")
+
+    def __init__(self, page: Page, spec: RowList):
+        """Initialize rows component."""
+        self.page = page
+        self.spec = spec
+        self._snapshot: Optional[RowSnapshot] = None
+
+    @property
+    def root(self) -> Locator:
+        """Get locator matching every row."""
+        return self.page.locator(self.spec.root)
+
+    async def snapshot(self) -> RowSnapshot:
+        """Get current snapshot, reading the DOM only when stale."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.url != self.page.url:
+            snapshot = self._snapshot = await self._read()
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot after the list has changed."""
+        self._snapshot = None
+
+    async def count(self) -> int:
+        """Get live number of rows without building a snapshot."""
+        return await self.root.count()
+
+    async def by_name(self, name: str) -> AsyncRow:
+        """Get row by its visible name."""
+        return (await self.snapshot()).by_name(name)
+
+    async def _read(self) -> RowSnapshot:
+        """Read names and prices of every row in one evaluation."""
+        root = self.root
+        values = await root.evaluate_all(
+            _READ_ROWS_SCRIPT, [self.spec.name_selector, self.spec.price_selector]
+        )
+        rows = tuple(
+            AsyncRow(index, name, price, root.nth(index))
+            for index, (name, price) in enumerate(values)
+        )
+        logger.debug(f"Read {len(rows)} rows for {self.spec.root}")
+        return RowSnapshot(rows, self.page.url)
+
+
+class AsyncRowList(RowList):
+    """Row-list declaration that binds ``AsyncRows`` on async page objects."""
+
+    __slots__ = ()
+
+    def __get__(self, instance: Optional[object], owner: type):
+        """Resolve to the bound ``AsyncRows`` component on instances."""
+        if instance is None:
+            return self
+        components = instance._components
+        rows = components.get(self.attr)
+        if rows is None:
+            rows = components[self.attr] = AsyncRows(instance.page, self)
+        return rows
@@ -0,0 +1,29 @@
+"""
+Lazy registry of asyncio page objects and helpers to open many pages at once.
+"""
+
+import asyncio
+from typing import Dict, List, Type
+
+from playwright.async_api import BrowserContext
+
+from ..registry import PageRegistry
+from .base_page import AsyncBasePage
+
+
+class AsyncPageRegistry(PageRegistry):
+    """``PageRegistry`` for async page objects, with its own set of registered names.
+
+    Async page classes register under the same names as their sync
+    counterparts, so ``pages.login`` reads the same in both styles.
+    """
+
+    __slots__ = ()
+
+    _page_classes: Dict[str, Type[AsyncBasePage]] = {}
+
+
+async def open_pages(context: BrowserContext, count: int) -> List[AsyncPageRegistry]:
+    """Open ``count`` pages in a context concurrently and wrap each in a registry."""
+    pages = await asyncio.gather(*(context.new_page() for _ in range(count)))
+    return [AsyncPageRegistry(page) for page in pages]
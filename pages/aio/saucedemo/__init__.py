@@ -0,0 +1,7 @@
+"""Async SauceDemo page objects package."""
+
+from .cart_page import AsyncCartPage
+from .inventory_page import AsyncInventoryPage
+from .login_page import AsyncLoginPage
+
+__all__ = ["AsyncLoginPage", "AsyncInventoryPage", "AsyncCartPage"]
@@ -0,0 +1,90 @@
+"""
+Async cart page object for SauceDemo website.
+"""
+
+from typing import List
+
+from ...saucedemo.cart_page import CartPage
+from ..base_page import AsyncBasePage, mirror
+from ..registry import AsyncPageRegistry
+
+
+@AsyncPageRegistry.register("cart")
+@mirror(CartPage)
+class AsyncCartPage(AsyncBasePage):
+    """Async cart page object for saucedemo.com; locators come from ``CartPage``."""
+
+    __slots__ = ()
+
+    async def open(self) -> None:
+        """Open the cart page directly; needs a seeded session (utils.state_seeding)."""
+        await self.navigate_to("https://www.saucedemo.com/v1/cart.html")
+        await self.wait_for_load_state()
+
+    async def is_loaded(self) -> bool:
+        """Check if cart page is loaded."""
+        try:
+            await self.wait_for_load_state("networkidle", default=10000)
+        except Exception:
+            pass
+        return "cart.html" in self.page.url
+
+    async def get_page_title(self) -> str:
+        """Get page title."""
+        return await self.get_text(self.page_title)
+
+    async def continue_shopping(self) -> None:
+        """Click continue shopping button."""
+        await self.click_element(self.continue_shopping_button)
+
+    async def proceed_to_checkout(self) -> None:
+        """Click checkout button."""
+        await self.click_element(self.checkout_button)
+
+    async def get_cart_items_count(self) -> int:
+        """Get number of items in cart."""
+        return await self.items.count()
+
+    async def get_cart_item_names(self) -> List[str]:
+        """Get names of all items in cart."""
+        return (await self.items.snapshot()).names()
+
+    async def get_cart_item_prices(self) -> List[str]:
+        """Get prices of all items in cart."""
+        return (await self.items.snapshot()).prices()
+
+    async def remove_item_from_cart(self, item_index: int = 0) -> None:
+        """Remove item from cart by index."""
+        rows = await self.items.snapshot()
+        if item_index < len(rows):
+            await rows[item_index].click(self.remove_buttons)
+            self.items.invalidate()
+            await self.page.wait_for_timeout(1000)
+
+    async def remove_product_from_cart(self, product_name: str) -> None:
+        """Remove item from cart by product name."""
+        await (await self.items.by_name(product_name)).click(self.remove_buttons)
+        self.items.invalidate()
+        await self.page.wait_for_timeout(1000)
+
+    async def remove_all_items(self) -> None:
+        """Remove all items from cart."""
+        while await self.get_cart_items_count() > 0:
+            await self.remove_item_from_cart(0)
+
+    async def is_cart_empty(self) -> bool:
+        """Check if cart is empty."""
+        return await self.get_cart_items_count() == 0
+
+    async def is_checkout_button_visible(self) -> bool:
+        """Check if checkout button becomes visible."""
+        return await self.eventually_visible(self.checkout_button)
+
+    async def is_continue_shopping_button_visible(self) -> bool:
+        """Check if continue shopping button becomes visible."""
+        return await self.eventually_visible(self.continue_shopping_button)
+
+    async def logout(self) -> None:
+        """Logout from the application."""
+        await self.click_element(self.hamburger_menu)
+        await self.click_element(self.logout_link)
@@ -0,0 +1,143 @@
+"""
+Async inventory page object for SauceDemo website.
+"""
+
+from typing import List
+
+from ...saucedemo.inventory_page import InventoryPage
+from ..base_page import AsyncBasePage, mirror
+from ..registry import AsyncPageRegistry
+
+
+@AsyncPageRegistry.register("inventory")
+@mirror(InventoryPage)
+class AsyncInventoryPage(AsyncBasePage):
+    """Async inventory page object; locators come from ``InventoryPage``."""
+
+    __slots__ = ()
+
+    async def open(self) -> None:
+        """Open the inventory page directly; needs a seeded session (state_seeding)."""
+        await self.navigate_to("https://www.saucedemo.com/v1/inventory.html")
+        await self.wait_for_load_state()
+
+    async def is_loaded(self) -> bool:
+        """Check if inventory page is loaded."""
+        try:
+            await self.wait_for_element(
+                self.inventory_items,
+                self.timeout_for("wait", self.inventory_items, 10000),
+            )
+            return (
+                "inventory.html" in self.page.url
+                and await self.count(self.inventory_items) > 0
+            )
+        except Exception:
+            return False
+
+    async def get_page_title(self) -> str:
+        """Get page title."""
+        return await self.get_text(self.page_title)
+
+    async def open_hamburger_menu(self) -> None:
+        """Open hamburger menu."""
+        await self.click_element(self.hamburger_menu)
+
+    async def logout(self) -> None:
+        """Logout from the application."""
+        await self.open_hamburger_menu()
+        await self.click_element(self.logout_link)
+
+    async def click_cart(self) -> None:
+        """Click on cart icon."""
+        await self.click_element(self.cart_icon)
+        await self.wait_for_load_state("networkidle", default=5000)
+
+    async def get_cart_items_count(self) -> int:
+        """Get number of items in cart."""
+        # The badge is absent for an empty cart, so don't wait for it
+        if await self.count(self.cart_badge):
+            return int(await self.get_text(self.cart_badge))
+        return 0
+
+    async def get_products_count(self) -> int:
+        """Get total number of products."""
+        return await self.products.count()
+
+    async def get_product_names(self) -> List[str]:
+        """Get all product names."""
+        return (await self.products.snapshot()).names()
+
+    async def get_product_prices(self) -> List[str]:
+        """Get all product prices."""
+        return (await self.products.snapshot()).prices()
+
+    async def add_product_to_cart_by_index(self, product_index: int = 0) -> None:
+        """Add product to cart by index (0-based)."""
+        rows = await self.products.snapshot()
+        if product_index >= len(rows):
+            raise ValueError(f"Product index {product_index} is out of range")
+        await rows[product_index].click(self.add_to_cart_buttons_generic)
+        await self.page.wait_for_timeout(500)
+
+    async def add_product_to_cart(self, product_name: str) -> None:
+        """Add product to cart by name."""
+        await (await self.products.by_name(product_name)).click(
+            self.add_to_cart_buttons_generic
+        )
+        await self.page.wait_for_timeout(500)
+
+    async def add_backpack_to_cart(self) -> None:
+        """Add backpack to cart (first product)."""
+        await self.add_product_to_cart_by_index(0)
+
+    async def add_bike_light_to_cart(self) -> None:
+        """Add bike light to cart (second product)."""
+        await self.add_product_to_cart_by_index(1)
+
+    async def add_tshirt_to_cart(self) -> None:
+        """Add t-shirt to cart (third product)."""
+        await self.add_product_to_cart_by_index(2)
+
+    async def add_all_products_to_cart(self) -> None:
+        """Add all products to cart."""
+        for button in await self.page.locator(self.add_to_cart_buttons_generic).all():
+            if await button.is_visible():
+                try:
+                    await button.click()
+                    await self.page.wait_for_timeout(100)
+                except Exception:
+                    continue
+
+    async def remove_product_from_cart(self, product_name: str) -> None:
+        """Remove specific product from cart."""
+        await (await self.products.by_name(product_name)).click(self.remove_buttons)
+
+    async def sort_products(self, sort_option: str) -> None:
+        """Sort products by given option."""
+        await self.page.select_option(self.sort_dropdown, sort_option)
+        self.products.invalidate()
+
+    async def sort_by_name_asc(self) -> None:
+        """Sort products by name A-Z."""
+        await self.sort_products("az")
+
+    async def sort_by_name_desc(self) -> None:
+        """Sort products by name Z-A."""
+        await self.sort_products("za")
+
+    async def sort_by_price_low_high(self) -> None:
+        """Sort products by price low to high."""
+        await self.sort_products("lohi")
+
+    async def sort_by_price_high_low(self) -> None:
+        """Sort products by price high to low."""
+        await self.sort_products("hilo")
+
+    async def click_product_name(self, product_name: str) -> None:
+        """Click on a specific product name."""
+        await (await self.products.by_name(product_name)).click(self.product_names)
+
+    async def is_product_added_to_cart(self, product_index: int = 0) -> bool:
+        """Check if product has been added to cart by checking cart badge."""
+        return await self.get_cart_items_count() > 0
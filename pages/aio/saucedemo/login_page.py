@@ -0,0 +1,84 @@
+"""
+Async login page object for SauceDemo website.
+"""
+
+from ...saucedemo.login_page import LoginPage
+from ..base_page import AsyncBasePage, mirror
+from ..registry import AsyncPageRegistry
+
+
+@AsyncPageRegistry.register("login")
+@mirror(LoginPage)
+class AsyncLoginPage(AsyncBasePage):
+    """Async login page object for saucedemo.com; locators come from ``LoginPage``."""
+
+    __slots__ = ()
+
+    async def open(self) -> None:
+        """Open the login page."""
+        await self.navigate_to("https://www.saucedemo.com/v1/")
+        await self.wait_for_load_state()
+
+    async def login(self, username: str, password: str) -> None:
+        """Login with provided credentials."""
+        await self.fill_large(self.username_input, username)
+        await self.fill_large(self.password_input, password)
+        await self.click_element(self.login_button)
+        await self.wait_for_load_state("networkidle", default=15000)
+
+    async def login_with_standard_user(self) -> None:
+        """Login with standard user credentials."""
+        await self.login("standard_user", self.password)
+
+    async def login_with_problem_user(self) -> None:
+        """Login with problem user credentials."""
+        await self.login("problem_user", self.password)
+
+    async def login_with_performance_user(self) -> None:
+        """Login with performance glitch user credentials."""
+        await self.login("performance_glitch_user", self.password)
+
+    async def login_with_locked_user(self) -> None:
+        """Login with locked out user credentials."""
+        await self.login(self.locked_user, self.password)
+
+    async def get_error_message(self) -> str:
+        """Get the error message text."""
+        return await self.get_text(self.error_message)
+
+    async def is_error_displayed(self) -> bool:
+        """Check if error message is displayed."""
+        return await self.is_visible(self.error_message)
+
+    async def close_error_message(self) -> None:
+        """Close the error message."""
+        if await self.is_visible(self.error_close_button):
+            await self.click_element(self.error_close_button)
+
+    async def is_error_hidden(self) -> bool:
+        """Check if error message disappears, e.g. after closing it."""
+        return await self.eventually_hidden(self.error_message)
+
+    async def is_logo_visible(self) -> bool:
+        """Check if logo becomes visible, e.g. after logging out."""
+        return await self.eventually_visible(self.logo)
+
+    async def clear_username(self) -> None:
+        """Clear username field."""
+        await self.page.fill(self.username_input, "")
+
+    async def clear_password(self) -> None:
+        """Clear password field."""
+        await self.page.fill(self.password_input, "")
+
+    async def get_username_value(self) -> str:
+        """Get current username field value."""
+        return await self.page.input_value(self.username_input)
+
+    async def get_password_value(self) -> str:
+        """Get current password field value."""
+        return await self.page.input_value(self.password_input)
+
+    async def is_login_button_enabled(self) -> bool:
+        """Check if login button is enabled."""
+        return await self.page.is_enabled(self.login_button)
@@ -3,18 +3,99 @@ Base page class for Page Object Model implementation.
 """
 
 from abc import ABC
-from typing import Optional
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, Optional, Union
 from playwright.sync_api import Page, Locator
 from loguru import logger
+from config.settings import get_settings
+from utils.adaptive_timeouts import get_latency_store
+from utils.wait_profiler import get_wait_profiler
+
+# Payloads above this size are streamed into inputs in chunks instead of fill()
+CHUNKED_FILL_THRESHOLD = 64 * 1024
+
+# Collects chunks on the element, then sets the value once through the native
+# setter (so framework-controlled inputs see it) and fires input/change events.
+_APPEND_CHUNK_SCRIPT = """(element, chunk) => {
+    (element.__fillChunks = element.__fillChunks || []).push(chunk);
+}"""
+_COMMIT_CHUNKS_SCRIPT = """element => {
+    let value = (element.__fillChunks || []).join("");
+    delete element.__fillChunks;
+    if (element.maxLength >= 0) value = value.slice(0, element.maxLength);
+    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value").set;
+    setter.call(element, value);
+    element.dispatchEvent(new Event("input", { bubbles: true }));
+    element.dispatchEvent(new Event("change", { bubbles: true }));
+    return value.length;
+}"""
+
+
+class Element:
+    """Class-level locator declaration for page objects.
+
+    Declaring locators as descriptors keeps them on the class, so creating a
+    page object does not copy a dozen strings into every instance.
+    """
+
+    __slots__ = ("selector", "name")
+
+    def __init__(self, selector: str):
+        """Initialize element with its CSS/text selector."""
+        self.selector = selector
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the attribute name the element was declared under."""
+        self.name = name
+
+    def __get__(self, instance: Optional[object], owner: type) -> str:
+        """Resolve to the selector string on both the class and instances."""
+        return self.selector
+
+    def __repr__(self) -> str:
+        """String representation of the element."""
+        return f"Element({self.name}={self.selector!r})"
 
 
 class BasePage(ABC):
-    """Base page class that all page objects should inherit from."""
-    
+    """Base page class that all page objects should inherit from.
+
+    Subclasses declare their locators as ``Element`` class attributes and
+    must define ``__slots__`` (usually empty) to stay dict-free.
+    """
+
+    __slots__ = ("page", "timeout", "_components")
+
     def __init__(self, page: Page):
         """Initialize base page."""
         self.page = page
-        self.timeout = 30000  # 30 seconds default timeout
+        self.timeout = get_settings().default_timeout  # static fallback for adaptive timeouts
+        self._components: Dict[str, object] = {}
+
+    @classmethod
+    def elements(cls) -> Dict[str, str]:
+        """Get all declared element selectors keyed by attribute name."""
+        found: Dict[str, str] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, Element):
+                    found[name] = value.selector
+        return found
+        
+    def timeout_for(self, action: str, target: str, default: Optional[int] = None) -> int:
+        """Get adaptive timeout for an action, falling back to the static default."""
+        key = f"{type(self).__name__}.{action}:{target}"
+        return get_latency_store().timeout_for(key, default or self.timeout)
+        
+    @contextmanager
+    def measure(self, action: str, target: str) -> Iterator[None]:
+        """Record the latency of an action if it completes successfully."""
+        start = perf_counter()
+        yield
+        key = f"{type(self).__name__}.{action}:{target}"
+        get_latency_store().record(key, (perf_counter() - start) * 1000)
         
     def navigate_to(self, url: str) -> None:
         """Navigate to a specific URL."""
@@ -29,47 +110,97 @@ class BasePage(ABC):
         """Get current page URL."""
         return self.page.url
         
-    def wait_for_load_state(self, state: str = "domcontentloaded") -> None:
+    def wait_for_load_state(
+        self, state: str = "domcontentloaded", timeout: Optional[int] = None, default: Optional[int] = None
+    ) -> None:
         """Wait for page load state."""
-        self.page.wait_for_load_state(state)
+        timeout = timeout or self.timeout_for("load_state", state, default)
+        with self.measure("load_state", state):
+            self.page.wait_for_load_state(state, timeout=timeout)
         
     def wait_for_element(self, selector: str, timeout: Optional[int] = None) -> Locator:
         """Wait for element to be visible."""
-        timeout = timeout or self.timeout
+        timeout = timeout or self.timeout_for("wait", selector)
         logger.debug(f"Waiting for element: {selector}")
-        return self.page.wait_for_selector(selector, timeout=timeout)
+        with self.measure("wait", selector):
+            return self.page.wait_for_selector(selector, timeout=timeout)
         
     def click_element(self, selector: str, timeout: Optional[int] = None) -> None:
         """Click on an element."""
-        timeout = timeout or self.timeout
+        timeout = timeout or self.timeout_for("click", selector)
         logger.info(f"Clicking element: {selector}")
-        self.page.click(selector, timeout=timeout)
+        with self.measure("click", selector):
+            self.page.click(selector, timeout=timeout)
         
     def fill_input(self, selector: str, text: str, timeout: Optional[int] = None) -> None:
         """Fill input field with text."""
-        timeout = timeout or self.timeout
+        timeout = timeout or self.timeout_for("fill", selector)
         logger.info(f"Filling input {selector} with: {text}")
-        self.page.fill(selector, text, timeout=timeout)
+        with self.measure("fill", selector):
+            self.page.fill(selector, text, timeout=timeout)
+        
+    def fill_large(
+        self, selector: str, payload: Union[str, Iterable[str]], chunk_size: int = CHUNKED_FILL_THRESHOLD
+    ) -> int:
+        """Fill input with a large payload, streaming it in chunks above the threshold.
+        
+        ``payload`` may be a string or an iterable of chunks (e.g. from
+        ``iter_buffer_chunks``), so the full value never has to exist in Python.
+        Returns the length of the resulting input value.
+        """
+        if isinstance(payload, str):
+            if len(payload) <= chunk_size:
+                self.fill_input(selector, payload)
+                return len(payload)
+            payload = (payload[start:start + chunk_size] for start in range(0, len(payload), chunk_size))
+        locator = self.page.locator(selector)
+        locator.wait_for(timeout=self.timeout_for("wait", selector))
+        with self.measure("fill_large", selector):
+            chunks = 0
+            for chunk in payload:
+                locator.evaluate(_APPEND_CHUNK_SCRIPT, chunk)
+                chunks += 1
+            length = locator.evaluate(_COMMIT_CHUNKS_SCRIPT)
+        logger.info(f"Filled input {selector} with {length} characters in {chunks} chunks")
+        return length
         
     def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
         """Get text content of an element."""
-        timeout = timeout or self.timeout
-        return self.page.text_content(selector, timeout=timeout) or ""
+        timeout = timeout or self.timeout_for("text", selector)
+        with self.measure("text", selector):
+            return self.page.text_content(selector, timeout=timeout) or ""
         
-    def is_visible(self, selector: str, timeout: int = 5000) -> bool:
-        """Check if element is visible."""
-        try:
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-            return True
-        except Exception:
-            return False
-            
-    def is_hidden(self, selector: str, timeout: int = 5000) -> bool:
-        """Check if element is hidden."""
+    def is_visible(self, selector: str) -> bool:
+        """Check if element is visible right now, without waiting."""
+        return self.page.is_visible(selector)
+        
+    def is_hidden(self, selector: str) -> bool:
+        """Check if element is hidden or absent right now, without waiting."""
+        return self.page.is_hidden(selector)
+        
+    def count(self, selector: str) -> int:
+        """Get number of elements matching selector right now, without waiting."""
+        return self.page.locator(selector).count()
+        
+    def eventually_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
+        """Wait until element is visible, returning False on timeout."""
+        return self._eventually(selector, "visible", timeout)
+        
+    def eventually_hidden(self, selector: str, timeout: Optional[int] = None) -> bool:
+        """Wait until element is hidden or detached, returning False on timeout."""
+        return self._eventually(selector, "hidden", timeout)
+        
+    def _eventually(self, selector: str, state: str, timeout: Optional[int]) -> bool:
+        """Wait for element state, profiling waits that end in the timeout."""
+        timeout = timeout or self.timeout_for(state, selector, 5000)
+        start = perf_counter()
         try:
-            self.page.wait_for_selector(selector, state="hidden", timeout=timeout)
+            with self.measure(state, selector):
+                self.page.wait_for_selector(selector, state=state, timeout=timeout)
             return True
         except Exception:
+            key = f"{type(self).__name__}.{state}:{selector}"
+            get_wait_profiler().record(key, (perf_counter() - start) * 1000)
             return False
             
     def take_screenshot(self, name: Optional[str] = None) -> str:
@@ -89,8 +220,9 @@ class BasePage(ABC):
         
     def wait_for_url_contains(self, url_part: str, timeout: Optional[int] = None) -> None:
         """Wait for URL to contain specific text."""
-        timeout = timeout or self.timeout
-        self.page.wait_for_url(f"**/*{url_part}*", timeout=timeout)
+        timeout = timeout or self.timeout_for("url", url_part)
+        with self.measure("url", url_part):
+            self.page.wait_for_url(f"**/*{url_part}*", timeout=timeout)
         
     def press_key(self, key: str) -> None:
         """Press a keyboard key."""
@@ -99,6 +231,7 @@ class BasePage(ABC):
         
     def hover_element(self, selector: str, timeout: Optional[int] = None) -> None:
         """Hover over an element."""
-        timeout = timeout or self.timeout
+        timeout = timeout or self.timeout_for("hover", selector)
         logger.info(f"Hovering over element: {selector}")
-        self.page.hover(selector, timeout=timeout) 
\ No newline at end of file
+        with self.measure("hover", selector):
+            self.page.hover(selector, timeout=timeout) 
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Reusable component objects for repeated rows such as product and cart items.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+from playwright.sync_api import Locator, Page
+
+# Reads name and price of every row in a single round trip to the browser.
+_READ_ROWS_SCRIPT = """(rows, [nameSelector, priceSelector]) => rows.map(row => {
+    const text = selector => {
+        const element = selector ? row.querySelector(selector) : null;
+        return element ? element.textContent || "" : "";
+    };
+    return [text(nameSelector), text(priceSelector)];
+})"""
+
+
+class Row:
+    """Single list row resolved from a snapshot."""
+
+    __slots__ = ("index", "name", "price", "locator")
+
+    def __init__(self, index: int, name: str, price: str, locator: Locator):
+        """Initialize row."""
+        self.index = index
+        self.name = name
+        self.price = price
+        self.locator = locator
+
+    def click(self, selector: str, timeout: Optional[int] = None) -> None:
+        """Click an element inside this row."""
+        logger.info(f"Clicking {selector} in row {self.index} ({self.name})")
+        self.locator.locator(selector).click(timeout=timeout)
+
+    def __repr__(self) -> str:
+        """String representation of the row."""
+        return f"Row(index={self.index}, name={self.name!r}, price={self.price!r})"
+
+
+class RowSnapshot:
+    """Immutable view of all rows taken from one DOM read, indexed by name."""
+
+    __slots__ = ("rows", "url", "_by_name")
+
+    def __init__(self, rows: Tuple[Row, ...], url: str):
+        """Initialize snapshot and build the name index."""
+        self.rows = rows
+        self.url = url
+        self._by_name: Dict[str, Row] = {}
+        for row in rows:
+            self._by_name.setdefault(row.name.strip(), row)
+
+    def by_name(self, name: str) -> Row:
+        """Get row by its visible name."""
+        row = self._by_name.get(name.strip())
+        if row is None:
+            raise ValueError(
+                f"Row '{name}' not found, available: {list(self._by_name)}"
+            )
+        return row
+
+    def names(self) -> List[str]:
+        """Get names of all rows in display order."""
+        return [row.name for row in self.rows]
+
+    def prices(self) -> List[str]:
+        """Get prices of all rows in display order."""
+        return [row.price for row in self.rows]
+
+    def __contains__(self, name: str) -> bool:
+        """Check if a row with the given name exists."""
+        return name.strip() in self._by_name
+
+    def __getitem__(self, index: int) -> Row:
+        """Get row by display index."""
+        return self.rows[index]
+
+    def __iter__(self) -> Iterator[Row]:
+        """Iterate over rows in display order."""
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        """Get number of rows."""
+        return len(self.rows)
+
+
+class Rows:
+    """List-of-rows component bound to a page object.
+
+    The snapshot is read once and reused until the page navigates or the
+    owning page object calls ``invalidate`` after changing the list.
+    """
+
+    __slots__ = ("page", "spec", "_snapshot")
+
+    def __init__(self, page: Page, spec: "RowList"):
+        """Initialize rows component."""
+        self.page = page
+        self.spec = spec
+        self._snapshot: Optional[RowSnapshot] = None
+
+    @property
+    def root(self) -> Locator:
+        """Get locator matching every row."""
+        return self.page.locator(self.spec.root)
+
+    def snapshot(self) -> RowSnapshot:
+        """Get current snapshot, reading the DOM only when stale."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.url != self.page.url:
+            snapshot = self._snapshot = self._read()
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot after the list has changed."""
+        self._snapshot = None
+
+    def count(self) -> int:
+        """Get live number of rows without building a snapshot."""
+        return self.root.count()
+
+    def by_name(self, name: str) -> Row:
+        """Get row by its visible name."""
+        return self.snapshot().by_name(name)
+
+    def _read(self) -> RowSnapshot:
+        """Read names and prices of every row in one evaluation."""
+        root = self.root
+        values = root.evaluate_all(
+            _READ_ROWS_SCRIPT, [self.spec.name_selector, self.spec.price_selector]
+        )
+        rows = tuple(
+            Row(index, name, price, root.nth(index))
+            for index, (name, price) in enumerate(values)
+        )
+        logger.debug(f"Read {len(rows)} rows for {self.spec.root}")
+        return RowSnapshot(rows, self.page.url)
+
+
+class RowList:
+    """Class-level declaration of a repeated-row component.
+
+    Like ``Element``, it is declared on the page class; the bound ``Rows``
+    component is created on first access and cached on the page object.
+    """
+
+    __slots__ = ("root", "name_selector", "price_selector", "attr")
+
+    def __init__(self, root: str, name: str = "", price: str = ""):
+        """Initialize row list with row, name and price selectors."""
+        self.root = root
+        self.name_selector = name
+        self.price_selector = price
+        self.attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the attribute name the component was declared under."""
+        self.attr = name
+
+    def __get__(self, instance: Optional[object], owner: type):
+        """Resolve to the bound ``Rows`` component on instances."""
+        if instance is None:
+            return self
+        components = instance._components
+        rows = components.get(self.attr)
+        if rows is None:
+            rows = components[self.attr] = Rows(instance.page, self)
+        return rows
@@ -0,0 +1,75 @@
+"""
+Lazy page-object registry bound to a single Playwright page.
+"""
+
+from typing import Callable, Dict, Type, TypeVar
+
+from playwright.sync_api import Page
+
+from .base_page import BasePage
+
+PageT = TypeVar("PageT", bound=BasePage)
+
+
+class PageRegistry:
+    """Create page objects on first access and reuse them for the same page.
+
+    Page classes register themselves under a short name::
+
+        @PageRegistry.register("login")
+        class LoginPage(BasePage): ...
+
+    and tests reach them through ``pages.login`` - only the page objects a
+    test actually touches are ever constructed.
+    """
+
+    __slots__ = ("page", "_instances")
+
+    _page_classes: Dict[str, Type[BasePage]] = {}
+
+    def __init__(self, page: Page):
+        """Initialize registry for a Playwright page."""
+        self.page = page
+        self._instances: Dict[str, BasePage] = {}
+
+    @classmethod
+    def register(cls, name: str) -> Callable[[Type[PageT]], Type[PageT]]:
+        """Register a page class under the given attribute name."""
+
+        def decorator(page_class: Type[PageT]) -> Type[PageT]:
+            registered = cls._page_classes.get(name)
+            if registered is not None and registered is not page_class:
+                raise ValueError(
+                    f"Page name '{name}' already registered for {registered.__name__}"
+                )
+            cls._page_classes[name] = page_class
+            return page_class
+
+        return decorator
+
+    @classmethod
+    def registered(cls) -> Dict[str, Type[BasePage]]:
+        """Get a copy of all registered page classes."""
+        return dict(cls._page_classes)
+
+    def get(self, name: str) -> BasePage:
+        """Get page object by registered name, creating it on first access."""
+        instance = self._instances.get(name)
+        if instance is None:
+            try:
+                page_class = self._page_classes[name]
+            except KeyError:
+                raise AttributeError(f"No page object registered as '{name}'") from None
+            instance = page_class(self.page)
+            self._instances[name] = instance
+        return instance
+
+    def __getattr__(self, name: str) -> BasePage:
+        """Resolve ``pages.<name>`` through the registry."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        """Check if the page object has already been created."""
+        return name in self._instances
@@ -3,37 +3,45 @@ Cart page object for SauceDemo website.
 """
 
 from typing import List
-from playwright.sync_api import Page
-from ..base_page import BasePage
+from ..base_page import BasePage, Element
+from ..components import RowList
+from ..registry import PageRegistry
 
 
+@PageRegistry.register("cart")
 class CartPage(BasePage):
     """Cart page object for saucedemo.com."""
     
-    def __init__(self, page: Page):
-        """Initialize cart page."""
-        super().__init__(page)
-        
-        # Locators
-        self.page_title = ".title"
-        self.continue_shopping_button = "a.btn_secondary"
-        self.checkout_button = "a.btn_action.checkout_button"
-        self.cart_items = ".cart_item"
-        self.cart_item_names = ".inventory_item_name"
-        self.cart_item_prices = ".inventory_item_price"
-        self.cart_item_descriptions = ".inventory_item_desc"
-        self.remove_buttons = ".btn_secondary"
-        self.cart_quantity = ".cart_quantity"
+    __slots__ = ()
+    
+    # Locators
+    page_title = Element(".title")
+    continue_shopping_button = Element("a.btn_secondary")
+    checkout_button = Element("a.btn_action.checkout_button")
+    cart_items = Element(".cart_item")
+    cart_item_names = Element(".inventory_item_name")
+    cart_item_prices = Element(".inventory_item_price")
+    cart_item_descriptions = Element(".inventory_item_desc")
+    remove_buttons = Element(".btn_secondary")
+    cart_quantity = Element(".cart_quantity")
+    
+    # Cart rows, read once per snapshot
+    items = RowList(".cart_item", name=".inventory_item_name", price=".inventory_item_price")
+    
+    # Hamburger menu
+    hamburger_menu = Element(".bm-burger-button")
+    logout_link = Element("#logout_sidebar_link")
         
-        # Hamburger menu
-        self.hamburger_menu = ".bm-burger-button"
-        self.logout_link = "#logout_sidebar_link"
+    def open(self) -> None:
+        """Open the cart page directly (needs a seeded session, see utils.state_seeding)."""
+        self.navigate_to("https://www.saucedemo.com/v1/cart.html")
+        self.wait_for_load_state()
         
     def is_loaded(self) -> bool:
         """Check if cart page is loaded."""
         try:
             # Wait for page to load and check URL
-            self.page.wait_for_load_state("networkidle", timeout=10000)
+            self.wait_for_load_state("networkidle", default=10000)
             return "cart.html" in self.page.url
         except:
             return "cart.html" in self.page.url
@@ -52,32 +60,31 @@ class CartPage(BasePage):
         
     def get_cart_items_count(self) -> int:
         """Get number of items in cart."""
-        return len(self.page.locator(self.cart_items).all())
+        return self.items.count()
         
     def get_cart_item_names(self) -> List[str]:
         """Get names of all items in cart."""
-        names = []
-        name_elements = self.page.locator(self.cart_item_names).all()
-        for element in name_elements:
-            names.append(element.text_content() or "")
-        return names
+        return self.items.snapshot().names()
         
     def get_cart_item_prices(self) -> List[str]:
         """Get prices of all items in cart."""
-        prices = []
-        price_elements = self.page.locator(self.cart_item_prices).all()
-        for element in price_elements:
-            prices.append(element.text_content() or "")
-        return prices
+        return self.items.snapshot().prices()
         
     def remove_item_from_cart(self, item_index: int = 0) -> None:
         """Remove item from cart by index."""
-        remove_buttons = self.page.locator(self.remove_buttons).all()
-        if item_index < len(remove_buttons):
-            remove_buttons[item_index].click()
+        rows = self.items.snapshot()
+        if item_index < len(rows):
+            rows[item_index].click(self.remove_buttons)
+            self.items.invalidate()
             # Wait for the page to update after removal
             self.page.wait_for_timeout(1000)
             
+    def remove_product_from_cart(self, product_name: str) -> None:
+        """Remove item from cart by product name."""
+        self.items.by_name(product_name).click(self.remove_buttons)
+        self.items.invalidate()
+        self.page.wait_for_timeout(1000)
+            
     def remove_all_items(self) -> None:
         """Remove all items from cart."""
         while self.get_cart_items_count() > 0:
@@ -88,12 +95,12 @@ class CartPage(BasePage):
         return self.get_cart_items_count() == 0
         
     def is_checkout_button_visible(self) -> bool:
-        """Check if checkout button is visible."""
-        return self.is_visible(self.checkout_button)
+        """Check if checkout button becomes visible."""
+        return self.eventually_visible(self.checkout_button)
         
     def is_continue_shopping_button_visible(self) -> bool:
-        """Check if continue shopping button is visible."""
-        return self.is_visible(self.continue_shopping_button)
+        """Check if continue shopping button becomes visible."""
+        return self.eventually_visible(self.continue_shopping_button)
         
     def logout(self) -> None:
         """Logout from the application."""
@@ -3,41 +3,49 @@ Inventory page object for SauceDemo website.
 """
 
 from typing import List
-from playwright.sync_api import Page
-from ..base_page import BasePage
+from ..base_page import BasePage, Element
+from ..components import RowList
+from ..registry import PageRegistry
 
 
+@PageRegistry.register("inventory")
 class InventoryPage(BasePage):
     """Inventory page object for saucedemo.com."""
     
-    def __init__(self, page: Page):
-        """Initialize inventory page."""
-        super().__init__(page)
-        
-        # Locators
-        self.page_title = ".title"
-        self.hamburger_menu = ".bm-burger-button"
-        self.logout_link = "#logout_sidebar_link"
-        self.cart_icon = ".shopping_cart_link"
-        self.cart_badge = ".shopping_cart_badge"
-        self.sort_dropdown = ".product_sort_container"
-        
-        # Product locators
-        self.inventory_items = ".inventory_item"
-        self.product_names = ".inventory_item_name"
-        self.product_prices = ".inventory_item_price"
-        self.product_descriptions = ".inventory_item_desc"
-        self.add_to_cart_buttons = ".btn_inventory"
-        self.remove_buttons = ".btn_secondary"
-        
-        # Specific product locators - using generic button selectors since IDs don't work
-        self.add_to_cart_buttons_generic = ".btn_primary.btn_inventory"
+    __slots__ = ()
+    
+    # Locators
+    page_title = Element(".title")
+    hamburger_menu = Element(".bm-burger-button")
+    logout_link = Element("#logout_sidebar_link")
+    cart_icon = Element(".shopping_cart_link")
+    cart_badge = Element(".shopping_cart_badge")
+    sort_dropdown = Element(".product_sort_container")
+    
+    # Product locators
+    inventory_items = Element(".inventory_item")
+    product_names = Element(".inventory_item_name")
+    product_prices = Element(".inventory_item_price")
+    product_descriptions = Element(".inventory_item_desc")
+    add_to_cart_buttons = Element(".btn_inventory")
+    remove_buttons = Element(".btn_secondary")
+    
+    # Specific product locators - using generic button selectors since IDs don't work
+    add_to_cart_buttons_generic = Element(".btn_primary.btn_inventory")
+    
+    # Product rows, read once per snapshot
+    products = RowList(".inventory_item", name=".inventory_item_name", price=".inventory_item_price")
+        
+    def open(self) -> None:
+        """Open the inventory page directly (needs a seeded session, see utils.state_seeding)."""
+        self.navigate_to("https://www.saucedemo.com/v1/inventory.html")
+        self.wait_for_load_state()
         
     def is_loaded(self) -> bool:
         """Check if inventory page is loaded."""
         try:
             # Wait for inventory items to be visible and check URL
-            self.page.wait_for_selector(self.inventory_items, timeout=10000)
+            self.wait_for_element(self.inventory_items, self.timeout_for("wait", self.inventory_items, 10000))
             return "inventory.html" in self.page.url and len(self.page.locator(self.inventory_items).all()) > 0
         except:
             return False
@@ -59,44 +67,42 @@ class InventoryPage(BasePage):
         """Click on cart icon."""
         self.click_element(self.cart_icon)
         # Wait for cart page to load
-        self.page.wait_for_load_state("networkidle", timeout=5000)
+        self.wait_for_load_state("networkidle", default=5000)
         
     def get_cart_items_count(self) -> int:
         """Get number of items in cart."""
-        if self.is_visible(self.cart_badge):
+        # The badge is absent for an empty cart, so don't wait for it
+        if self.count(self.cart_badge):
             return int(self.get_text(self.cart_badge))
         return 0
         
     def get_products_count(self) -> int:
         """Get total number of products."""
-        return len(self.page.locator(self.inventory_items).all())
+        return self.products.count()
         
     def get_product_names(self) -> List[str]:
         """Get all product names."""
-        names = []
-        product_elements = self.page.locator(self.product_names).all()
-        for element in product_elements:
-            names.append(element.text_content() or "")
-        return names
+        return self.products.snapshot().names()
         
     def get_product_prices(self) -> List[str]:
         """Get all product prices."""
-        prices = []
-        price_elements = self.page.locator(self.product_prices).all()
-        for element in price_elements:
-            prices.append(element.text_content() or "")
-        return prices
+        return self.products.snapshot().prices()
         
     def add_product_to_cart_by_index(self, product_index: int = 0) -> None:
         """Add product to cart by index (0-based)."""
-        buttons = self.page.locator(self.add_to_cart_buttons_generic).all()
-        if product_index < len(buttons):
-            buttons[product_index].click()
+        rows = self.products.snapshot()
+        if product_index < len(rows):
+            rows[product_index].click(self.add_to_cart_buttons_generic)
             # Wait for the cart to update
             self.page.wait_for_timeout(500)
         else:
             raise ValueError(f"Product index {product_index} is out of range")
             
+    def add_product_to_cart(self, product_name: str) -> None:
+        """Add product to cart by name."""
+        self.products.by_name(product_name).click(self.add_to_cart_buttons_generic)
+        self.page.wait_for_timeout(500)
+            
     def add_backpack_to_cart(self) -> None:
         """Add backpack to cart (first product)."""
         self.add_product_to_cart_by_index(0)
@@ -124,14 +130,12 @@ class InventoryPage(BasePage):
                 
     def remove_product_from_cart(self, product_name: str) -> None:
         """Remove specific product from cart."""
-        # This would need to be implemented based on the remove button structure
-        remove_buttons = self.page.locator(self.remove_buttons).all()
-        if remove_buttons:
-            remove_buttons[0].click()  # Remove first item for demo
+        self.products.by_name(product_name).click(self.remove_buttons)
             
     def sort_products(self, sort_option: str) -> None:
         """Sort products by given option."""
         self.page.select_option(self.sort_dropdown, sort_option)
+        self.products.invalidate()
         
     def sort_by_name_asc(self) -> None:
         """Sort products by name A-Z."""
@@ -151,7 +155,7 @@ class InventoryPage(BasePage):
         
     def click_product_name(self, product_name: str) -> None:
         """Click on a specific product name."""
-        self.page.click(f"text={product_name}")
+        self.products.by_name(product_name).click(self.product_names)
         
     def is_product_added_to_cart(self, product_index: int = 0) -> bool:
         """Check if product has been added to cart by checking cart badge."""
@@ -2,33 +2,32 @@
 Login page object for SauceDemo website.
 """
 
-from playwright.sync_api import Page
-from ..base_page import BasePage
+from ..base_page import BasePage, Element
+from ..registry import PageRegistry
 
 
+@PageRegistry.register("login")
 class LoginPage(BasePage):
     """Login page object for saucedemo.com."""
     
-    def __init__(self, page: Page):
-        """Initialize login page."""
-        super().__init__(page)
-        
-        # Locators
-        self.username_input = "#user-name"
-        self.password_input = "#password"
-        self.login_button = "#login-button"
-        self.error_message = "[data-test='error']"
-        self.error_close_button = ".error-button"
-        self.logo = ".login_logo"
-        
-        # Test credentials from the website
-        self.valid_users = {
-            'standard_user': 'secret_sauce',
-            'problem_user': 'secret_sauce',
-            'performance_glitch_user': 'secret_sauce'
-        }
-        self.locked_user = 'locked_out_user'
-        self.password = 'secret_sauce'
+    __slots__ = ()
+    
+    # Locators
+    username_input = Element("#user-name")
+    password_input = Element("#password")
+    login_button = Element("#login-button")
+    error_message = Element("[data-test='error']")
+    error_close_button = Element(".error-button")
+    logo = Element(".login_logo")
+    
+    # Test credentials from the website
+    valid_users = {
+        'standard_user': 'secret_sauce',
+        'problem_user': 'secret_sauce',
+        'performance_glitch_user': 'secret_sauce'
+    }
+    locked_user = 'locked_out_user'
+    password = 'secret_sauce'
         
     def open(self) -> None:
         """Open the login page."""
@@ -37,11 +36,12 @@ class LoginPage(BasePage):
         
     def login(self, username: str, password: str) -> None:
         """Login with provided credentials."""
-        self.fill_input(self.username_input, username)
-        self.fill_input(self.password_input, password)
+        # Oversized payloads (e.g. buffer overflow tests) are streamed in chunks
+        self.fill_large(self.username_input, username)
+        self.fill_large(self.password_input, password)
         self.click_element(self.login_button)
         # Wait for navigation to complete
-        self.page.wait_for_load_state("networkidle", timeout=15000)
+        self.wait_for_load_state("networkidle", default=15000)
         
     def login_with_standard_user(self) -> None:
         """Login with standard user credentials."""
@@ -65,6 +65,7 @@ class LoginPage(BasePage):
         
     def is_error_displayed(self) -> bool:
         """Check if error message is displayed."""
+        # The error renders synchronously on submit, which login() already waited for
         return self.is_visible(self.error_message)
         
     def close_error_message(self) -> None:
@@ -72,9 +73,13 @@ class LoginPage(BasePage):
         if self.is_visible(self.error_close_button):
             self.click_element(self.error_close_button)
             
+    def is_error_hidden(self) -> bool:
+        """Check if error message disappears, e.g. after closing it."""
+        return self.eventually_hidden(self.error_message)
+        
     def is_logo_visible(self) -> bool:
-        """Check if logo is visible."""
-        return self.is_visible(self.logo)
+        """Check if logo becomes visible, e.g. after logging out."""
+        return self.eventually_visible(self.logo)
         
     def clear_username(self) -> None:
         """Clear username field."""
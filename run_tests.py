@@ -11,6 +11,11 @@ import subprocess
 import argparse
 from pathlib import Path
 
+BROWSERS = ["chromium", "firefox", "webkit"]
+
+# Installed pytest plugins the suite never uses; they cost ~1s of startup
+UNUSED_PLUGINS = ["faker", "anyio"]
+
 
 def run_command(command: list, description: str) -> bool:
     """Run a command and return success status."""
@@ -55,6 +60,74 @@ def setup_environment():
             print("⚠️  No env.example file found")
 
 
+def resolve_browsers(requested: list) -> list:
+    """Expand the --browser selection into a de-duplicated list of engines."""
+    if not requested:
+        return []
+    if "all" in requested:
+        return list(BROWSERS)
+    return list(dict.fromkeys(requested))
+
+
+def plugin_args(args: argparse.Namespace, browserless: bool = False) -> list:
+    """Disable pytest plugins the selected run does not need."""
+    disabled = list(UNUSED_PLUGINS)
+    if args.api or browserless:
+        # API-only runs never touch a browser
+        disabled.extend(["playwright", "asyncio"])
+    if not args.html_report:
+        disabled.append("html")
+    
+    plugin_options = []
+    for name in disabled:
+        plugin_options.extend(["-p", f"no:{name}"])
+    return plugin_options
+
+
+def orchestrator_pools(args: argparse.Namespace, browsers: list) -> list:
+    """Build the API and UI worker pools for --orchestrate."""
+    from config.settings import get_settings
+    from utils.orchestrator import Pool, pool_size
+    
+    settings = get_settings()
+    suffix = " and smoke" if args.smoke else " and regression" if args.regression else ""
+    common = ["-q", "--tb=short"]
+    if args.test_file:
+        common.append(args.test_file)
+    if args.test_pattern:
+        common.extend(["-k", args.test_pattern])
+    if args.allure:
+        common.append("--alluredir=reports/allure-results")
+    
+    pools = []
+    if not args.ui:
+        # I/O-bound: several workers per core keep the requests in flight
+        workers = pool_size(args.api_workers or settings.api_workers, per_core=4)
+        api_args = [*plugin_args(args, browserless=True), "-m", "api" + suffix, *common]
+        pools.append(Pool("api", api_args, workers))
+    if not args.api:
+        # Browser-bound: one browser per worker, one worker per core
+        workers = pool_size(args.ui_workers or settings.ui_workers)
+        ui_args = [*plugin_args(args), "-m", "ui" + suffix, *common]
+        for browser in browsers:
+            ui_args.extend(["--browser", browser])
+        if args.headed:
+            ui_args.append("--headed")
+        pools.append(Pool("ui", ui_args, workers))
+    return pools
+
+
+def run_orchestrated(args: argparse.Namespace, browsers: list) -> bool:
+    """Run the API and UI suites side by side in their own worker pools."""
+    from utils.orchestrator import Orchestrator
+    
+    pools = orchestrator_pools(args, browsers)
+    print(f"\n🚀 Orchestrating {', '.join(f'{pool.name} ({pool.workers} workers)' for pool in pools)}")
+    print("Worker logs: reports/orchestrator/")
+    print("-" * 50)
+    return Orchestrator(pools).run()
+
+
 def main():
     """Main function to run tests."""
     parser = argparse.ArgumentParser(description="Playwright Test Runner")
@@ -66,12 +139,23 @@ def main():
     parser.add_argument("--regression", action="store_true", help="Run regression tests")
     
     # Browser options
-    parser.add_argument("--browser", choices=["chromium", "firefox", "webkit"], 
-                       default="chromium", help="Browser to use")
+    parser.add_argument("--browser", choices=BROWSERS + ["all"], action="append",
+                       help="Browser to use; repeat or pass 'all' to run every engine in one session "
+                            "(default: BROWSERS/BROWSER from .env)")
     parser.add_argument("--headed", action="store_true", help="Run in headed mode")
+    parser.add_argument("--reuse-browser", action="store_true",
+                       help="Connect to a persistent browser server (started on first use)")
     
     # Execution options
     parser.add_argument("--parallel", action="store_true", help="Run tests in parallel")
+    parser.add_argument("--orchestrate", action="store_true",
+                       help="Run API and UI suites simultaneously in separate worker pools")
+    parser.add_argument("--api-workers", type=int, default=0,
+                       help="API pool size for --orchestrate (default: API_WORKERS, else 4 per core)")
+    parser.add_argument("--ui-workers", type=int, default=0,
+                       help="UI pool size for --orchestrate (default: UI_WORKERS, else 1 per core)")
+    parser.add_argument("--profile", choices=["local", "ci", "load"],
+                       help="Settings profile (timeouts, concurrency, artifact policy)")
     parser.add_argument("--install", action="store_true", help="Install dependencies before running")
     parser.add_argument("--html-report", action="store_true", help="Generate HTML report")
     parser.add_argument("--allure", action="store_true", help="Generate Allure report")
@@ -96,9 +180,11 @@ def main():
     
     # Setup environment
     setup_environment()
+    if args.profile:
+        os.environ["TEST_PROFILE"] = args.profile
     
     # Build pytest command
-    cmd = [sys.executable, "-m", "pytest"]
+    cmd = [sys.executable, "-m", "pytest", *plugin_args(args)]
     
     # Test selection
     if args.ui:
@@ -118,19 +204,30 @@ def main():
     if args.test_pattern:
         cmd.extend(["-k", args.test_pattern])
     
-    # Browser options
-    cmd.extend(["--browser", args.browser])
-    if args.headed:
+    # Browser options - one pytest session fans out across all requested engines
+    browsers = [] if args.api else resolve_browsers(args.browser)
+    for browser in browsers:
+        cmd.extend(["--browser", browser])
+    if args.headed and not args.api:
         cmd.append("--headed")
     
-    # Parallel execution
+    # Parallel execution - worker count comes from the active settings profile
     if args.parallel:
-        cmd.extend(["-n", "auto"])
+        from config.settings import get_settings
+        
+        workers = get_settings().workers
+        cmd.extend(["-n", "auto" if workers == 0 else str(workers)])
+        # Items of classes marked isolated are spread individually, other classes stay together
+        cmd.extend(["--dist", "loadgroup"])
     
     # Debug mode
     if args.debug:
         cmd.extend(["-s", "-v", "--tb=short"])
         
+    # Persistent browser server
+    if args.reuse_browser:
+        os.environ["BROWSER_SERVER"] = "true"
+        
     # Video recording
     if args.video:
         os.environ["RECORD_VIDEOS"] = "true"
@@ -147,10 +244,15 @@ def main():
     
     # Run the tests
     print(f"\n🎭 Running Playwright Tests")
-    print(f"Browser: {args.browser}")
+    print(f"Browser: {', '.join(browsers) or 'from BROWSERS/BROWSER (default chromium)'}")
     print(f"Mode: {'Headed' if args.headed else 'Headless'}")
     
-    success = run_command(cmd, "Running tests")
+    if args.orchestrate:
+        if args.html_report:
+            print("⚠️  --html-report is not supported with --orchestrate; results are printed live")
+        success = run_orchestrated(args, browsers)
+    else:
+        success = run_command(cmd, "Running tests")
     
     # Generate Allure report if requested
     if args.allure and success:
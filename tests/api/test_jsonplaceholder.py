@@ -3,19 +3,58 @@ API tests for JSONPlaceholder API.
 """
 
 import pytest
+from pathlib import Path
 from api.jsonplaceholder_api import JSONPlaceholderAPI
+from api.schema import get_validator
+from config.settings import get_settings
+
+
+def make_client(cache: bool) -> JSONPlaceholderAPI:
+    """Create an API client.
+    
+    With API_CASSETTE_MODE set, traffic is recorded to or replayed from
+    a cassette instead of always going to the live API.
+    """
+    settings = get_settings()
+    client = JSONPlaceholderAPI()
+    if cache:
+        client.enable_cache(ttl_overrides={"/users*": 300})
+    if settings.api_cassette_mode != "off":
+        client.use_cassette(
+            Path(settings.api_cassette_dir) / "jsonplaceholder.json.gz",
+            settings.api_cassette_mode,
+            match=settings.api_cassette_match,
+            latency_ms=settings.api_cassette_latency_ms,
+        )
+    return client
+
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Create API client instance with an HTTP cache, pinning the user list.
+    
+    Module-scoped, so every worker process builds its own client. JSONPlaceholder
+    sends ``max-age``, so repeated GETs are served from the cache.
+    """
+    client = make_client(cache=True)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def live_client():
+    """Create API client instance without a cache, for measuring the API itself."""
+    client = make_client(cache=False)
+    yield client
+    client.close()
 
 
 @pytest.mark.api
 @pytest.mark.smoke
+@pytest.mark.isolated
 class TestJSONPlaceholderAPI:
     """Test cases for JSONPlaceholder API."""
     
-    @pytest.fixture(scope="class")
-    def api_client(self):
-        """Create API client instance."""
-        return JSONPlaceholderAPI()
-        
     def test_get_all_posts(self, api_client):
         """Test getting all posts."""
         posts = api_client.get_posts()
@@ -24,12 +63,8 @@ class TestJSONPlaceholderAPI:
         assert isinstance(posts, list)
         assert len(posts) == 100  # JSONPlaceholder has 100 posts
         
-        # Verify post structure
-        first_post = posts[0]
-        assert "id" in first_post
-        assert "title" in first_post
-        assert "body" in first_post
-        assert "userId" in first_post
+        # Verify structure of every post
+        api_client.validate_schema(posts, "posts")
         
     def test_get_posts_by_user(self, api_client):
         """Test getting posts by specific user."""
@@ -127,12 +162,18 @@ class TestJSONPlaceholderAPI:
         assert isinstance(users, list)
         assert len(users) == 10  # JSONPlaceholder has 10 users
         
-        # Verify user structure
-        first_user = users[0]
-        required_fields = ["id", "name", "username", "email"]
-        for field in required_fields:
-            assert field in first_user
+        # Verify structure of every user
+        api_client.validate_schema(users, "users")
             
+    def test_users_are_cached(self, api_client):
+        """Test that repeated user lookups are served from the cache."""
+        first = api_client.get("/users")
+        second = api_client.get("/users")
+        
+        assert second.from_cache
+        assert second.json() == first.json()
+        assert api_client.cache.stats.hits >= 1
+        
     def test_get_single_user(self, api_client):
         """Test getting a single user by ID."""
         user_id = 1
@@ -140,11 +181,7 @@ class TestJSONPlaceholderAPI:
         
         # Verify user data
         assert user["id"] == user_id
-        assert "name" in user
-        assert "username" in user
-        assert "email" in user
-        assert "address" in user
-        assert "company" in user
+        api_client.validate_schema(user, "user")
         
     def test_get_comments(self, api_client):
         """Test getting comments."""
@@ -154,11 +191,8 @@ class TestJSONPlaceholderAPI:
         assert isinstance(comments, list)
         assert len(comments) > 0
         
-        # Verify comment structure
-        first_comment = comments[0]
-        required_fields = ["id", "name", "email", "body", "postId"]
-        for field in required_fields:
-            assert field in first_comment
+        # Verify structure of every comment
+        api_client.validate_schema(comments, "comments")
             
     def test_get_comments_by_post(self, api_client):
         """Test getting comments for a specific post."""
@@ -180,11 +214,8 @@ class TestJSONPlaceholderAPI:
         assert isinstance(albums, list)
         assert len(albums) > 0
         
-        # Verify album structure
-        first_album = albums[0]
-        required_fields = ["id", "title", "userId"]
-        for field in required_fields:
-            assert field in first_album
+        # Verify structure of every album
+        api_client.validate_schema(albums, "albums")
             
     def test_get_photos(self, api_client):
         """Test getting photos."""
@@ -194,22 +225,56 @@ class TestJSONPlaceholderAPI:
         assert isinstance(photos, list)
         assert len(photos) > 0
         
-        # Verify photo structure
-        first_photo = photos[0]
-        required_fields = ["id", "title", "url", "thumbnailUrl", "albumId"]
-        for field in required_fields:
-            assert field in first_photo
+        # Verify structure of every photo
+        api_client.validate_schema(photos, "photos")
+            
+    def test_stream_photos(self, api_client):
+        """Test streaming photos record by record."""
+        validator = get_validator("photo")
+        count = 0
+        albums = set()
+        
+        for photo in api_client.iter_photos():
+            validator.validate(photo)
+            albums.add(photo["albumId"])
+            count += 1
             
+        assert count == 5000  # JSONPlaceholder has 5000 photos
+        assert len(albums) == 100
+        
+    def test_stream_comments_by_post(self, api_client):
+        """Test streaming comments for a specific post."""
+        post_id = 1
+        comments = list(api_client.iter_comments(post_id=post_id))
+        
+        assert len(comments) > 0
+        assert all(comment["postId"] == post_id for comment in comments)
+        
+    def test_iter_collection(self, api_client):
+        """Test reading a collection page by page."""
+        comments = list(api_client.iter_collection("/comments", page_size=100))
+        
+        assert len(comments) == 500  # JSONPlaceholder has 500 comments
+        assert [comment["id"] for comment in comments] == list(range(1, 501))
+        
+    def test_get_posts_many(self, api_client):
+        """Test getting several posts by ID in one call."""
+        post_ids = [42, 7, 99, 7]
+        posts = api_client.get_posts_many(post_ids)
+        
+        assert [post["id"] for post in posts] == post_ids
+        api_client.validate_schema(posts, "posts")
+        
     @pytest.mark.slow
-    def test_api_response_times(self, api_client):
-        """Test API response times are reasonable."""
+    def test_api_response_times(self, live_client):
+        """Test API response times are reasonable (uncached, so the API is measured)."""
         import time
         
         # Test multiple endpoints for performance
         endpoints_to_test = [
-            lambda: api_client.get_posts(),
-            lambda: api_client.get_users(),
-            lambda: api_client.get_comments(),
+            lambda: live_client.get_posts(),
+            lambda: live_client.get_users(),
+            lambda: live_client.get_comments(),
         ]
         
         for endpoint in endpoints_to_test:
@@ -0,0 +1,41 @@
+"""
+Fixtures for UI tests driven through ``playwright.async_api``.
+
+Kept next to the UI tests rather than in the root conftest, so sessions that
+only collect ``tests/api`` never import pytest-asyncio or the async API.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
+
+import pytest_asyncio
+from playwright.async_api import async_playwright
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext
+
+    from config.settings import Settings
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_context(
+    browser_name: str, settings: Settings, connect_options: Optional[dict]
+) -> AsyncGenerator[BrowserContext, None]:
+    """Browser context driven through ``playwright.async_api`` for asyncio tests.
+
+    Async tests must only use async fixtures: the sync ``page``/``context``
+    fixtures run their own event loop and cannot share a test with this one.
+    """
+    async with async_playwright() as playwright:
+        browser_type = getattr(playwright, browser_name)
+        if connect_options:
+            browser = await browser_type.connect(**connect_options)
+        else:
+            browser = await browser_type.launch(**settings.get_browser_args())
+        context = await browser.new_context(**settings.get_context_args())
+
+        yield context
+
+        await context.close()
+        await browser.close()
@@ -0,0 +1,54 @@
+"""
+Concurrent SauceDemo tests driving many pages from one process with asyncio.
+"""
+
+import asyncio
+
+import pytest
+from playwright.async_api import BrowserContext
+
+from pages.aio import saucedemo  # noqa: F401  (registers async SauceDemo page objects)
+from pages.aio import AsyncPageRegistry, open_pages
+
+CONCURRENT_PAGES = 10
+
+
+async def login_and_count_products(pages: AsyncPageRegistry) -> int:
+    """Log in as the standard user and count the listed products."""
+    await pages.login.open()
+    await pages.login.login_with_standard_user()
+    assert await pages.inventory.is_loaded()
+    return await pages.inventory.get_products_count()
+
+
+@pytest.mark.ui
+@pytest.mark.saucedemo
+@pytest.mark.isolated
+@pytest.mark.asyncio
+class TestSauceDemoAsync:
+    """Test cases running SauceDemo flows on concurrent pages."""
+
+    async def test_concurrent_logins(self, async_context: BrowserContext):
+        """Test that every concurrent page logs in and lists the inventory."""
+        registries = await open_pages(async_context, CONCURRENT_PAGES)
+
+        counts = await asyncio.gather(
+            *(login_and_count_products(pages) for pages in registries)
+        )
+
+        assert counts == [6] * CONCURRENT_PAGES
+
+    async def test_locked_user_rejected_on_every_page(
+        self, async_context: BrowserContext
+    ):
+        """Test that the locked out user sees the error on each concurrent page."""
+        registries = await open_pages(async_context, CONCURRENT_PAGES)
+
+        async def attempt(pages: AsyncPageRegistry) -> str:
+            await pages.login.open()
+            await pages.login.login_with_locked_user()
+            return await pages.login.get_error_message()
+
+        messages = await asyncio.gather(*(attempt(pages) for pages in registries))
+
+        assert all("locked out" in message for message in messages)
@@ -1,303 +1,166 @@
 """
 Advanced Security Injection Tests for SauceDemo Login.
+
+Payload tests are parametrized from the corpus (``@pytest.mark.payloads``), so
+every payload is its own item with its own browser context and xdist can
+spread them across workers.
 """
 
 import pytest
-from playwright.sync_api import Page
-from pages.saucedemo.login_page import LoginPage
+from dataclasses import replace
+from loguru import logger
+from config.settings import Settings
+from pages.saucedemo import LoginPage
+from utils.fuzzer import Fuzzer, LoginTarget
+from utils.leak_scanner import get_scanner
+from utils.matrix_planner import LOGIN_FIELDS, MatrixPlanner, login_credentials
+from utils.payload_corpus import PayloadCorpus
+from utils.security_payloads import generate_buffer_payload
+from utils.timing_analysis import TimingAnalyzer
+from utils.xss_sentinel import XssSentinel
+
+
+def attempt_login(login_page: LoginPage, username: str, password: str = "password") -> None:
+    """Submit one login attempt and dismiss the resulting error."""
+    login_page.clear_username()
+    login_page.clear_password()
+    login_page.login(username, password)
+    if login_page.is_error_displayed():
+        login_page.close_error_message()
 
 
 @pytest.mark.ui
 @pytest.mark.saucedemo
 @pytest.mark.security
+@pytest.mark.isolated
 class TestSauceDemoSecurity:
     """Advanced security testing for SauceDemo login functionality."""
     
-    @pytest.fixture(autouse=True)
-    def setup(self, page: Page):
-        """Setup for each test."""
-        self.login_page = LoginPage(page)
-        self.login_page.open()
-        
     # ========== SQL INJECTION TESTS ==========
     
-    def test_sql_injection_basic_or(self, page: Page):
+    @pytest.mark.payloads(category="sql_injection", subcategory="basic_or")
+    def test_sql_injection_basic_or(self, login_page: LoginPage, payload: str):
         """Test basic SQL injection with OR clause."""
-        payloads = [
-            "admin' OR '1'='1",
-            "admin' OR '1'='1' --",
-            "admin' OR '1'='1' #",
-            "admin' OR 1=1 --",
-            "' OR '1'='1",
-            "' OR 1=1 --",
-            "admin'/**/OR/**/1=1",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            # Should show error, not bypass authentication
-            assert self.login_page.is_error_displayed(), f"SQL injection not blocked: {payload}"
-            
-            # Close error for next test
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        # Should show error, not bypass authentication
+        assert login_page.is_error_displayed(), f"SQL injection not blocked: {payload}"
     
-    def test_sql_injection_union_attacks(self, page: Page):
+    @pytest.mark.payloads(category="sql_injection", subcategory="union")
+    def test_sql_injection_union_attacks(self, login_page: LoginPage, payload: str):
         """Test UNION-based SQL injection attacks."""
-        payloads = [
-            "admin' UNION SELECT 1,2,3 --",
-            "admin' UNION SELECT NULL,NULL,NULL --",
-            "admin' UNION ALL SELECT 1,2,3 --",
-            "' UNION SELECT username,password FROM users --",
-            "admin' UNION SELECT @@version --",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            assert self.login_page.is_error_displayed(), f"UNION injection not blocked: {payload}"
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        assert login_page.is_error_displayed(), f"UNION injection not blocked: {payload}"
     
-    def test_sql_injection_time_based(self, page: Page):
+    @pytest.mark.payloads(category="sql_injection", subcategory="time_based")
+    def test_sql_injection_time_based(self, login_page: LoginPage, payload: str, settings: Settings):
         """Test time-based blind SQL injection."""
-        payloads = [
-            "admin'; WAITFOR DELAY '00:00:05' --",
-            "admin' AND (SELECT COUNT(*) FROM sysobjects) > 0 WAITFOR DELAY '00:00:05' --",
-            "admin'; SELECT SLEEP(5) --",
-            "admin' AND SLEEP(5) --",
-            "admin'; pg_sleep(5) --",
-        ]
+        analyzer = TimingAnalyzer(threshold_ms=3000, seed=settings.payload_seed)
         
-        for payload in payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            
-            import time
-            start_time = time.time()
-            self.login_page.login(payload, "password")
-            end_time = time.time()
-            
-            # Should not cause significant delay (time-based injection blocked)
-            assert (end_time - start_time) < 3, f"Possible time-based injection: {payload}"
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        # Interleaved payload/control logins until the delay is (not) significant
+        verdict = analyzer.compare(
+            lambda: attempt_login(login_page, payload),
+            lambda: attempt_login(login_page, "admin"),
+        )
+        
+        # Should not cause significant delay (time-based injection blocked)
+        assert not verdict.slower, f"Possible time-based injection: {payload} ({verdict})"
     
-    def test_sql_injection_error_based(self, page: Page):
+    @pytest.mark.payloads(category="sql_injection", subcategory="error_based")
+    def test_sql_injection_error_based(self, login_page: LoginPage, payload: str):
         """Test error-based SQL injection."""
-        payloads = [
-            "admin' AND EXTRACTVALUE(1, CONCAT(0x7e, (SELECT version()), 0x7e)) --",
-            "admin' AND (SELECT * FROM (SELECT COUNT(*),CONCAT(version(),FLOOR(RAND(0)*2))x FROM information_schema.tables GROUP BY x)a) --",
-            "admin' AND 1=CONVERT(int,(SELECT @@version)) --",
-            "admin' AND 1=CAST((SELECT @@version) AS int) --",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            # Should not reveal database errors
-            if self.login_page.is_error_displayed():
-                error_text = self.login_page.get_error_message()
-                # Check that error doesn't contain database-specific information
-                sensitive_keywords = ['mysql', 'sql', 'database', 'table', 'column', 'syntax', 'version']
-                for keyword in sensitive_keywords:
-                    assert keyword.lower() not in error_text.lower(), f"Database info leaked: {keyword} in {error_text}"
-                
-                self.login_page.close_error_message()
+        # Should not reveal database errors
+        if login_page.is_error_displayed():
+            error_text = login_page.get_error_message().replace(payload, "")
+            leaks = get_scanner(frozenset({"database"})).terms_in(error_text)
+            assert not leaks, f"Database info leaked: {leaks} in {error_text}"
     
     # ========== XSS (Cross-Site Scripting) TESTS ==========
     
-    def test_xss_script_injection(self, page: Page):
+    @pytest.mark.payloads(2, category="xss")
+    def test_xss_script_injection(self, login_page: LoginPage, payload: str, xss_sentinel: XssSentinel):
         """Test XSS script injection in login fields."""
-        xss_payloads = [
-            "<script>alert('XSS')</script>",
-            "<script>document.location='http://evil.com'</script>",
-            "<img src=x onerror=alert('XSS')>",
-            "<svg onload=alert('XSS')>",
-            "javascript:alert('XSS')",
-            "<iframe src=javascript:alert('XSS')></iframe>",
-            "<body onload=alert('XSS')>",
-            "<input onfocus=alert('XSS') autofocus>",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in xss_payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            # Check that no alert dialog appeared (XSS was blocked)
-            try:
-                # If XSS executed, there might be an alert dialog
-                page.wait_for_function("window.alert", timeout=1000)
-                assert False, f"XSS payload executed: {payload}"
-            except:
-                # Good - no alert means XSS was blocked
-                pass
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        # Dialogs, marked code sinks, injected scripts and navigations are all recorded by the sentinel
+        events = xss_sentinel.drain()
+        assert not events, f"XSS payload executed: {payload}: {[str(event) for event in events]}"
     
-    def test_xss_attribute_injection(self, page: Page):
+    @pytest.mark.payloads(category="xss", subcategory="attribute_injection")
+    def test_xss_attribute_injection(self, login_page: LoginPage, payload: str, xss_sentinel: XssSentinel):
         """Test XSS through HTML attribute injection."""
-        payloads = [
-            "\" onmouseover=\"alert('XSS')\"",
-            "' onclick='alert(\"XSS\")'",
-            "\" autofocus onfocus=\"alert('XSS')\"",
-            "' style='expression(alert(\"XSS\"))'",
-            "\" href=\"javascript:alert('XSS')\"",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            # Verify payload doesn't get executed as HTML attributes
-            username_value = self.login_page.get_username_value()
-            # Value should be properly escaped/sanitized
-            assert "<" not in username_value or ">" not in username_value or payload != username_value
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        # Verify payload doesn't get executed as HTML attributes
+        username_value = login_page.get_username_value()
+        # Value should be properly escaped/sanitized
+        assert "<" not in username_value or ">" not in username_value or payload != username_value
+        
+        events = xss_sentinel.drain()
+        assert not events, f"XSS payload executed: {payload}: {[str(event) for event in events]}"
     
     # ========== LDAP INJECTION TESTS ==========
     
-    def test_ldap_injection(self, page: Page):
+    @pytest.mark.payloads(category="ldap_injection")
+    def test_ldap_injection(self, login_page: LoginPage, payload: str):
         """Test LDAP injection attacks."""
-        ldap_payloads = [
-            "admin)(&)",
-            "admin)(|(objectClass=*))",
-            "admin))(|(objectClass=*",
-            "*)(&(objectClass=*",
-            "admin)(&(objectClass=*)(objectClass=*))",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in ldap_payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            assert self.login_page.is_error_displayed(), f"LDAP injection not blocked: {payload}"
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        assert login_page.is_error_displayed(), f"LDAP injection not blocked: {payload}"
     
     # ========== COMMAND INJECTION TESTS ==========
     
-    def test_command_injection(self, page: Page):
+    @pytest.mark.payloads(category="command_injection")
+    def test_command_injection(self, login_page: LoginPage, payload: str):
         """Test OS command injection attacks."""
-        command_payloads = [
-            "admin; cat /etc/passwd",
-            "admin && dir",
-            "admin | whoami",
-            "admin`id`",
-            "admin$(whoami)",
-            "admin; ls -la",
-            "admin & net user",
-            "admin || ping 127.0.0.1",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in command_payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            assert self.login_page.is_error_displayed(), f"Command injection not blocked: {payload}"
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        assert login_page.is_error_displayed(), f"Command injection not blocked: {payload}"
     
     # ========== PATH TRAVERSAL TESTS ==========
     
-    def test_path_traversal(self, page: Page):
+    @pytest.mark.payloads(category="path_traversal")
+    def test_path_traversal(self, login_page: LoginPage, payload: str):
         """Test path traversal attacks."""
-        traversal_payloads = [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32\\drivers\\etc\\hosts",
-            "....//....//....//etc/passwd",
-            "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",
-            "..%252f..%252f..%252fetc%252fpasswd",
-            "..%c0%af..%c0%af..%c0%afetc%c0%afpasswd",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in traversal_payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            assert self.login_page.is_error_displayed(), f"Path traversal not blocked: {payload}"
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        assert login_page.is_error_displayed(), f"Path traversal not blocked: {payload}"
     
     # ========== FORMAT STRING TESTS ==========
     
-    def test_format_string_injection(self, page: Page):
+    @pytest.mark.payloads(category="format_string")
+    def test_format_string_injection(self, login_page: LoginPage, payload: str):
         """Test format string injection attacks."""
-        format_payloads = [
-            "%s%s%s%s%s%s%s%s%s%s%s%s",
-            "%x%x%x%x%x%x%x%x%x%x%x%x",
-            "%n%n%n%n%n%n%n%n%n%n%n%n",
-            "%08x.%08x.%08x.%08x.%08x",
-            "AAAA%08x.%08x.%08x.%08x.%08x",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in format_payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            assert self.login_page.is_error_displayed(), f"Format string injection not blocked: {payload}"
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        assert login_page.is_error_displayed(), f"Format string injection not blocked: {payload}"
     
     # ========== NULL BYTE INJECTION TESTS ==========
     
-    def test_null_byte_injection(self, page: Page):
+    @pytest.mark.payloads(category="null_byte")
+    def test_null_byte_injection(self, login_page: LoginPage, payload: str):
         """Test null byte injection attacks."""
-        null_payloads = [
-            "admin\x00",
-            "admin%00",
-            "admin\u0000password",
-            "admin%00.txt",
-            "admin\x00\x00\x00",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in null_payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            # Should handle null bytes gracefully
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        # Should handle null bytes gracefully, without raising
     
     # ========== OVERFLOW TESTS ==========
     
-    def test_buffer_overflow_simulation(self, page: Page):
+    @pytest.mark.parametrize("size, charset", [("10KB", "repeat"), ("1MB", "printable"), ("1MB", "unicode")])
+    def test_buffer_overflow_simulation(self, login_page: LoginPage, size: str, charset: str):
         """Test extremely long inputs to check for buffer overflow protection."""
-        # Generate very long string
-        long_string = "A" * 10000
-        
-        self.login_page.clear_username()
-        self.login_page.clear_password()
+        # Generated on demand, filled in chunks above the fill() threshold
+        long_string = generate_buffer_payload(size, charset)
         
         try:
-            self.login_page.login(long_string, "password")
+            login_page.login(long_string, "password")
             
             # Should handle gracefully, not crash
-            if self.login_page.is_error_displayed():
-                error_text = self.login_page.get_error_message()
+            if login_page.is_error_displayed():
+                error_text = login_page.get_error_message()
                 # Should not reveal internal errors
                 assert "buffer" not in error_text.lower()
                 assert "overflow" not in error_text.lower()
@@ -308,55 +171,76 @@ class TestSauceDemoSecurity:
     
     # ========== ENCODING BYPASS TESTS ==========
     
-    def test_encoding_bypass(self, page: Page):
+    @pytest.mark.payloads(2, category="encoding_bypass", stratify="encoding")
+    def test_encoding_bypass(self, login_page: LoginPage, payload: str):
         """Test various encoding bypass techniques."""
-        encoded_payloads = [
-            # URL encoding
-            "%27%20OR%20%271%27%3D%271",  # ' OR '1'='1
-            "%3Cscript%3Ealert%28%27XSS%27%29%3C/script%3E",  # <script>alert('XSS')</script>
-            
-            # Double URL encoding  
-            "%2527%2520OR%2520%25271%2527%253D%25271",
-            
-            # Unicode encoding
-            "\u0027\u0020OR\u0020\u0027\u0031\u0027\u003D\u0027\u0031",
-            
-            # HTML entity encoding
-            "&#39; OR &#39;1&#39;=&#39;1",
-            "&lt;script&gt;alert(&#39;XSS&#39;)&lt;/script&gt;",
-        ]
+        login_page.login(payload, "password")
         
-        for payload in encoded_payloads:
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(payload, "password")
-            
-            # Encoded payloads should not bypass security
-            assert self.login_page.is_error_displayed(), f"Encoding bypass successful: {payload}"
-            
-            if self.login_page.is_error_displayed():
-                self.login_page.close_error_message()
+        # Encoded payloads should not bypass security
+        assert login_page.is_error_displayed(), f"Encoding bypass successful: {payload}"
+    
+    # ========== FUZZING TESTS ==========
+    
+    @pytest.mark.slow
+    def test_login_fuzzing(self, login_page: LoginPage, payload_corpus: PayloadCorpus, settings: Settings):
+        """Test that feedback-guided fuzzing of the username never bypasses login."""
+        seeds = [entry.payload for entry in payload_corpus.sample(1, category="sql_injection")]
+        
+        report = Fuzzer(seed=settings.payload_seed).run(LoginTarget(login_page), seeds, budget=40)
+        
+        bypasses = [result.payload for result in report.results if result.signature.outcome.startswith("navigated:")]
+        assert not bypasses, f"Fuzzed inputs bypassed login: {bypasses[:5]}"
+        leaks = {result.payload: sorted(result.signature.leaks) for result in report.leaks()}
+        assert not leaks, f"Fuzzed inputs leaked sensitive data: {leaks}"
+    
+    # ========== COMBINATORIAL TESTS ==========
+    
+    @pytest.mark.slow
+    def test_login_matrix(self, login_page: LoginPage, payload_corpus: PayloadCorpus, settings: Settings, xss_sentinel: XssSentinel):
+        """Test payload classes x fields x personas with pairwise coverage and pruning."""
+        representatives = {}
+        for category in payload_corpus.strata("category"):
+            for entry in payload_corpus.sample(2, category=category):
+                representatives.setdefault(f"{category}/{entry.subcategory}", []).append(entry.payload)
+        personas = {**LoginPage.valid_users, LoginPage.locked_user: LoginPage.password}
+        matrix = MatrixPlanner(
+            representatives,
+            {"field": LOGIN_FIELDS, "persona": tuple(personas)},
+            seed=settings.payload_seed,
+        )
+        target = LoginTarget(login_page)
+        
+        for case in matrix:
+            signature = target.submit(*login_credentials(case, personas), case.payload)
+            assert not signature.outcome.startswith("navigated:"), f"Login bypassed: {case}"
+            assert not signature.leaks, f"Sensitive data leaked ({sorted(signature.leaks)}): {case}"
+            events = xss_sentinel.drain()
+            assert not events, f"XSS executed: {case}: {[str(event) for event in events]}"
+            # Timing is too noisy to tell equivalence classes apart
+            matrix.record(case, replace(signature, timing_bucket=0))
+        
+        logger.info(matrix.summary())
     
     # ========== RATE LIMITING TESTS ==========
     
     @pytest.mark.slow
-    def test_brute_force_protection(self, page: Page):
+    def test_brute_force_protection(self, login_page: LoginPage):
         """Test protection against brute force attacks."""
         # Attempt multiple failed logins rapidly
         for i in range(10):
-            self.login_page.clear_username()
-            self.login_page.clear_password()
-            self.login_page.login(f"hacker{i}", f"wrongpass{i}")
+            login_page.clear_username()
+            login_page.clear_password()
+            login_page.login(f"hacker{i}", f"wrongpass{i}")
             
-            if self.login_page.is_error_displayed():
-                error_text = self.login_page.get_error_message()
+            if login_page.is_error_displayed():
+                error_text = login_page.get_error_message()
                 
                 # Check if account gets locked or rate limited
                 if "locked" in error_text.lower() or "too many" in error_text.lower():
                     print(f"✅ Rate limiting detected after {i+1} attempts")
                     break
                     
-                self.login_page.close_error_message()
+                login_page.close_error_message()
             
             # Small delay between attempts
-            page.wait_for_timeout(100) 
\ No newline at end of file
+            login_page.page.wait_for_timeout(100) 
\ No newline at end of file
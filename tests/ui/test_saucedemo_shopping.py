@@ -4,47 +4,52 @@ Shopping flow tests for SauceDemo website.
 
 import pytest
 from playwright.sync_api import Page
-from pages.saucedemo.login_page import LoginPage
-from pages.saucedemo.inventory_page import InventoryPage
-from pages.saucedemo.cart_page import CartPage
+from pages.registry import PageRegistry
+from utils.state_seeding import AppState
+
+BACKPACK = "Sauce Labs Backpack"
+BIKE_LIGHT = "Sauce Labs Bike Light"
 
 
 @pytest.mark.ui
 @pytest.mark.saucedemo
+@pytest.mark.isolated
 class TestSauceDemoShopping:
     """Test cases for SauceDemo shopping functionality."""
     
     @pytest.fixture(autouse=True)
-    def setup(self, page: Page):
-        """Setup for each test - login before each test."""
-        self.login_page = LoginPage(page)
-        self.inventory_page = InventoryPage(page)
-        self.cart_page = CartPage(page)
-        
-        # Login before each test
-        self.login_page.open()
-        self.login_page.login_with_standard_user()
-        assert self.inventory_page.is_loaded()
+    def setup(self, request, pages: PageRegistry, seed_state):
+        """Setup for each test - seed a logged-in session and open the page under test.
+        
+        ``@pytest.mark.app_state(cart=(...), start="cart")`` seeds cart contents
+        and picks the start page (inventory by default).
+        """
+        marker = request.node.get_closest_marker("app_state")
+        options = dict(marker.kwargs) if marker else {}
+        start_page = pages.get(options.pop("start", "inventory"))
+        seed_state(AppState(username="standard_user", **options))
+        start_page.open()
+        assert start_page.is_loaded()
         
     @pytest.mark.smoke
-    def test_inventory_page_elements(self, page: Page):
+    def test_inventory_page_elements(self, pages: PageRegistry):
         """Test inventory page displays all required elements."""
         # Check products are displayed
-        assert self.inventory_page.get_products_count() == 6
+        assert pages.inventory.get_products_count() == 6
         
         # Check cart icon is visible
-        assert self.inventory_page.is_visible(self.inventory_page.cart_icon)
+        assert pages.inventory.eventually_visible(pages.inventory.cart_icon)
         
         # Check sort dropdown is visible
-        assert self.inventory_page.is_visible(self.inventory_page.sort_dropdown)
+        assert pages.inventory.eventually_visible(pages.inventory.sort_dropdown)
         
         # Check hamburger menu is visible
-        assert self.inventory_page.is_visible(self.inventory_page.hamburger_menu)
+        assert pages.inventory.eventually_visible(pages.inventory.hamburger_menu)
         
-    def test_product_information_display(self, page: Page):
+    def test_product_information_display(self, pages: PageRegistry):
         """Test that all product information is displayed correctly."""
         # Get product names and verify they exist
-        product_names = self.inventory_page.get_product_names()
+        product_names = pages.inventory.get_product_names()
         assert len(product_names) == 6
         
         expected_products = [
@@ -60,7 +65,7 @@ class TestSauceDemoShopping:
             assert product in product_names
             
         # Get product prices and verify format
-        product_prices = self.inventory_page.get_product_prices()
+        product_prices = pages.inventory.get_product_prices()
         assert len(product_prices) == 6
         
         for price in product_prices:
@@ -68,67 +73,67 @@ class TestSauceDemoShopping:
             assert "." in price  # Check decimal format
             
     @pytest.mark.smoke
-    def test_add_single_product_to_cart(self, page: Page):
+    def test_add_single_product_to_cart(self, pages: PageRegistry):
         """Test adding a single product to cart."""
         # Add backpack to cart
-        self.inventory_page.add_backpack_to_cart()
+        pages.inventory.add_backpack_to_cart()
         
         # Verify cart badge shows 1 item
-        assert self.inventory_page.get_cart_items_count() == 1
+        assert pages.inventory.get_cart_items_count() == 1
         
         # Verify product was added to cart
-        assert self.inventory_page.is_product_added_to_cart(0)
+        assert pages.inventory.is_product_added_to_cart(0)
         
-    def test_add_multiple_products_to_cart(self, page: Page):
+    def test_add_multiple_products_to_cart(self, pages: PageRegistry):
         """Test adding multiple products to cart."""
         # Add multiple products
-        self.inventory_page.add_backpack_to_cart()
-        self.inventory_page.add_bike_light_to_cart()
-        self.inventory_page.add_tshirt_to_cart()
+        pages.inventory.add_backpack_to_cart()
+        pages.inventory.add_bike_light_to_cart()
+        pages.inventory.add_tshirt_to_cart()
         
         # Verify cart badge shows 3 items
-        assert self.inventory_page.get_cart_items_count() == 3
+        assert pages.inventory.get_cart_items_count() == 3
         
-    def test_add_all_products_to_cart(self, page: Page):
+    def test_add_all_products_to_cart(self, pages: PageRegistry):
         """Test adding all products to cart."""
         # Add all products
-        self.inventory_page.add_all_products_to_cart()
+        pages.inventory.add_all_products_to_cart()
         
         # Verify all products were added (should be 6, but may vary based on site behavior)
-        cart_count = self.inventory_page.get_cart_items_count()
+        cart_count = pages.inventory.get_cart_items_count()
         assert cart_count >= 3, f"Expected at least 3 items in cart, got {cart_count}"
         
-    def test_sort_products_by_name_ascending(self, page: Page):
+    def test_sort_products_by_name_ascending(self, pages: PageRegistry):
         """Test sorting products by name A-Z."""
         # Sort by name ascending
-        self.inventory_page.sort_by_name_asc()
+        pages.inventory.sort_by_name_asc()
         
         # Get product names after sorting
-        sorted_names = self.inventory_page.get_product_names()
+        sorted_names = pages.inventory.get_product_names()
         
         # Verify they are in alphabetical order
         expected_order = sorted(sorted_names)
         assert sorted_names == expected_order
         
-    def test_sort_products_by_name_descending(self, page: Page):
+    def test_sort_products_by_name_descending(self, pages: PageRegistry):
         """Test sorting products by name Z-A."""
         # Sort by name descending
-        self.inventory_page.sort_by_name_desc()
+        pages.inventory.sort_by_name_desc()
         
         # Get product names after sorting
-        sorted_names = self.inventory_page.get_product_names()
+        sorted_names = pages.inventory.get_product_names()
         
         # Verify they are in reverse alphabetical order
         expected_order = sorted(sorted_names, reverse=True)
         assert sorted_names == expected_order
         
-    def test_sort_products_by_price_low_to_high(self, page: Page):
+    def test_sort_products_by_price_low_to_high(self, pages: PageRegistry):
         """Test sorting products by price low to high."""
         # Sort by price low to high
-        self.inventory_page.sort_by_price_low_high()
+        pages.inventory.sort_by_price_low_high()
         
         # Get prices after sorting
-        sorted_prices = self.inventory_page.get_product_prices()
+        sorted_prices = pages.inventory.get_product_prices()
         
         # Convert to float for comparison (remove $ and convert)
         price_values = [float(price.replace("$", "")) for price in sorted_prices]
@@ -136,13 +141,13 @@ class TestSauceDemoShopping:
         # Verify they are in ascending order
         assert price_values == sorted(price_values)
         
-    def test_sort_products_by_price_high_to_low(self, page: Page):
+    def test_sort_products_by_price_high_to_low(self, pages: PageRegistry):
         """Test sorting products by price high to low."""
         # Sort by price high to low
-        self.inventory_page.sort_by_price_high_low()
+        pages.inventory.sort_by_price_high_low()
         
         # Get prices after sorting
-        sorted_prices = self.inventory_page.get_product_prices()
+        sorted_prices = pages.inventory.get_product_prices()
         
         # Convert to float for comparison
         price_values = [float(price.replace("$", "")) for price in sorted_prices]
@@ -151,105 +156,83 @@ class TestSauceDemoShopping:
         assert price_values == sorted(price_values, reverse=True)
         
     @pytest.mark.smoke
-    def test_view_cart_with_items(self, page: Page):
+    @pytest.mark.app_state(cart=(BACKPACK, BIKE_LIGHT), start="cart")
+    def test_view_cart_with_items(self, pages: PageRegistry):
         """Test viewing cart with items."""
-        # Add some products to cart
-        self.inventory_page.add_backpack_to_cart()
-        self.inventory_page.add_bike_light_to_cart()
-        
-        # Go to cart
-        self.inventory_page.click_cart()
-        
-        # Verify we're on cart page
-        assert self.cart_page.is_loaded()
+        # Verify cart contains the seeded items
+        assert pages.cart.get_cart_items_count() == 2
         
-        # Verify cart contains the items
-        assert self.cart_page.get_cart_items_count() == 2
+        cart_item_names = pages.cart.get_cart_item_names()
+        assert sorted(cart_item_names) == [BACKPACK, BIKE_LIGHT]
         
-        cart_item_names = self.cart_page.get_cart_item_names()
-        assert "Sauce Labs Backpack" in cart_item_names
-        # Check that we have 2 items total, regardless of which specific items
-        assert len(cart_item_names) == 2
-        
-    def test_remove_item_from_cart(self, page: Page):
+    @pytest.mark.app_state(cart=(BACKPACK, BIKE_LIGHT), start="cart")
+    def test_remove_item_from_cart(self, pages: PageRegistry):
         """Test removing items from cart."""
-        # Add items to cart
-        self.inventory_page.add_backpack_to_cart()
-        self.inventory_page.add_bike_light_to_cart()
-        
-        # Go to cart
-        self.inventory_page.click_cart()
-        assert self.cart_page.get_cart_items_count() == 2
+        assert pages.cart.get_cart_items_count() == 2
         
         # Remove one item
-        self.cart_page.remove_item_from_cart(0)
+        pages.cart.remove_item_from_cart(0)
         
         # Verify one item removed
-        assert self.cart_page.get_cart_items_count() == 1
+        assert pages.cart.get_cart_items_count() == 1
         
-    def test_continue_shopping_from_cart(self, page: Page):
+    @pytest.mark.app_state(cart=(BACKPACK,), start="cart")
+    def test_continue_shopping_from_cart(self, pages: PageRegistry):
         """Test continue shopping button in cart."""
-        # Add item and go to cart
-        self.inventory_page.add_backpack_to_cart()
-        self.inventory_page.click_cart()
-        
         # Click continue shopping
-        self.cart_page.continue_shopping()
+        pages.cart.continue_shopping()
         
         # Verify we're back on inventory page
-        assert self.inventory_page.is_loaded()
+        assert pages.inventory.is_loaded()
         
         # Verify cart still has item
-        assert self.inventory_page.get_cart_items_count() == 1
+        assert pages.inventory.get_cart_items_count() == 1
         
-    def test_empty_cart_behavior(self, page: Page):
+    @pytest.mark.app_state(start="cart")
+    def test_empty_cart_behavior(self, pages: PageRegistry):
         """Test behavior with empty cart."""
-        # Go to cart without adding items
-        self.inventory_page.click_cart()
-        
         # Verify cart is empty
-        assert self.cart_page.is_cart_empty()
-        assert self.cart_page.get_cart_items_count() == 0
+        assert pages.cart.is_cart_empty()
+        assert pages.cart.get_cart_items_count() == 0
         
         # Verify checkout button is still visible
-        assert self.cart_page.is_checkout_button_visible()
+        assert pages.cart.is_checkout_button_visible()
         
-    def test_logout_functionality(self, page: Page):
+    def test_logout_functionality(self, page: Page, pages: PageRegistry):
         """Test logout from inventory page."""
         # Logout
-        self.inventory_page.logout()
+        pages.inventory.logout()
         
         # Verify we're back on login page
-        assert self.login_page.is_logo_visible()
+        assert pages.login.is_logo_visible()
         assert "index.html" in page.url or page.url.endswith("/")
         
-    def test_cart_persistence_across_pages(self, page: Page):
+    @pytest.mark.app_state(cart=(BACKPACK, BIKE_LIGHT))
+    def test_cart_persistence_across_pages(self, pages: PageRegistry):
         """Test that cart items persist when navigating."""
-        # Add items to cart
-        self.inventory_page.add_backpack_to_cart()
-        self.inventory_page.add_bike_light_to_cart()
+        assert pages.inventory.get_cart_items_count() == 2
         
         # Go to cart and back
-        self.inventory_page.click_cart()
-        self.cart_page.continue_shopping()
+        pages.inventory.click_cart()
+        pages.cart.continue_shopping()
         
         # Verify cart count is still correct
-        assert self.inventory_page.get_cart_items_count() == 2
+        assert pages.inventory.get_cart_items_count() == 2
         
         # Go to cart again and verify items are there
-        self.inventory_page.click_cart()
-        assert self.cart_page.get_cart_items_count() == 2
+        pages.inventory.click_cart()
+        assert pages.cart.get_cart_items_count() == 2
         
     @pytest.mark.regression
-    def test_problem_user_shopping_experience(self, page: Page):
+    def test_problem_user_shopping_experience(self, pages: PageRegistry):
         """Test shopping with problem user (may have UI issues)."""
         # Logout and login with problem user
-        self.inventory_page.logout()
-        self.login_page.login_with_problem_user()
+        pages.inventory.logout()
+        pages.login.login_with_problem_user()
         
         # Try to add products (problem user may have issues)
         try:
-            self.inventory_page.add_backpack_to_cart()
+            pages.inventory.add_backpack_to_cart()
             # With problem user, images might be broken or other issues
             # This test documents the known issues
         except Exception as e:
@@ -257,15 +240,15 @@ class TestSauceDemoShopping:
             pytest.skip(f"Problem user has known issues: {e}")
             
     @pytest.mark.performance
-    def test_performance_user_shopping_experience(self, page: Page):
+    def test_performance_user_shopping_experience(self, pages: PageRegistry):
         """Test shopping with performance glitch user."""
         # Logout and login with performance user
-        self.inventory_page.logout()
-        self.login_page.login_with_performance_user()
+        pages.inventory.logout()
+        pages.login.login_with_performance_user()
         
         # Performance user may be slower but should work
-        assert self.inventory_page.is_loaded()
+        assert pages.inventory.is_loaded()
         
         # Add product (may be slower)
-        self.inventory_page.add_backpack_to_cart()
-        assert self.inventory_page.get_cart_items_count() == 1 
\ No newline at end of file
+        pages.inventory.add_backpack_to_cart()
+        assert pages.inventory.get_cart_items_count() == 1 
\ No newline at end of file
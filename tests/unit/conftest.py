@@ -0,0 +1,15 @@
+"""
+Fixtures shared by the offline unit tests.
+"""
+
+import pytest
+
+from utils import adaptive_timeouts
+
+
+@pytest.fixture(autouse=True)
+def latency_store(tmp_path, monkeypatch):
+    """Keep latency recorded by page objects on fake pages out of the real history."""
+    store = adaptive_timeouts.LatencyStore(tmp_path / "latency", adapt=False)
+    monkeypatch.setitem(adaptive_timeouts._store, "current", store)
+    return store
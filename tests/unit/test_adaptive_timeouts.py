@@ -0,0 +1,68 @@
+"""
+Unit tests for adaptive timeouts learned from action latency.
+"""
+
+import json
+
+import pytest
+
+from utils.adaptive_timeouts import LatencyStore
+
+
+@pytest.mark.unit
+class TestAdaptiveTimeouts:
+    """Test cases for the latency store and derived timeouts."""
+
+    def test_falls_back_to_static_default_without_history(self, tmp_path):
+        """Test that keys with too few samples keep the static default."""
+        store = LatencyStore(tmp_path, min_samples=5)
+
+        assert store.timeout_for("LoginPage.click:#login-button", 30000) == 30000
+
+    def test_derives_timeout_from_high_percentile(self, tmp_path):
+        """Test that history of earlier runs and workers is merged into a percentile."""
+        (tmp_path / "latency-gw0.json").write_text(
+            json.dumps({"Page.click:#a": [100.0] * 10})
+        )
+        (tmp_path / "latency-gw1.json").write_text(
+            json.dumps({"Page.click:#a": [200.0] * 9 + [900.0]})
+        )
+        store = LatencyStore(
+            tmp_path,
+            percentile=0.9,
+            factor=2.0,
+            margin_ms=500,
+            floor_ms=0,
+            min_samples=20,
+        )
+
+        # 90th percentile of the 20 merged samples is 200ms -> 200 * 2 + 500
+        assert store.timeout_for("Page.click:#a", 30000) == 900
+        # Learned timeouts never exceed the static default
+        assert store.timeout_for("Page.click:#a", 800) == 800
+
+    def test_save_appends_bounded_history_per_worker(self, tmp_path):
+        """Test that recorded samples are persisted and capped per key."""
+        store = LatencyStore(tmp_path, max_samples=3)
+        for duration in (10, 20, 30, 40):
+            store.record("Page.fill:#b", duration)
+
+        path = store.save("gw3")
+
+        assert path.name == "latency-gw3.json"
+        assert json.loads(path.read_text()) == {"Page.fill:#b": [20.0, 30.0, 40.0]}
+        assert LatencyStore(tmp_path).samples("Page.fill:#b") == [20.0, 30.0, 40.0]
+
+    def test_history_is_saved_while_adaptation_is_off(self, tmp_path):
+        """Test that recording goes on while not adapting, so history is ready."""
+        (tmp_path / "latency-main.json").write_text(
+            json.dumps({"Page.click:#a": [1.0] * 50})
+        )
+        store = LatencyStore(tmp_path, adapt=False, min_samples=1)
+        store.record("Page.click:#a", 5)
+
+        assert store.timeout_for("Page.click:#a", 30000) == 30000
+        store.save("main")
+        assert LatencyStore(tmp_path, min_samples=1).samples("Page.click:#a") == [
+            1.0
+        ] * 50 + [5.0]
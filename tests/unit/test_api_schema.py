@@ -0,0 +1,110 @@
+"""
+Unit tests for API response schema validation.
+"""
+
+import json
+
+import pytest
+import requests
+
+from api import APIResponse, JSONPlaceholderAPI, SchemaValidationError
+from api.schema import Validator, get_validator
+
+
+def make_response(body, status=200) -> requests.Response:
+    """Build a response without network access."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def photos(count):
+    """Photos shaped like JSONPlaceholder's."""
+    return [
+        {
+            "id": i,
+            "albumId": i // 50 + 1,
+            "title": f"photo {i}",
+            "url": f"https://via.placeholder.com/600/{i}",
+            "thumbnailUrl": f"https://via.placeholder.com/150/{i}",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.mark.unit
+class TestSchemaValidation:
+    """Test cases for compiled validators and the cached response body."""
+
+    def test_every_element_is_validated(self):
+        """Test that errors anywhere in a collection are reported with their paths."""
+        data = photos(5000)
+        get_validator("photos").validate(data)
+
+        data[4321]["url"] = "not a url"
+        del data[4999]["title"]
+        data[10]["id"] = True
+        errors = get_validator("photos").errors(data)
+
+        assert errors == [
+            "$[10].id: expected integer, got bool",
+            "$[4321].url: 'not a url' does not match format "
+            "'^[a-zA-Z][a-zA-Z0-9+.-]*://\\\\S+$'",
+            "$[4999]: missing required field 'title'",
+        ]
+
+    def test_validators_are_compiled_once(self):
+        """Test that the registry hands out the same compiled validator."""
+        assert get_validator("users") is get_validator("users")
+        with pytest.raises(ValueError):
+            get_validator("unknown")
+        with pytest.raises(ValueError):
+            Validator({"type": "object", "oneOf": []})
+
+    def test_keywords(self):
+        """Test bounds, enums and closed objects."""
+        validator = Validator(
+            {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "age": {"type": "integer", "minimum": 0, "maximum": 150},
+                    "tags": {
+                        "type": "array",
+                        "minItems": 1,
+                        "items": {"type": "string", "maxLength": 3},
+                    },
+                    "state": {"enum": ["open", "closed"]},
+                },
+            }
+        )
+
+        assert validator.is_valid({"age": 1, "tags": ["a"], "state": "open"})
+        assert (
+            len(
+                validator.errors(
+                    {"age": -1, "tags": ["long"], "state": "x", "extra": 1}
+                )
+            )
+            == 4
+        )
+        assert validator.errors({"tags": []}) == [
+            "$.tags: length 0 violates minItems 1"
+        ]
+
+    def test_response_json_is_parsed_once(self):
+        """Test that the response wrapper caches the parsed body and validates it."""
+        response = APIResponse(make_response(photos(3)))
+        api = JSONPlaceholderAPI()
+
+        assert response.json() is response.json()
+        assert response.status_code == 200
+        api.validate_schema(response, "photos")
+        with pytest.raises(SchemaValidationError, match="expected object"):
+            api.validate_schema(APIResponse(make_response([1])), "photos")
+
+    def test_response_truthiness_follows_status(self):
+        """Test that the wrapper is falsy for error statuses, like requests.Response."""
+        assert APIResponse(make_response(photos(1)))
+        assert not APIResponse(make_response({}, status=404))
@@ -0,0 +1,75 @@
+"""
+Unit tests for the asyncio page objects mirrored from the sync ones.
+"""
+
+import asyncio
+
+import pytest
+
+from pages.aio import AsyncBasePage, AsyncPageRegistry, mirror
+from pages.aio.components import AsyncRows
+from pages.aio.saucedemo import AsyncInventoryPage, AsyncLoginPage
+from pages.registry import PageRegistry
+from pages.saucedemo import LoginPage
+
+
+class FakeAsyncPage:
+    """Async page stand-in recording actions."""
+
+    url = "https://www.saucedemo.com/v1/"
+
+    def __init__(self):
+        self.actions = []
+
+    async def fill(self, selector, text, timeout=None):
+        self.actions.append(("fill", selector, text))
+
+    async def click(self, selector, timeout=None):
+        self.actions.append(("click", selector))
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.actions.append(("load_state", state))
+
+
+@pytest.mark.unit
+class TestAsyncPages:
+    """Test cases for mirroring, the async registry and awaitable actions."""
+
+    def test_mirror_shares_locators_and_data(self):
+        """Test that async pages reuse the sync page's elements and data."""
+        assert AsyncLoginPage.username_input == LoginPage.username_input
+        assert AsyncLoginPage.valid_users is LoginPage.valid_users
+        assert AsyncLoginPage.elements() == LoginPage.elements()
+        assert AsyncLoginPage.sync_class is LoginPage
+
+    def test_mirror_rejects_missing_methods(self):
+        """Test that an async page lacking a sync method fails at definition time."""
+        with pytest.raises(TypeError, match="'login'"):
+
+            @mirror(LoginPage)
+            class Incomplete(AsyncBasePage):
+                __slots__ = ()
+
+                async def open(self):
+                    pass
+
+    def test_registries_are_separate(self):
+        """Test that async and sync pages register under the same names apart."""
+        page = FakeAsyncPage()
+
+        assert isinstance(AsyncPageRegistry(page).login, AsyncLoginPage)
+        assert PageRegistry.registered()["login"] is LoginPage
+        assert isinstance(AsyncInventoryPage(page).products, AsyncRows)
+
+    def test_login_awaits_each_step(self):
+        """Test that the async login fills, clicks and waits like the sync one."""
+        page = FakeAsyncPage()
+
+        asyncio.run(AsyncLoginPage(page).login("standard_user", "secret_sauce"))
+
+        assert page.actions == [
+            ("fill", "#user-name", "standard_user"),
+            ("fill", "#password", "secret_sauce"),
+            ("click", LoginPage.login_button),
+            ("load_state", "networkidle"),
+        ]
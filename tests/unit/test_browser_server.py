@@ -0,0 +1,107 @@
+"""
+Unit tests for the persistent browser server manager (no browser is launched).
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from config.settings import Settings
+from utils.browser_server import BrowserServer
+
+
+@pytest.fixture
+def listener():
+    """A local socket standing in for a running server's port."""
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    yield sock
+    sock.close()
+
+
+def manager(tmp_path, port, **env):
+    """Server manager whose port and state directory are local to the test."""
+    settings = Settings.from_env("local", {"BROWSER_SERVER_PORT": str(port), **env})
+    server = BrowserServer(settings, "chromium", state_dir=str(tmp_path))
+    server.started = 0
+
+    def start():
+        server.started += 1
+        server._write_state({"pid": os.getpid(), "config": server._config_hash()})
+
+    server._start = start
+    return server
+
+
+@pytest.mark.unit
+class TestBrowserServer:
+    """Test cases for server reuse, restarts and the start/stop lock."""
+
+    def test_launch_command_uses_public_cli(self, tmp_path):
+        """Test that the server is started through ``python -m playwright``."""
+        server = BrowserServer(
+            Settings.from_env("local", {}), "firefox", state_dir=str(tmp_path)
+        )
+
+        command = server.launch_command(tmp_path / "firefox.config.json")
+
+        assert command[:4] == [sys.executable, "-m", "playwright", "launch-server"]
+        assert command[4:6] == ["--browser", "firefox"]
+
+    def test_healthy_server_is_reused(self, tmp_path, listener):
+        """Test that a live server started with the same flags is not restarted."""
+        server = manager(tmp_path, listener.getsockname()[1])
+        server._write_state({"pid": os.getpid(), "config": server._config_hash()})
+
+        assert server.ensure() == server.endpoint
+        assert server.started == 0
+
+    def test_dead_server_is_restarted(self, tmp_path, listener):
+        """Test that a state file left by an exited server triggers a start."""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        server = manager(tmp_path, listener.getsockname()[1])
+        server._write_state({"pid": process.pid, "config": server._config_hash()})
+
+        server.ensure()
+
+        assert server.started == 1
+
+    def test_config_change_restarts_server(self, tmp_path, listener):
+        """Test that changed launch flags stop the old server and start a new one."""
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            start_new_session=True,
+        )
+        port = listener.getsockname()[1]
+        old = manager(tmp_path, port, HEADLESS="false")
+        old._write_state({"pid": process.pid, "config": old._config_hash()})
+        server = manager(tmp_path, port, HEADLESS="true")
+        # Reap the old server like its real parent would, so it is not left a zombie
+        reaper = threading.Thread(target=process.wait)
+        reaper.start()
+
+        server.ensure()
+
+        reaper.join(timeout=5)
+        assert server.started == 1
+        assert process.returncode is not None
+        assert server._read_state()["config"] == server._config_hash()
+
+    def test_stale_lock_is_recovered(self, tmp_path):
+        """Test that a lock older than the timeout, left by a crash, is taken over."""
+        server = manager(tmp_path, 9400)
+        lock_path = tmp_path / "chromium.lock"
+        lock_path.touch()
+        stale = time.time() - 120
+        os.utime(lock_path, (stale, stale))
+
+        with server._lock(timeout=60):
+            assert lock_path.exists()
+        assert not lock_path.exists()
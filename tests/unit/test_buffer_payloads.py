@@ -0,0 +1,47 @@
+"""
+Unit tests for on-demand buffer overflow payloads.
+"""
+
+import pytest
+
+from utils.security_payloads import (
+    SecurityPayloads,
+    generate_buffer_payload,
+    iter_buffer_chunks,
+    parse_size,
+)
+
+
+@pytest.mark.unit
+class TestBufferPayloads:
+    """Test cases for size specs, charsets and chunked generation."""
+
+    def test_parses_size_specs(self):
+        """Test that size specs accept bytes, KB and MB within the limit."""
+        assert parse_size(512) == 512
+        assert parse_size("1KB") == 1024
+        assert parse_size("2.5 mb") == int(2.5 * 1024 * 1024)
+        for invalid in ("0KB", "11MB", "ten KB"):
+            with pytest.raises(ValueError):
+                parse_size(invalid)
+
+    def test_chunks_are_independent_of_chunk_size(self):
+        """Test that streaming yields the same payload for any chunk size."""
+        payload = generate_buffer_payload("100KB", "unicode")
+        chunks = list(iter_buffer_chunks("100KB", "unicode", chunk_size=7000))
+
+        assert len(payload) == 100 * 1024
+        assert max(len(chunk) for chunk in chunks) == 7000
+        assert "".join(chunks) == payload
+
+    def test_named_payloads_are_generated_on_access(self):
+        """Test that BUFFER_OVERFLOW keeps its names without storing strings."""
+        assert list(SecurityPayloads.BUFFER_OVERFLOW) == [
+            "small",
+            "medium",
+            "large",
+            "huge",
+        ]
+        assert SecurityPayloads.BUFFER_OVERFLOW["huge"] == "A" * 100000
+        with pytest.raises(ValueError):
+            generate_buffer_payload("1KB", "emoji")
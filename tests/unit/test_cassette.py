@@ -0,0 +1,166 @@
+"""
+Unit tests for API traffic recording and replay.
+"""
+
+import gzip
+import json
+import time
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from api import JSONPlaceholderAPI
+from api.cassette import Cassette, CassetteMiss
+
+POSTS = [
+    {"id": i, "userId": 1, "title": f"post {i}", "body": "..."} for i in range(1, 4)
+]
+
+
+class EchoAdapter(BaseAdapter):
+    """Transport answering every GET with one body and POSTs with their own body."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        response = requests.Response()
+        response.status_code = 201 if request.method == "POST" else 200
+        response.reason = "Created" if request.method == "POST" else "OK"
+        response.headers["Content-Type"] = "application/json; charset=utf-8"
+        response.headers["Content-Length"] = "999"
+        response._content = (
+            request.body if request.method == "POST" else json.dumps(POSTS).encode()
+        )
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def client(adapter):
+    """Client without request coalescing, served by an adapter."""
+    api = JSONPlaceholderAPI()
+    api.session.mount("https://", adapter)
+    api.single_flight = None
+    return api
+
+
+@pytest.mark.unit
+class TestCassette:
+    """Test cases for recording, deduplication, matching and replay."""
+
+    def test_recorded_traffic_replays_offline(self, tmp_path):
+        """Test that a recorded session replays without the live transport."""
+        path = tmp_path / "api.json.gz"
+        live = EchoAdapter()
+        recorder = client(live)
+        recorder.use_cassette(path, "record")
+        recorded = recorder.get_posts(user_id=1)
+        created = recorder.create_post("title", "body", 1)
+        recorder.close()
+
+        replayer = client(EchoAdapter())
+        adapter = replayer.use_cassette(path, "replay")
+
+        assert replayer.get_posts(user_id=1) == recorded
+        assert replayer.create_post("title", "body", 1) == created
+        assert adapter.stats.played == 2 and adapter.live.sent == []
+        assert len(live.sent) == 2
+
+    def test_bodies_are_stored_once(self, tmp_path):
+        """Test that identical response bodies are deduplicated in the file."""
+        path = tmp_path / "api.json.gz"
+        api = client(EchoAdapter())
+        api.use_cassette(path, "record")
+        for post_id in range(1, 6):
+            api.get(f"/posts/{post_id}")
+        api.close()
+
+        with gzip.open(path, "rt") as handle:
+            data = json.load(handle)
+        assert len(data["interactions"]) == 5 and len(data["bodies"]) == 1
+        # Wire headers describe the original encoding, not the stored body
+        assert "Content-Length" not in data["interactions"][0]["headers"]
+
+    def test_strict_and_lenient_matching(self, tmp_path):
+        """Test that strict mode matches the query; lenient falls back to the path."""
+        path = tmp_path / "api.json.gz"
+        api = client(EchoAdapter())
+        api.use_cassette(path, "record")
+        api.get("/posts", params={"userId": 1, "_limit": 5})
+        api.close()
+
+        strict = client(EchoAdapter())
+        strict.use_cassette(path, "replay")
+        assert (
+            strict.get("/posts", params={"_limit": 5, "userId": 1}).status_code == 200
+        )
+        with pytest.raises(CassetteMiss, match="strict matching"):
+            strict.get("/posts", params={"userId": 2})
+
+        lenient = client(EchoAdapter())
+        lenient.use_cassette(path, "replay", match="lenient")
+        assert lenient.get("/posts", params={"userId": 2}).json() == POSTS
+
+    def test_auto_mode_records_only_misses(self, tmp_path):
+        """Test that auto replays known requests and appends new ones."""
+        path = tmp_path / "api.json.gz"
+        first = client(EchoAdapter())
+        first.use_cassette(path, "auto")
+        first.get("/posts/1")
+        first.close()
+
+        live = EchoAdapter()
+        second = client(live)
+        second.use_cassette(path, "auto")
+        second.get("/posts/1"), second.get("/posts/2")
+        second.close()
+
+        assert live.sent == ["https://jsonplaceholder.typicode.com/posts/2"]
+        assert len(Cassette.load(path)) == 2
+
+    def test_workers_saving_one_cassette_are_merged(self, tmp_path):
+        """Test that concurrent recorders keep each other's interactions."""
+        path = tmp_path / "api.json.gz"
+        workers = [client(EchoAdapter()), client(EchoAdapter())]
+        for api in workers:
+            api.use_cassette(path, "record")
+        workers[0].get("/posts/1")
+        workers[1].get("/posts/2")
+        for api in workers:
+            api.close()
+
+        rerecorder = client(EchoAdapter())
+        rerecorder.use_cassette(path, "record")
+        rerecorder.get("/posts/1")
+        rerecorder.close()
+
+        urls = sorted(
+            interaction.url for interaction in Cassette.load(path).interactions
+        )
+        assert urls == [
+            "https://jsonplaceholder.typicode.com/posts/1",
+            "https://jsonplaceholder.typicode.com/posts/2",
+        ]
+        assert not (tmp_path / "api.json.gz.lock").exists()
+
+    def test_synthetic_latency_and_streaming(self, tmp_path):
+        """Test that replayed responses are delayed and can be streamed."""
+        path = tmp_path / "api.json.gz"
+        api = client(EchoAdapter())
+        api.use_cassette(path, "record")
+        api.get("/photos")
+        api.close()
+
+        replayer = client(EchoAdapter())
+        replayer.use_cassette(path, "replay", latency_ms=50)
+        started = time.perf_counter()
+        photos = list(replayer.iter_json("/photos"))
+
+        assert time.perf_counter() - started >= 0.05
+        assert photos == POSTS
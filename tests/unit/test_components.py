@@ -0,0 +1,94 @@
+"""
+Unit tests for list-row components.
+"""
+
+import pytest
+
+from pages.saucedemo import InventoryPage
+
+
+class StubLocator:
+    """Records DOM reads and clicks made through a locator chain."""
+
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    def evaluate_all(self, script, arg):
+        self.page.reads += 1
+        return [list(row) for row in self.page.rows]
+
+    def count(self):
+        return len(self.page.rows)
+
+    def nth(self, index):
+        return StubLocator(self.page, f"{self.selector} >> nth={index}")
+
+    def locator(self, selector):
+        return StubLocator(self.page, f"{self.selector} >> {selector}")
+
+    def click(self, timeout=None):
+        self.page.clicks.append(self.selector)
+
+
+class StubPage:
+    """Minimal stand-in for a Playwright page with a product list."""
+
+    def __init__(self, rows):
+        self.url = "https://www.saucedemo.com/v1/inventory.html"
+        self.rows = rows
+        self.reads = 0
+        self.clicks = []
+
+    def locator(self, selector):
+        return StubLocator(self, selector)
+
+    def select_option(self, selector, value):
+        self.rows = list(reversed(self.rows))
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+
+PRODUCTS = [("Sauce Labs Backpack", "$29.99"), ("Sauce Labs Bike Light", "$9.99")]
+
+
+@pytest.mark.unit
+class TestRowComponents:
+    """Test cases for row snapshots and name lookups."""
+
+    def test_snapshot_reads_dom_once(self):
+        """Test that names, prices and lookups share one DOM read."""
+        page = StubPage(PRODUCTS)
+        inventory_page = InventoryPage(page)
+
+        assert inventory_page.get_product_names() == [name for name, _ in PRODUCTS]
+        assert inventory_page.get_product_prices() == [price for _, price in PRODUCTS]
+        inventory_page.click_product_name("Sauce Labs Bike Light")
+        inventory_page.remove_product_from_cart("Sauce Labs Backpack")
+
+        assert page.reads == 1
+        assert page.clicks == [
+            ".inventory_item >> nth=1 >> .inventory_item_name",
+            ".inventory_item >> nth=0 >> .btn_secondary",
+        ]
+
+    def test_snapshot_refreshes_after_change(self):
+        """Test that sorting and navigation invalidate the snapshot."""
+        page = StubPage(PRODUCTS)
+        inventory_page = InventoryPage(page)
+
+        inventory_page.get_product_names()
+        inventory_page.sort_by_name_desc()
+        assert inventory_page.get_product_names()[0] == "Sauce Labs Bike Light"
+
+        page.url = "https://www.saucedemo.com/v1/inventory-item.html?id=4"
+        inventory_page.get_product_names()
+        assert page.reads == 3
+
+    def test_unknown_product_name(self):
+        """Test that lookups for missing products fail clearly."""
+        inventory_page = InventoryPage(StubPage(PRODUCTS))
+
+        with pytest.raises(ValueError):
+            inventory_page.click_product_name("Sauce Labs Onesie")
@@ -0,0 +1,82 @@
+"""
+Unit tests for the feedback-guided fuzzer.
+"""
+
+import pytest
+
+from utils.fuzzer import (
+    Fuzzer,
+    LoginFuzzPool,
+    ResponseSignature,
+    bit_flip,
+    encode_slice,
+)
+
+
+def quote_target(inputs):
+    """Fake application whose behaviour only depends on quotes and length."""
+    return [
+        ResponseSignature(
+            "error" if "'" in payload else "no-response",
+            timing_bucket=len(payload) // 64,
+        )
+        for payload in inputs
+    ]
+
+
+@pytest.mark.unit
+class TestFuzzer:
+    """Test cases for mutation, deduplication and signature feedback."""
+
+    def test_mutations_are_reproducible_and_unique(self):
+        """Test that the same seed yields the same unique mutants."""
+        first = list(Fuzzer(seed=42).mutations("admin", 50))
+        second = list(Fuzzer(seed=42).mutations("admin", 50))
+
+        assert first == second
+        assert len(set(first)) == len(first) == 50
+        assert first != list(Fuzzer(seed=43).mutations("admin", 50))
+
+    def test_operators_keep_valid_text(self):
+        """Test that bit flips never leave lone surrogates and encodings change text."""
+        fuzzer = Fuzzer(seed=1)
+        for _ in range(200):
+            bit_flip(fuzzer.rng, "中文", ()).encode("utf-8")
+        assert any(
+            encode_slice(fuzzer.rng, "<script>", ()) != "<script>" for _ in range(10)
+        )
+
+    def test_signature_normalizes_reflection_numbers_and_jitter(self):
+        """Test that reflected input and small timing changes keep the signature."""
+        first = ResponseSignature.build(
+            "error", "Bad user admin1 (code 17)", 130.0, "DIV.x", "admin1"
+        )
+        second = ResponseSignature.build(
+            "error", "Bad user admin2 (code 18)", 200.0, "DIV.x", "admin2"
+        )
+
+        assert first == second
+        assert first != ResponseSignature.build(
+            "error", "Bad user admin1", 4000.0, "DIV.x", "admin1"
+        )
+
+    def test_run_keeps_inputs_with_novel_signatures(self):
+        """Test that the run stays within budget and records each new signature once."""
+        report = Fuzzer(seed=7).run(
+            quote_target, ["admin", "admin"], budget=60, batch_size=8
+        )
+
+        assert len(report.results) == 60
+        assert len({result.payload for result in report.results}) == 60
+        novel = [result.signature for result in report.interesting]
+        assert len(novel) == len(set(novel)) == len(report.signatures())
+        assert ResponseSignature("error") in report.signatures()
+
+    def test_pool_workers_launch_with_suite_browser_args(self):
+        """Test that pool workers get the suite's launch arguments by default."""
+        from config.settings import get_settings
+
+        assert LoginFuzzPool().initargs[1] == get_settings().get_browser_args()
+        assert LoginFuzzPool(browser_args={"headless": False}).initargs[1] == {
+            "headless": False
+        }
@@ -0,0 +1,149 @@
+"""
+Unit tests for the client-side HTTP cache.
+"""
+
+import io
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from api import JSONPlaceholderAPI
+from api.http_cache import HTTPCache
+
+USERS = [{"id": 1, "name": "Leanne Graham"}]
+
+
+class ConditionalAdapter(BaseAdapter):
+    """Transport serving a versioned body with ETag and honouring If-None-Match."""
+
+    def __init__(self, cache_control="max-age=0"):
+        super().__init__()
+        self.cache_control = cache_control
+        self.version = 1
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        etag = f'W/"v{self.version}"'
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Cache-Control"] = self.cache_control
+        response.headers["etag"] = etag
+        if request.method == "GET" and request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200 if request.method == "GET" else 201
+            body = json.dumps(USERS + [{"version": self.version}]).encode()
+            if kwargs.get("stream"):
+                response.raw = io.BytesIO(body)
+            else:
+                response._content = body
+        return response
+
+    def close(self):
+        pass
+
+
+def client(adapter, **options):
+    """Client with caching enabled, served by an adapter."""
+    api = JSONPlaceholderAPI()
+    api.session.mount("https://", adapter)
+    api.enable_cache(**options)
+    return api
+
+
+@pytest.mark.unit
+class TestHTTPCache:
+    """Test cases for freshness, revalidation, invalidation and persistence."""
+
+    def test_fresh_entries_skip_the_network(self):
+        """Test that max-age responses are served from memory."""
+        adapter = ConditionalAdapter("public, max-age=60")
+        api = client(adapter)
+
+        first, second = api.get("/users"), api.get("/users")
+
+        assert len(adapter.sent) == 1
+        assert not first.from_cache and second.from_cache
+        assert second.json() == first.json()
+        assert (api.cache.stats.hits, api.cache.stats.misses) == (1, 1)
+
+    def test_stale_entries_are_revalidated(self):
+        """Test that a stale entry sends If-None-Match and reuses the body on 304."""
+        adapter = ConditionalAdapter("no-cache")
+        api = client(adapter)
+
+        api.get("/users")
+        revalidated = api.get("/users")
+        adapter.version = 2
+        changed = api.get("/users")
+
+        assert adapter.sent[1].headers["If-None-Match"] == 'W/"v1"'
+        assert revalidated.from_cache and revalidated.json()[-1] == {"version": 1}
+        assert not changed.from_cache and changed.json()[-1] == {"version": 2}
+        assert api.cache.stats.revalidated == 1
+
+    def test_ttl_override_and_mutation_invalidate(self):
+        """Test per-endpoint TTLs and that writes drop the collection's entries."""
+        adapter = ConditionalAdapter("no-store")
+        api = client(adapter, ttl_overrides={"/users*": 300})
+
+        api.get("/users"), api.get("/users/1"), api.get("/posts")
+        assert api.get("/users").from_cache
+        assert len(api.cache) == 2  # /posts was no-store
+
+        api.post("/users", json={"name": "new"})
+        assert len(api.cache) == 0 and api.cache.stats.invalidations == 2
+        assert not api.get("/users").from_cache
+
+    def test_streamed_get_keeps_cached_entries(self):
+        """Test that streaming a collection does not invalidate its cached entries."""
+        adapter = ConditionalAdapter("max-age=60")
+        api = client(adapter)
+
+        api.get("/users")
+        streamed = list(api.iter_json("/users"))
+
+        assert streamed == USERS + [{"version": 1}]
+        assert api.cache.stats.invalidations == 0 and api.get("/users").from_cache
+
+    def test_disk_store_is_shared(self, tmp_path):
+        """Test that another cache instance reads entries from disk."""
+        adapter = ConditionalAdapter("max-age=60")
+        client(adapter, directory=str(tmp_path)).get("/users", params={"page": 1})
+
+        other = client(adapter, directory=str(tmp_path))
+        cached = other.get("/users", params={"page": 1})
+
+        assert cached.from_cache and cached.json() == USERS + [{"version": 1}]
+        assert cached.headers["ETAG"] == 'W/"v1"'
+        assert len(adapter.sent) == 1
+
+    def test_mutation_invalidates_evicted_disk_entries(self, tmp_path):
+        """Test that writes also drop entries that only live on disk."""
+        adapter = ConditionalAdapter("max-age=60")
+        api = client(adapter, max_entries=1, directory=str(tmp_path))
+
+        api.get("/users/1"), api.get("/posts/1")  # /users/1 is evicted from memory
+        api.put("/users/1", json={"name": "new"})
+
+        assert not api.get("/users/1").from_cache
+        assert api.get("/posts/1").from_cache
+        assert api.cache.stats.invalidations == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        adapter = ConditionalAdapter("max-age=60")
+        api = client(adapter, max_entries=2)
+
+        api.get("/users/1"), api.get("/users/2"), api.get("/users/1"), api.get(
+            "/users/3"
+        )
+
+        assert api.get("/users/1").from_cache
+        assert not api.get("/users/2").from_cache
+        assert isinstance(api.cache, HTTPCache)
@@ -0,0 +1,100 @@
+"""
+Unit tests for payload parametrization and the per-item isolation contract.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import conftest
+from utils.payload_corpus import get_corpus
+
+
+class FakeDefinition:
+    """Function definition stand-in carrying markers."""
+
+    def __init__(self, *markers):
+        self.markers = {marker.name: marker for marker in markers}
+
+    def get_closest_marker(self, name):
+        return self.markers.get(name)
+
+
+class FakeMetafunc:
+    """Metafunc stand-in recording parametrize calls."""
+
+    def __init__(self, fixturenames, *markers):
+        self.fixturenames = fixturenames
+        self.definition = FakeDefinition(*markers)
+        self.calls = []
+
+    def parametrize(self, argnames, argvalues, ids=None):
+        self.calls.append((argnames, argvalues, ids))
+
+
+class FakeItem(FakeDefinition):
+    """Collected item stand-in."""
+
+    def __init__(self, cls, *markers, instance=None):
+        super().__init__(*markers)
+        self.cls = cls
+        self.module = SimpleNamespace(__name__="tests.ui.test_example")
+        self.nodeid = f"tests/ui/test_example.py::{cls.__name__}::test_it"
+        self.instance = instance
+
+    def add_marker(self, marker):
+        self.markers[marker.name] = marker.mark
+
+
+class Shared:
+    """Test class that keeps state between its tests."""
+
+
+@pytest.mark.unit
+class TestItemIsolation:
+    """Test cases for payload items, xdist grouping and the isolation check."""
+
+    def test_payloads_marker_parametrizes_one_item_per_payload(self):
+        """Test that the marker's sample becomes the payload parameter."""
+        metafunc = FakeMetafunc(
+            ["login_page", "payload"],
+            pytest.mark.payloads(category="ldap_injection").mark,
+        )
+
+        conftest.pytest_generate_tests(metafunc)
+
+        expected = [
+            entry.payload for entry in get_corpus().sample(category="ldap_injection")
+        ]
+        ((argnames, argvalues, ids),) = metafunc.calls
+        assert argnames == "payload" and argvalues == expected
+        assert len(set(ids)) == len(ids) == len(expected)
+
+    def test_tests_without_marker_are_left_alone(self):
+        """Test that only marked tests with a payload argument are parametrized."""
+        metafunc = FakeMetafunc(["payload"])
+
+        conftest.pytest_generate_tests(metafunc)
+
+        assert metafunc.calls == []
+
+    def test_only_shared_classes_are_grouped(self):
+        """Test that shared classes get one xdist group and isolated items none."""
+        shared, isolated = FakeItem(Shared), FakeItem(Shared, pytest.mark.isolated.mark)
+
+        conftest.pytest_collection_modifyitems(None, [shared, isolated])
+
+        assert shared.get_closest_marker("xdist_group").args == (
+            "tests.ui.test_example::Shared",
+        )
+        assert isolated.get_closest_marker("xdist_group") is None
+
+    def test_isolated_tests_must_not_keep_state_on_self(self):
+        """Test that an isolated test storing attributes fails in teardown."""
+        instance = Shared()
+        instance.pages = object()
+        item = FakeItem(Shared, pytest.mark.isolated.mark, instance=instance)
+
+        with pytest.raises(pytest.fail.Exception, match=r"stored \['pages'\]"):
+            conftest.pytest_runtest_teardown(item)
+        conftest.pytest_runtest_teardown(FakeItem(Shared, instance=instance))
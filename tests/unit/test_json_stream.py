@@ -0,0 +1,86 @@
+"""
+Unit tests for streaming JSON parsing.
+"""
+
+import io
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from api import JSONPlaceholderAPI
+from api.json_stream import iter_json_array, loads
+
+
+class StaticAdapter(BaseAdapter):
+    """Transport answering every request with a fixed body."""
+
+    def __init__(self, body: bytes, status: int = 200):
+        super().__init__()
+        self.body = body
+        self.status = status
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append((request, kwargs))
+        response = requests.Response()
+        response.status_code = self.status
+        response.raw = io.BytesIO(self.body)
+        response.encoding = "utf-8"
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+RECORDS = [
+    {"id": i, "title": "é" * (i % 5), "scores": [i / 2, None, True]}
+    for i in range(1, 301)
+]
+
+
+@pytest.mark.unit
+class TestJsonStream:
+    """Test cases for incremental array parsing and streaming endpoints."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_elements_match_full_parse(self, chunk_size):
+        """Test that any chunking yields the same elements.
+
+        This includes chunks splitting UTF-8 sequences and numbers.
+        """
+        body = json.dumps(RECORDS + [123456, "tail"], ensure_ascii=False).encode()
+        chunks = (body[i : i + chunk_size] for i in range(0, len(body), chunk_size))
+
+        assert list(iter_json_array(chunks)) == loads(body)
+
+    @pytest.mark.parametrize("body", [b'{"id": 1}', b"[1, 2", b"[1] trailing"])
+    def test_invalid_documents_raise(self, body):
+        """Test that non-arrays, truncated arrays and trailing data are rejected."""
+        with pytest.raises(ValueError):
+            list(iter_json_array([body]))
+
+    def test_iter_photos_streams_response(self):
+        """Test that the client streams the endpoint with its query parameters."""
+        api = JSONPlaceholderAPI()
+        adapter = StaticAdapter(json.dumps(RECORDS).encode())
+        api.session.mount("https://", adapter)
+
+        photos = api.iter_photos(album_id=3)
+        assert next(photos) == RECORDS[0]
+        assert sum(1 for _ in photos) == len(RECORDS) - 1
+
+        request, kwargs = adapter.requests[0]
+        assert request.url.endswith("/photos?albumId=3")
+        assert kwargs["stream"] is True
+
+    def test_unexpected_status_fails(self):
+        """Test that a streamed error response fails the status assertion."""
+        api = JSONPlaceholderAPI()
+        api.session.mount("https://", StaticAdapter(b"[]", status=500))
+
+        with pytest.raises(AssertionError, match="Expected status code 200"):
+            list(api.iter_comments())
@@ -0,0 +1,75 @@
+"""
+Unit tests for the sensitive-data leak scanner.
+"""
+
+import pytest
+
+from utils.fuzzer import ResponseSignature
+from utils.leak_scanner import Leak, LeakScanner, get_scanner
+from utils.security_payloads import SecurityTestHelpers
+
+
+@pytest.mark.unit
+class TestLeakScanner:
+    """Test cases for positions, categories, word boundaries and batches."""
+
+    def test_scan_reports_category_and_position(self):
+        """Test that terms and patterns are found with their positions."""
+        text = "MySQL syntax error at line 3 in /var/www/app.py (ORA-00933)"
+        leaks = LeakScanner().scan(text)
+
+        assert Leak("database", "mysql", 0, 5) in leaks
+        assert {leak.term for leak in leaks} >= {
+            "syntax",
+            "error",
+            "line 3",
+            "/var/www/app.py",
+            "ora-00933",
+        }
+        assert all(text[leak.start : leak.end].lower() == leak.term for leak in leaks)
+
+    def test_word_boundaries(self):
+        """Test that terms inside words and class names do not match, plurals do."""
+        scanner = LeakScanner()
+
+        assert scanner.scan("Epic sadface: service unavailable, error-button") == []
+        assert scanner.terms_in("Tables and errors") == ["tables", "errors"]
+
+    def test_category_selection(self):
+        """Test that only selected categories are reported and unknown ones rejected."""
+        assert LeakScanner(["database"]).categories_in("SQL error for admin") == {
+            "database"
+        }
+        assert get_scanner(frozenset({"database"})) is get_scanner(
+            frozenset({"database"})
+        )
+        with pytest.raises(ValueError):
+            LeakScanner(["secrets"])
+
+    def test_scan_many_matches_scan(self):
+        """Test that batch scanning gives the same results as scanning one by one."""
+        texts = [
+            "no leaks here",
+            "SQLSTATE[42000]: table users",
+            "",
+            "host 10.0.0.5:5432\x00root",
+        ]
+        scanner = LeakScanner()
+
+        assert scanner.scan_many(texts) == [
+            scanner.scan(text.replace("\x00", " ")) for text in texts
+        ]
+
+    def test_helpers_and_fuzzer_use_scanner(self):
+        """Test that the keyword helper and fuzz signatures report leaks."""
+        assert SecurityTestHelpers.check_for_sensitive_data_leak(
+            "SQL error, SQL syntax"
+        ) == ["sql", "error", "syntax"]
+
+        signature = ResponseSignature.build(
+            "error", "ORA-00933 near 'admin'", 10.0, "", "admin"
+        )
+        assert signature.leaks == {"database"}
+        assert not ResponseSignature.build(
+            "error", "Username and password do not match", 10.0, ""
+        ).leaks
@@ -0,0 +1,89 @@
+"""
+Unit tests for the pairwise test-matrix planner.
+"""
+
+from itertools import combinations
+
+import pytest
+
+from utils.matrix_planner import (
+    LOGIN_FIELDS,
+    MatrixPlanner,
+    login_credentials,
+    pairwise,
+)
+
+DIMENSIONS = {
+    "field": LOGIN_FIELDS,
+    "persona": ("standard_user", "problem_user", "locked_out_user"),
+}
+
+
+def representatives(classes=6, per_class=2):
+    """Payload classes with a few payloads each."""
+    return {
+        f"class{index}": [f"payload{index}-{n}" for n in range(per_class)]
+        for index in range(classes)
+    }
+
+
+@pytest.mark.unit
+class TestMatrixPlanner:
+    """Test cases for covering arrays, payload rotation and pruning."""
+
+    def test_pairwise_covers_every_pair(self):
+        """Test that every value pair of any two dimensions is covered in few cases."""
+        dimensions = {
+            "class": range(10),
+            **DIMENSIONS,
+            "browser": ("chromium", "firefox"),
+        }
+        rows = pairwise(dimensions, seed=3)
+
+        for first, second in combinations(dimensions, 2):
+            covered = {(row[first], row[second]) for row in rows}
+            assert len(covered) == len(dimensions[first]) * len(dimensions[second])
+        assert len(rows) < 10 * 3 * 3 * 2 / 3
+        assert rows == pairwise(dimensions, seed=3)
+
+    def test_cases_rotate_payloads(self):
+        """Test that repeated classes use the next payload of the class."""
+        matrix = MatrixPlanner(representatives(), DIMENSIONS)
+        cases = list(matrix)
+
+        assert len(cases) == len(matrix) < matrix.full_size
+        assert {
+            case.payload for case in cases if case["payload_class"] == "class0"
+        } == {"payload0-0", "payload0-1"}
+
+    def test_stable_classes_are_pruned(self):
+        """Test that a class is skipped only once its signatures agree."""
+        matrix = MatrixPlanner(representatives(), DIMENSIONS, stable_after=2)
+
+        for case in matrix:
+            varying = case["payload_class"] == "class0" and case["field"] == "both"
+            matrix.record(case, "reflected" if varying else "error")
+
+        assert matrix.skipped
+        assert not matrix.is_pruned("class0") and matrix.is_pruned("class1")
+        assert all(case["payload_class"] != "class0" for case in matrix.skipped)
+        assert "skipped" in matrix.summary()
+
+    def test_login_credentials_place_payload(self):
+        """Test that the payload goes into the planned field."""
+        matrix = MatrixPlanner({"sql": ["' OR 1=1"]}, DIMENSIONS)
+        personas = {
+            "standard_user": "secret",
+            "problem_user": "secret",
+            "locked_out_user": "secret",
+        }
+        by_field = {case["field"]: login_credentials(case, personas) for case in matrix}
+
+        assert by_field["username"] == ("' OR 1=1", "secret")
+        assert (
+            by_field["password"][1] == "' OR 1=1"
+            and by_field["password"][0] in personas
+        )
+        assert by_field["both"] == ("' OR 1=1", "' OR 1=1")
+        with pytest.raises(ValueError):
+            MatrixPlanner({"sql": []}, DIMENSIONS)
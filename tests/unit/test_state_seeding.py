@@ -0,0 +1,79 @@
+"""
+Unit tests for seeding SauceDemo state into a browser context.
+"""
+
+import json
+
+import pytest
+
+from utils.state_seeding import CART_KEY, SESSION_COOKIE, AppState
+
+
+class FakeContext:
+    """Browser context stand-in recording cookies and init scripts."""
+
+    def __init__(self):
+        self.cookies = []
+        self.init_scripts = []
+
+    def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+
+@pytest.mark.unit
+class TestStateSeeding:
+    """Test cases for the session cookie, cart storage and storage-state builders."""
+
+    def test_storage_state_holds_session_and_cart(self):
+        """Test that the storage state carries the session cookie and cart ids."""
+        state = AppState("standard_user").with_cart(
+            "Sauce Labs Backpack", "Sauce Labs Bike Light"
+        )
+
+        storage = state.storage_state()
+
+        cookie = storage["cookies"][0]
+        assert (cookie["name"], cookie["value"], cookie["domain"]) == (
+            SESSION_COOKIE,
+            "standard_user",
+            "www.saucedemo.com",
+        )
+        assert storage["origins"] == [
+            {
+                "origin": "https://www.saucedemo.com",
+                "localStorage": [{"name": CART_KEY, "value": "[4,0]"}],
+            }
+        ]
+
+    def test_apply_adds_cookies_and_cart_script(self):
+        """Test that applying to a context seeds the cookie and a cart init script."""
+        context = FakeContext()
+
+        AppState("standard_user", cart=("Sauce Labs Onesie",)).apply(context)
+
+        assert context.cookies == [
+            {
+                "name": SESSION_COOKIE,
+                "value": "standard_user",
+                "url": "https://www.saucedemo.com",
+            }
+        ]
+        assert len(context.init_scripts) == 1
+        assert json.dumps({CART_KEY: "[2]"})[1:-1] in context.init_scripts[0]
+
+    def test_empty_state_seeds_nothing(self):
+        """Test that a logged-out state with an empty cart leaves the context alone."""
+        context = FakeContext()
+
+        AppState().apply(context)
+
+        assert context.cookies == [] and context.init_scripts == []
+        assert AppState().storage_state() == {"cookies": [], "origins": []}
+
+    def test_unknown_products_rejected(self):
+        """Test that cart entries must be SauceDemo product names."""
+        with pytest.raises(ValueError, match="Unknown products"):
+            AppState("standard_user", cart=("Sauce Labs Hat",))
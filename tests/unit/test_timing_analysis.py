@@ -0,0 +1,60 @@
+"""
+Unit tests for sequential timing analysis.
+"""
+
+import itertools
+
+import pytest
+
+from utils.timing_analysis import TimingAnalyzer, mann_whitney_greater
+
+
+def fake_clock(monkeypatch, durations):
+    """Make each timed action take the next duration (ms) from its own sequence."""
+    clock = {"now": 0}
+
+    def action_for(sequence):
+        values = itertools.cycle(sequence)
+        return lambda: clock.__setitem__("now", clock["now"] + int(next(values) * 1e6))
+
+    monkeypatch.setattr("utils.timing_analysis.perf_counter_ns", lambda: clock["now"])
+    return [action_for(sequence) for sequence in durations]
+
+
+@pytest.mark.unit
+class TestTimingAnalysis:
+    """Test cases for the Mann-Whitney test and early stopping."""
+
+    def test_mann_whitney_detects_shift_and_handles_ties(self):
+        """Test the one-sided p-value for separated, identical and reversed samples."""
+        assert mann_whitney_greater([10, 11, 12, 13, 14], [1, 2, 3, 4, 5]) < 0.01
+        assert mann_whitney_greater([5, 5, 5], [5, 5, 5]) == 1.0
+        assert mann_whitney_greater([1, 2, 3, 4, 5], [10, 11, 12, 13, 14]) > 0.99
+
+    def test_injected_delay_is_detected_early(self, monkeypatch):
+        """Test that a clear delay is reported as slower after few trials."""
+        payload, control = fake_clock(
+            monkeypatch, [[5400, 5100, 5250], [400, 380, 450, 390]]
+        )
+
+        verdict = TimingAnalyzer(threshold_ms=3000).compare(payload, control)
+
+        assert verdict.slower
+        assert verdict.samples == 5
+        assert verdict.delta_ms > 4000
+
+    def test_jitter_is_not_reported_as_delay(self, monkeypatch):
+        """Test that payloads within the threshold are declared not slower."""
+        payload, control = fake_clock(
+            monkeypatch, [[420, 900, 410], [400, 380, 1200, 390]]
+        )
+
+        verdict = TimingAnalyzer(threshold_ms=3000).compare(payload, control)
+
+        assert verdict.verdict == "not-slower"
+        assert verdict.samples < 10
+
+    def test_rejects_invalid_sample_bounds(self):
+        """Test that sample bounds are validated."""
+        with pytest.raises(ValueError):
+            TimingAnalyzer(min_samples=5, max_samples=3)
@@ -0,0 +1,41 @@
+"""
+Unit tests for the negative wait profiler.
+"""
+
+import pytest
+
+from utils.wait_profiler import WaitProfiler
+
+
+@pytest.mark.unit
+class TestWaitProfiler:
+    """Test cases for collecting and summarizing negative waits."""
+
+    def test_drain_hands_over_pending_waits_once(self):
+        """Test that waits are reported once per test."""
+        profiler = WaitProfiler()
+        profiler.record("InventoryPage.visible:.shopping_cart_badge", 5000.04)
+
+        assert profiler.drain() == [
+            ("InventoryPage.visible:.shopping_cart_badge", 5000.0)
+        ]
+        assert profiler.drain() == []
+
+    def test_summary_aggregates_by_wait_and_test(self):
+        """Test that the summary totals waits across tests and workers."""
+        profiler = WaitProfiler()
+        profiler.add(
+            "test_a", [("Page.visible:#x", 5000.0), ("Page.hidden:#y", 1000.0)]
+        )
+        profiler.add("test_b", [("Page.visible:#x", 5000.0)])
+
+        lines = profiler.summary()
+
+        assert profiler.total_ms == 11000.0
+        assert lines[0] == "3 negative waits cost 11.0s in 2 tests"
+        assert "Page.visible:#x" in lines[1] and "2x" in lines[1]
+        assert lines[-2].endswith("test_a")
+
+    def test_summary_is_empty_without_negative_waits(self):
+        """Test that nothing is reported for a clean session."""
+        assert WaitProfiler().summary() == []
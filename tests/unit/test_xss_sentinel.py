@@ -0,0 +1,183 @@
+"""
+Unit tests for the XSS execution sentinel.
+"""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from utils.security_payloads import SecurityTestHelpers
+from utils.xss_sentinel import SENTINEL_SCRIPT, XssSentinel
+
+
+class FakePage:
+    """Page stand-in holding a sentinel buffer."""
+
+    def __init__(self, events=()):
+        self.events = list(events)
+        self.scripts = []
+
+    def evaluate(self, script):
+        if script == SENTINEL_SCRIPT:
+            self.scripts.append(script)
+            return None
+        events, self.events = self.events, []
+        return events
+
+
+class FakeContext:
+    """Browser context stand-in recording init scripts."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.init_scripts = []
+
+    def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+
+# Minimal browser globals for running the sentinel under node
+DOM_HARNESS = r"""
+const observers = [];
+globalThis.window = globalThis;
+globalThis.location = {
+    href: "https://www.saucedemo.com/v1/", origin: "https://www.saucedemo.com",
+};
+globalThis.sessionStorage = {getItem() { return null; }, setItem() {}, removeItem() {}};
+globalThis.Node = {ELEMENT_NODE: 1};
+globalThis.Document = function () {};
+Document.prototype = {write() {}, writeln() {}};
+globalThis.document = {readyState: "complete", addEventListener() {}};
+globalThis.MutationObserver = class {
+    constructor(callback) { observers.push(callback); }
+    observe() {}
+};
+globalThis.open = () => null;
+const element = (tagName, attributes) => ({
+    nodeType: 1,
+    tagName,
+    attributes: Object.entries(attributes).map(([name, value]) => ({name, value})),
+    getAttribute(name) { return name in attributes ? attributes[name] : null; },
+});
+"""
+
+
+def run_sentinel(code):
+    """Run the sentinel under node followed by ``code`` and return its events."""
+    drain = "console.log(JSON.stringify(window.__xssSentinel.drain()));"
+    script = DOM_HARNESS + SENTINEL_SCRIPT + ";\n" + code + "\n" + drain
+    output = subprocess.run(
+        ["node", "-e", script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def observe(mutations):
+    """Run the sentinel under node, feed it mutations and return its event kinds."""
+    events = run_sentinel(f"""
+    const mutations = {json.dumps(mutations)}.map(m => ({{
+        type: m.type, attributeName: m.name || null, attributeNamespace: null,
+        target: element(m.tag, m.attributes || {{}}),
+        addedNodes: (m.added || []).map(n => element(n.tag, n.attributes)),
+    }}));
+    observers.forEach(callback => callback(mutations));
+    """)
+    return [event["kind"] for event in events]
+
+
+@pytest.mark.unit
+class TestXssSentinel:
+    """Test cases for installing the sentinel and draining its events."""
+
+    def test_install_covers_future_and_open_pages(self):
+        """Test that the script is added to the context and run in open pages."""
+        page = FakePage()
+        context = FakeContext([page])
+
+        XssSentinel(context).install()
+
+        assert context.init_scripts == [SENTINEL_SCRIPT]
+        assert page.scripts == [SENTINEL_SCRIPT]
+
+    def test_drain_reads_and_clears_all_pages(self):
+        """Test that events of every page are returned once."""
+        event = {"kind": "dialog", "detail": "alert: 1", "url": "https://example.test/"}
+        first, second = FakePage([event]), FakePage([dict(event, kind="eval")])
+        sentinel = XssSentinel(FakeContext([first, second]))
+
+        events = sentinel.drain()
+
+        assert [item.kind for item in events] == ["dialog", "eval"]
+        assert str(events[0]) == "dialog: alert: 1 (https://example.test/)"
+        assert sentinel.drain() == [] and sentinel.drain(first) == []
+
+    def test_helper_reports_execution(self):
+        """Test that the security helper checks the sentinel buffer."""
+        page = FakePage(
+            [{"kind": "script", "detail": "alert(1)", "url": "about:blank"}]
+        )
+
+        assert SecurityTestHelpers.check_for_xss_execution(page)
+        assert not SecurityTestHelpers.check_for_xss_execution(page)
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+    def test_javascript_text_in_value_is_not_flagged(self):
+        """Test that only a changed URL attribute counts as a javascript: URL."""
+        payload = "javascript:confirm('XSS')"
+
+        assert (
+            observe(
+                [
+                    {
+                        "type": "attributes",
+                        "tag": "INPUT",
+                        "name": "value",
+                        "attributes": {"value": payload},
+                    },
+                    {
+                        "type": "attributes",
+                        "tag": "A",
+                        "name": "title",
+                        "attributes": {"title": "x", "href": payload},
+                    },
+                    {
+                        "type": "childList",
+                        "tag": "DIV",
+                        "added": [{"tag": "INPUT", "attributes": {"value": payload}}],
+                    },
+                ]
+            )
+            == []
+        )
+        assert observe(
+            [
+                {
+                    "type": "attributes",
+                    "tag": "A",
+                    "name": "href",
+                    "attributes": {"href": payload},
+                },
+                {
+                    "type": "childList",
+                    "tag": "DIV",
+                    "added": [{"tag": "IMG", "attributes": {"onerror": "x()"}}],
+                },
+            ]
+        ) == ["javascript-url", "handler"]
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+    def test_only_marked_code_is_flagged_and_eval_is_untouched(self):
+        """Test that only marked Function code is recorded and eval stays native."""
+        events = run_sentinel("""
+        Function("return this")();
+        new Function("a", "return a + 1")(1);
+        Function("alert('XSS')");
+        (function () {
+            const local = 41;
+            if (eval("local + 1") !== 42) throw new Error("direct eval lost its scope");
+        })();
+        """)
+
+        assert [event["detail"] for event in events] == ["Function: alert('XSS')"]
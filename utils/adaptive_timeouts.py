@@ -0,0 +1,127 @@
+"""
+Adaptive timeouts learned from historical action latency.
+
+Page objects record how long each action takes per page, action and selector.
+Timeouts are then derived from a high percentile of that history plus a
+margin, so a genuinely broken wait fails in seconds instead of burning the full
+static budget. Keys without enough history fall back to the static default.
+
+Latency is always recorded, so history builds up across runs; only using it
+for timeouts is switched by ``ADAPTIVE_TIMEOUTS``.
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+DEFAULT_DIRECTORY = "reports/.latency"
+
+
+class LatencyStore:
+    """Per-key latency history persisted across runs."""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_DIRECTORY,
+        adapt: bool = True,
+        percentile: float = 0.99,
+        factor: float = 2.0,
+        margin_ms: int = 500,
+        floor_ms: int = 1000,
+        min_samples: int = 20,
+        max_samples: int = 200,
+    ):
+        """Initialize latency store; ``adapt`` toggles learned timeouts only."""
+        self.directory = Path(directory)
+        self.adapt = adapt
+        self.percentile = percentile
+        self.factor = factor
+        self.margin_ms = margin_ms
+        self.floor_ms = floor_ms
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self._history: Dict[str, List[float]] = {}
+        self._recorded: Dict[str, List[float]] = {}
+        self._timeouts: Dict[str, int] = {}
+        if adapt:
+            self.load()
+
+    def record(self, key: str, duration_ms: float) -> None:
+        """Record the duration of a successful action."""
+        self._recorded.setdefault(key, []).append(round(duration_ms, 1))
+
+    def timeout_for(self, key: str, default_ms: int) -> int:
+        """Get adaptive timeout for a key, or the static default without history."""
+        if not self.adapt:
+            return default_ms
+        timeout = self._timeouts.get(key)
+        if timeout is None:
+            samples = self._history.get(key, ())
+            if len(samples) < self.min_samples:
+                timeout = 0
+            else:
+                learned = (
+                    _percentile(sorted(samples), self.percentile) * self.factor
+                    + self.margin_ms
+                )
+                timeout = int(max(self.floor_ms, learned))
+            self._timeouts[key] = timeout
+        return min(timeout, default_ms) if timeout else default_ms
+
+    def samples(self, key: str) -> List[float]:
+        """Get historical plus newly recorded samples for a key."""
+        return self._history.get(key, []) + self._recorded.get(key, [])
+
+    def load(self) -> None:
+        """Load history written by previous runs and other workers."""
+        self._history.clear()
+        self._timeouts.clear()
+        for path in sorted(self.directory.glob("latency-*.json")):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                logger.warning(f"Ignoring unreadable latency history: {path}")
+                continue
+            for key, samples in data.items():
+                self._history.setdefault(key, []).extend(samples)
+
+    def save(self, worker_id: Optional[str] = None) -> Optional[Path]:
+        """Append this process' samples to its own history file."""
+        if not self._recorded:
+            return None
+        worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "main")
+        path = self.directory / f"latency-{worker_id}.json"
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        for key, samples in self._recorded.items():
+            data[key] = (data.get(key, []) + samples)[-self.max_samples :]
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, separators=(",", ":")))
+        self._recorded.clear()
+        logger.info(f"Saved latency history for {len(data)} actions to {path}")
+        return path
+
+
+def _percentile(sorted_samples: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples."""
+    rank = max(1, math.ceil(percentile * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+_store: Dict[str, LatencyStore] = {}
+
+
+def get_latency_store() -> LatencyStore:
+    """Get the process-wide latency store configured from settings."""
+    store = _store.get("current")
+    if store is None:
+        from config.settings import get_settings
+
+        store = _store["current"] = LatencyStore(adapt=get_settings().adaptive_timeouts)
+    return store
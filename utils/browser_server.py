@@ -0,0 +1,308 @@
+"""
+Persistent Playwright browser server reused across pytest invocations.
+
+The server is started with the public ``playwright launch-server`` command and
+keeps a browser running in the background; test sessions attach to it with
+``BrowserType.connect`` instead of launching a new browser every run.
+
+Usage:
+    python -m utils.browser_server start --browser chromium
+    python -m utils.browser_server status
+    python -m utils.browser_server stop
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from loguru import logger
+
+BROWSERS = ("chromium", "firefox", "webkit")
+
+
+class BrowserServer:
+    """Manage one long-lived browser server for a browser engine."""
+
+    def __init__(
+        self,
+        settings,
+        browser_name: str = "chromium",
+        state_dir: str = "reports/.browser-server",
+        startup_timeout: float = 30.0,
+    ):
+        """Initialize browser server manager."""
+        if browser_name not in BROWSERS:
+            raise ValueError(
+                f"Unsupported browser '{browser_name}', expected one of {BROWSERS}"
+            )
+        self.settings = settings
+        self.browser_name = browser_name
+        self.state_dir = Path(state_dir)
+        self.startup_timeout = startup_timeout
+        self.host = "127.0.0.1"
+        self.port = settings.browser_server_port + BROWSERS.index(browser_name)
+        self.ws_path = f"/playwright-{browser_name}"
+
+    @property
+    def endpoint(self) -> str:
+        """Get WebSocket endpoint clients connect to."""
+        return f"ws://{self.host}:{self.port}{self.ws_path}"
+
+    @property
+    def state_file(self) -> Path:
+        """Get path of the state file describing the running server."""
+        return self.state_dir / f"{self.browser_name}.json"
+
+    def launch_options(self) -> Dict:
+        """Get server launch options derived from Settings.get_browser_args."""
+        browser_args = self.settings.get_browser_args()
+        # slow_mo is a client-side option and is applied in connect_options()
+        options = {
+            key: value for key, value in browser_args.items() if key != "slow_mo"
+        }
+        options.update({"host": self.host, "port": self.port, "wsPath": self.ws_path})
+        return options
+
+    def connect_options(self) -> Dict:
+        """Get keyword arguments for BrowserType.connect."""
+        return {
+            "ws_endpoint": self.endpoint,
+            "slow_mo": self.settings.get_browser_args().get("slow_mo", 0),
+        }
+
+    def ensure(self) -> str:
+        """Make sure a healthy server is running and return its endpoint.
+
+        A server that died, stopped answering, or was started with different
+        launch flags is restarted automatically.
+        """
+        with self._lock():
+            state = self._read_state()
+            if (
+                state
+                and state.get("config") == self._config_hash()
+                and self.is_healthy(state)
+            ):
+                logger.info(
+                    f"Reusing {self.browser_name} browser server at {self.endpoint}"
+                )
+                return self.endpoint
+            if state:
+                logger.warning(
+                    f"Restarting unhealthy or outdated {self.browser_name} "
+                    "browser server"
+                )
+                self._terminate(state.get("pid"))
+            self._start()
+            return self.endpoint
+
+    def is_healthy(self, state: Optional[Dict] = None) -> bool:
+        """Check the server process is alive and accepting connections."""
+        state = state if state is not None else self._read_state()
+        if not state or not _pid_alive(state.get("pid")):
+            return False
+        return _port_open(self.host, self.port)
+
+    def stop(self) -> bool:
+        """Stop the server if it is running."""
+        with self._lock():
+            state = self._read_state()
+            if not state:
+                return False
+            self._terminate(state.get("pid"))
+            self.state_file.unlink(missing_ok=True)
+            logger.info(f"Stopped {self.browser_name} browser server")
+            return True
+
+    def status(self) -> Dict:
+        """Get a status summary of the server."""
+        state = self._read_state() or {}
+        return {
+            "browser": self.browser_name,
+            "endpoint": self.endpoint,
+            "pid": state.get("pid"),
+            "healthy": self.is_healthy(state) if state else False,
+            "started_at": state.get("started_at"),
+        }
+
+    def launch_command(self, config_path: Path) -> List[str]:
+        """Get the public ``playwright launch-server`` command for this browser."""
+        return [
+            sys.executable,
+            "-m",
+            "playwright",
+            "launch-server",
+            "--browser",
+            self.browser_name,
+            "--config",
+            str(config_path),
+        ]
+
+    def _start(self) -> None:
+        """Start the server process and wait until it accepts connections."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        config_path = self.state_dir / f"{self.browser_name}.config.json"
+        config_path.write_text(json.dumps(self.launch_options()))
+        log_file = open(self.state_dir / f"{self.browser_name}.log", "ab")
+
+        detach = (
+            {
+                "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP
+                | subprocess.DETACHED_PROCESS
+            }
+            if os.name == "nt"
+            else {"start_new_session": True}
+        )
+        logger.info(f"Starting {self.browser_name} browser server at {self.endpoint}")
+        process = subprocess.Popen(
+            self.launch_command(config_path),
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            **detach,
+        )
+        log_file.close()
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(
+                    f"Browser server exited with code {process.returncode}, "
+                    f"see {self.state_dir / (self.browser_name + '.log')}"
+                )
+            if _port_open(self.host, self.port):
+                self._write_state(
+                    {
+                        "pid": process.pid,
+                        "endpoint": self.endpoint,
+                        "config": self._config_hash(),
+                        "started_at": time.time(),
+                    }
+                )
+                return
+            time.sleep(0.1)
+
+        self._terminate(process.pid)
+        raise TimeoutError(
+            f"Browser server did not start within {self.startup_timeout}s"
+        )
+
+    def _terminate(self, pid: Optional[int]) -> None:
+        """Terminate a server process, ignoring ones that already exited."""
+        if not _pid_alive(pid):
+            return
+        try:
+            # The CLI runs the driver as a child, so signal its whole session
+            if os.name == "nt":
+                os.kill(pid, signal.SIGTERM)
+            else:
+                os.killpg(pid, signal.SIGTERM)
+        except OSError:
+            return
+        deadline = time.monotonic() + 5
+        while _pid_alive(pid) and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+    def _config_hash(self) -> str:
+        """Hash launch options so changed flags trigger a restart."""
+        payload = json.dumps(self.launch_options(), sort_keys=True).encode()
+        return hashlib.sha256(payload).hexdigest()[:16]
+
+    def _read_state(self) -> Optional[Dict]:
+        """Read state file of the running server."""
+        try:
+            return json.loads(self.state_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_state(self, state: Dict) -> None:
+        """Write state file of the running server."""
+        self.state_file.write_text(json.dumps(state))
+
+    @contextmanager
+    def _lock(self, timeout: float = 60.0) -> Iterator[None]:
+        """Serialize start/stop across processes such as xdist workers."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = self.state_dir / f"{self.browser_name}.lock"
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                # Treat locks older than the timeout as left behind by a crash
+                try:
+                    if time.time() - lock_path.stat().st_mtime > timeout:
+                        lock_path.unlink(missing_ok=True)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {lock_path}")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            lock_path.unlink(missing_ok=True)
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    """Check if a process with the given PID exists."""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _port_open(host: str, port: int, timeout: float = 0.5) -> bool:
+    """Check if a TCP port accepts connections."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def main() -> None:
+    """Command-line entry point for managing browser servers."""
+    from config.settings import get_settings
+
+    parser = argparse.ArgumentParser(description="Persistent Playwright browser server")
+    parser.add_argument("action", choices=["start", "stop", "restart", "status"])
+    parser.add_argument(
+        "--browser",
+        choices=BROWSERS,
+        action="append",
+        help="Browser engine (default: BROWSERS/BROWSER from .env)",
+    )
+    args = parser.parse_args()
+
+    settings = get_settings()
+    for browser_name in args.browser or settings.browsers:
+        server = BrowserServer(settings, browser_name)
+        if args.action in ("stop", "restart"):
+            server.stop()
+        if args.action in ("start", "restart"):
+            server.ensure()
+        print(json.dumps(server.status()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
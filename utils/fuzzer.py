@@ -0,0 +1,470 @@
+"""
+Feedback-guided fuzzer for input fields such as the login form.
+
+Mutants are produced by a seeded, generator-based pipeline of stacked
+mutation operators (bit flips, character edits, dictionary splices from
+``SecurityPayloads`` and encoding transforms) and deduplicated. Every mutant
+is run against a target, which returns a ``ResponseSignature`` built from
+error text, outcome, timing bucket, DOM shape and the categories of
+sensitive data leaked in the error text. Inputs that produce a
+signature not seen before are kept and get more energy, so later mutations
+concentrate on the inputs that changed the application's behaviour.
+
+Targets evaluate batches of inputs, either serially on a page
+(``LoginTarget``) or across a process pool of browsers (``LoginFuzzPool``).
+"""
+
+import hashlib
+import html
+import math
+import random
+import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import quote, urlparse
+
+from loguru import logger
+
+from .leak_scanner import get_scanner
+
+# Evaluates a batch of inputs, returning one signature per input in order
+BatchTarget = Callable[[List[str]], List["ResponseSignature"]]
+Operator = Callable[[random.Random, str, Sequence[str]], str]
+
+# Leak categories that count as a finding; credential words are in normal login errors
+LEAK_CATEGORIES = frozenset({"database", "diagnostics", "filesystem", "infrastructure"})
+
+# Tag and class of every element, a cheap stand-in for a DOM diff
+_DOM_SHAPE_SCRIPT = """() => Array.from(
+    document.body ? document.body.querySelectorAll("*") : [],
+    element => element.tagName + "."
+        + (typeof element.className === "string" ? element.className : "")
+).sort().join("|")"""
+
+
+@dataclass(frozen=True)
+class ResponseSignature:
+    """Observable behaviour of the application for one input."""
+
+    outcome: str
+    error_text: str = ""
+    timing_bucket: int = 0
+    dom_hash: str = ""
+    leaks: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def build(
+        cls,
+        outcome: str,
+        error_text: str,
+        elapsed_ms: float,
+        dom_shape: str,
+        payload: str = "",
+    ) -> "ResponseSignature":
+        """Build a signature, normalizing away reflected input, numbers and jitter."""
+        if payload:
+            error_text = error_text.replace(payload, "<input>")
+        # Scan before numbers are normalized so e.g. "ORA-00933" is still recognized
+        leaks = frozenset(get_scanner(LEAK_CATEGORIES).categories_in(error_text))
+        error_text = re.sub(r"\d+", "0", error_text.strip())
+        # Log2 buckets (0-1ms, 2-3ms, 4-7ms, ...): only large timing shifts are new
+        timing_bucket = int(math.log2(elapsed_ms + 1))
+        dom_hash = (
+            hashlib.sha1(dom_shape.encode()).hexdigest()[:12] if dom_shape else ""
+        )
+        return cls(outcome, error_text, timing_bucket, dom_hash, leaks)
+
+
+@dataclass
+class FuzzResult:
+    """Input evaluated by the fuzzer and what it produced."""
+
+    payload: str
+    signature: ResponseSignature
+    novel: bool
+
+
+@dataclass
+class FuzzReport:
+    """Outcome of a fuzzing run."""
+
+    seed: int
+    results: List[FuzzResult] = field(default_factory=list)
+
+    @property
+    def interesting(self) -> List[FuzzResult]:
+        """Get inputs that produced a previously unseen signature."""
+        return [result for result in self.results if result.novel]
+
+    def signatures(self) -> Dict[ResponseSignature, int]:
+        """Get how often each signature was observed."""
+        counts: Dict[ResponseSignature, int] = {}
+        for result in self.results:
+            counts[result.signature] = counts.get(result.signature, 0) + 1
+        return counts
+
+    def leaks(self) -> List[FuzzResult]:
+        """Get inputs whose response leaked sensitive data."""
+        return [result for result in self.results if result.signature.leaks]
+
+
+# ========== MUTATION OPERATORS ==========
+
+
+def bit_flip(rng: random.Random, data: str, dictionary: Sequence[str]) -> str:
+    """Flip one bit of one character's code point."""
+    if not data:
+        return data
+    index = rng.randrange(len(data))
+    code = ord(data[index])
+    code ^= 1 << rng.randrange(7 if code < 0x80 else 16)
+    if 0xD800 <= code <= 0xDFFF or code > 0x10FFFF:
+        code = ord("A")
+    return data[:index] + chr(code) + data[index + 1 :]
+
+
+def insert_char(rng: random.Random, data: str, dictionary: Sequence[str]) -> str:
+    """Insert a random printable character."""
+    index = rng.randint(0, len(data))
+    return data[:index] + rng.choice(string.printable) + data[index:]
+
+
+def delete_char(rng: random.Random, data: str, dictionary: Sequence[str]) -> str:
+    """Delete a random character."""
+    if len(data) < 2:
+        return data
+    index = rng.randrange(len(data))
+    return data[:index] + data[index + 1 :]
+
+
+def replace_char(rng: random.Random, data: str, dictionary: Sequence[str]) -> str:
+    """Replace a random character with a printable one."""
+    if not data:
+        return rng.choice(string.printable)
+    index = rng.randrange(len(data))
+    return data[:index] + rng.choice(string.printable) + data[index + 1 :]
+
+
+def splice_dictionary(rng: random.Random, data: str, dictionary: Sequence[str]) -> str:
+    """Insert or overwrite a slice with a known attack payload or token."""
+    token = rng.choice(dictionary)
+    start = rng.randint(0, len(data))
+    end = start if rng.random() < 0.5 else rng.randint(start, len(data))
+    return data[:start] + token + data[end:]
+
+
+def repeat_slice(rng: random.Random, data: str, dictionary: Sequence[str]) -> str:
+    """Repeat a slice to probe length handling."""
+    if not data:
+        return data
+    start = rng.randrange(len(data))
+    end = rng.randint(start + 1, len(data))
+    return data[:end] + data[start:end] * rng.randint(2, 16) + data[end:]
+
+
+_ENCODINGS: Dict[str, Callable[[str], str]] = {
+    "url": lambda text: quote(text, safe=""),
+    "double_url": lambda text: quote(quote(text, safe=""), safe=""),
+    "html_entities": lambda text: "".join(f"&#{ord(char)};" for char in text),
+    "html_escape": html.escape,
+    "unicode_escape": lambda text: "".join(f"\\u{ord(char):04x}" for char in text),
+    "fullwidth": lambda text: "".join(
+        chr(ord(char) + 0xFEE0) if "!" <= char <= "~" else char for char in text
+    ),
+    "swapcase": str.swapcase,
+}
+
+
+def encode_slice(rng: random.Random, data: str, dictionary: Sequence[str]) -> str:
+    """Apply an encoding transform to a random slice."""
+    if not data:
+        return data
+    start = rng.randrange(len(data))
+    end = rng.randint(start + 1, len(data))
+    encode = _ENCODINGS[rng.choice(sorted(_ENCODINGS))]
+    return data[:start] + encode(data[start:end]) + data[end:]
+
+
+OPERATORS: Tuple[Operator, ...] = (
+    bit_flip,
+    insert_char,
+    delete_char,
+    replace_char,
+    splice_dictionary,
+    repeat_slice,
+    encode_slice,
+)
+
+
+@lru_cache(maxsize=None)
+def default_dictionary() -> Tuple[str, ...]:
+    """Get splice tokens: every SecurityPayloads payload plus their individual words."""
+    from .security_payloads import SecurityPayloads
+
+    payloads = [
+        *SecurityPayloads.get_all_sql_payloads(),
+        *SecurityPayloads.get_all_xss_payloads(),
+        *SecurityPayloads.COMMAND_INJECTION,
+        *SecurityPayloads.LDAP_INJECTION,
+        *SecurityPayloads.PATH_TRAVERSAL,
+        *SecurityPayloads.FORMAT_STRING,
+        *SecurityPayloads.NULL_BYTE,
+    ]
+    tokens = {word for payload in payloads for word in payload.split()}
+    return tuple(sorted(set(payloads) | tokens))
+
+
+# ========== ENGINE ==========
+
+
+class Fuzzer:
+    """Seeded mutation engine with signature feedback."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        dictionary: Optional[Sequence[str]] = None,
+        operators: Sequence[Operator] = OPERATORS,
+        max_stack: int = 4,
+        max_length: int = 512,
+    ):
+        """Initialize fuzzer."""
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.dictionary = (
+            tuple(dictionary) if dictionary is not None else default_dictionary()
+        )
+        self.operators = tuple(operators)
+        self.max_stack = max_stack
+        self.max_length = max_length
+        self._seen: set = set()
+
+    def mutate(self, data: str) -> str:
+        """Apply a random stack of operators to one input."""
+        for _ in range(self.rng.randint(1, self.max_stack)):
+            operator = self.rng.choice(self.operators)
+            data = operator(self.rng, data, self.dictionary)
+        return data[: self.max_length]
+
+    def mutations(self, base: str, count: int, max_attempts: int = 20) -> Iterator[str]:
+        """Yield up to ``count`` unique mutants of ``base`` not produced before."""
+        produced = 0
+        misses = 0
+        while produced < count and misses < max_attempts:
+            mutant = self.mutate(base)
+            if mutant in self._seen:
+                misses += 1
+                continue
+            misses = 0
+            self._seen.add(mutant)
+            produced += 1
+            yield mutant
+
+    def run(
+        self,
+        target: BatchTarget,
+        seeds: Iterable[str],
+        budget: int,
+        batch_size: int = 1,
+    ) -> FuzzReport:
+        """Fuzz ``target`` for ``budget`` inputs, favouring novel signatures.
+
+        Each queue entry has an energy; parents are picked proportionally to
+        it. A child with an unseen signature joins the queue with high energy
+        and rewards its parent, while parents that stop producing anything
+        new slowly lose energy.
+        """
+        report = FuzzReport(self.seed)
+        known: set = set()
+        queue: List[str] = []
+        energy: List[float] = []
+
+        initial = [
+            payload for payload in dict.fromkeys(seeds) if payload not in self._seen
+        ]
+        if not initial:
+            raise ValueError("Fuzzing needs at least one new seed input")
+        self._seen.update(initial)
+        for payload, signature in zip(initial, target(initial)):
+            novel = signature not in known
+            known.add(signature)
+            report.results.append(FuzzResult(payload, signature, novel))
+            queue.append(payload)
+            energy.append(4.0 if novel else 1.0)
+
+        while len(report.results) < budget:
+            size = min(batch_size, budget - len(report.results))
+            parents = self.rng.choices(range(len(queue)), weights=energy, k=size)
+            batch = [
+                (parent, mutant)
+                for parent in parents
+                for mutant in self.mutations(queue[parent], 1)
+            ]
+            if not batch:
+                logger.info("Fuzzer exhausted unique mutants")
+                break
+            signatures = target([mutant for _, mutant in batch])
+            for (parent, mutant), signature in zip(batch, signatures):
+                novel = signature not in known
+                report.results.append(FuzzResult(mutant, signature, novel))
+                if novel:
+                    known.add(signature)
+                    queue.append(mutant)
+                    energy.append(4.0)
+                    energy[parent] += 1.0
+                else:
+                    energy[parent] = max(0.1, energy[parent] * 0.9)
+
+        logger.info(
+            f"Fuzzed {len(report.results)} inputs (seed {self.seed}): "
+            f"{len(known)} distinct signatures, "
+            f"{len(report.interesting)} interesting inputs"
+        )
+        return report
+
+
+# ========== LOGIN FORM TARGETS ==========
+
+
+class LoginTarget:
+    """Run inputs through the login form of a page and capture signatures."""
+
+    def __init__(
+        self, login_page, password: str = "password", target_field: str = "username"
+    ):
+        """Initialize target for a LoginPage object."""
+        self.login_page = login_page
+        self.password = password
+        self.target_field = target_field
+
+    def __call__(self, inputs: List[str]) -> List[ResponseSignature]:
+        """Evaluate a batch of inputs."""
+        return [self.evaluate(payload) for payload in inputs]
+
+    def evaluate(self, payload: str) -> ResponseSignature:
+        """Submit one input and capture the application's response."""
+        username, password = (
+            (payload, self.password)
+            if self.target_field == "username"
+            else ("fuzz", payload)
+        )
+        return self.submit(username, password, payload)
+
+    def submit(
+        self, username: str, password: str, payload: str = ""
+    ) -> ResponseSignature:
+        """Submit credentials and capture the response, ignoring ``payload`` echoes."""
+        login = self.login_page
+        if login.count(login.login_button) == 0:
+            login.open()
+        login.clear_username()
+        login.clear_password()
+        path_before = urlparse(login.get_url()).path
+        start = perf_counter_ns()
+        login.login(username, password)
+        elapsed_ms = (perf_counter_ns() - start) / 1e6
+
+        error_text = login.get_error_message() if login.is_error_displayed() else ""
+        path = urlparse(login.get_url()).path
+        outcome = (
+            "error"
+            if error_text
+            else ("no-response" if path == path_before else f"navigated:{path}")
+        )
+        return ResponseSignature.build(
+            outcome,
+            error_text,
+            elapsed_ms,
+            login.page.evaluate(_DOM_SHAPE_SCRIPT),
+            payload,
+        )
+
+
+# Browser and target of a pool worker process
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(
+    browser_name: str, browser_args: Dict, password: str, target_field: str
+) -> None:
+    """Start a browser with ``browser_args`` in a pool worker and open the login."""
+    from multiprocessing.util import Finalize
+
+    from playwright.sync_api import sync_playwright
+
+    from pages.saucedemo import LoginPage
+
+    playwright = sync_playwright().start()
+    browser = getattr(playwright, browser_name).launch(**browser_args)
+    login_page = LoginPage(browser.new_page())
+    login_page.open()
+    _worker["target"] = LoginTarget(login_page, password, target_field)
+    # Pool workers leave through os._exit, so atexit never runs; finalizers
+    # with an exitpriority do run once the worker's loop returns on shutdown
+    Finalize(None, _close_worker, args=(browser, playwright), exitpriority=10)
+
+
+def _close_worker(browser, playwright) -> None:
+    """Close a pool worker's browser and stop its Playwright driver."""
+    _worker.clear()
+    browser.close()
+    playwright.stop()
+
+
+def _evaluate_in_worker(payload: str) -> ResponseSignature:
+    """Evaluate one input with the worker's browser."""
+    return _worker["target"].evaluate(payload)
+
+
+class LoginFuzzPool:
+    """Process pool where every worker drives its own browser against the login form."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        browser_name: str = "chromium",
+        browser_args: Optional[Dict] = None,
+        password: str = "password",
+        target_field: str = "username",
+    ):
+        """Initialize pool settings; workers start on enter.
+
+        ``browser_args`` defaults to ``Settings.get_browser_args()``, so workers
+        launch like every other browser in the suite.
+        """
+        if browser_args is None:
+            from config.settings import get_settings
+
+            browser_args = get_settings().get_browser_args()
+        self.workers = workers
+        self.initargs = (browser_name, browser_args, password, target_field)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "LoginFuzzPool":
+        """Start the worker processes."""
+        self._executor = ProcessPoolExecutor(
+            self.workers, initializer=_init_worker, initargs=self.initargs
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
+
+    def __call__(self, inputs: List[str]) -> List[ResponseSignature]:
+        """Evaluate a batch of inputs across the pool, preserving order."""
+        return list(self._executor.map(_evaluate_in_worker, inputs))
@@ -0,0 +1,200 @@
+"""
+Sensitive-data leak scanner for error text, DOM snapshots and HTTP bodies.
+
+Scanning is two-staged: a literal substring prefilter (C-speed ``in`` checks
+on the lower-cased text) finds which terms can occur at all, then a single
+case-insensitive regex compiled for just those terms - one named group per
+category, with word boundaries - reports every hit with its position. Clean
+texts never reach the regex. ``scan_many`` joins a batch of texts so the
+prefilter and the regex run once per batch, which keeps scanning cheap enough
+to run on every response.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple, Union
+
+Term = Union[str, Tuple[str, str]]
+
+# Category -> terms. Plain words also match their plural; patterns are given
+# as (regex, literal hint) where the hint must occur for the pattern to match.
+LEAK_PATTERNS: Dict[str, Tuple[Term, ...]] = {
+    "database": (
+        "mysql",
+        "sql",
+        "database",
+        "table",
+        "column",
+        "syntax",
+        "version",
+        "oracle",
+        "postgresql",
+        "sqlite",
+        "mongodb",
+        "redis",
+        "sqlstate",
+        "odbc",
+        "information_schema",
+        (r"ora-\d{5}", "ora-"),
+    ),
+    "diagnostics": (
+        "error",
+        "exception",
+        "stack",
+        "trace",
+        "debug",
+        (r"traceback \(most recent call last\)", "traceback"),
+        (r"line \d+", "line "),
+    ),
+    "credentials": ("admin", "root", "password", "username", "credential"),
+    "filesystem": (
+        "path",
+        "directory",
+        "file",
+        (r"/(?:etc|var|usr|home|tmp)/[\w./-]+", "/"),
+        (r"[a-z]:\\[\w\\.-]+", ":\\"),
+    ),
+    "infrastructure": (
+        "system",
+        "server",
+        "connection",
+        "driver",
+        "port",
+        "host",
+        "localhost",
+        (r"\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?", "."),
+    ),
+}
+
+# Separates texts in scan_many; never part of a match
+_SEPARATOR = "\x00"
+
+
+@dataclass(frozen=True)
+class Leak:
+    """Sensitive term found in a text."""
+
+    category: str
+    term: str
+    start: int
+    end: int
+
+
+# (category, regex alternative, literal hint) for every term
+_TERMS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (
+        (category, rf"{re.escape(term)}s?", term)
+        if isinstance(term, str)
+        else (category, *term)
+    )
+    for category, terms in LEAK_PATTERNS.items()
+    for term in terms
+)
+
+
+@lru_cache(maxsize=256)
+def _compile(terms: FrozenSet[int]) -> Pattern:
+    """Compile one pattern with a named group per category for the given terms."""
+    by_category: Dict[str, List[str]] = {}
+    for index in sorted(terms):
+        category, alternative, _ = _TERMS[index]
+        by_category.setdefault(category, []).append(alternative)
+    groups = []
+    for category, alternatives in by_category.items():
+        # Longest first so e.g. "postgresql" wins over shorter overlapping terms
+        alternatives = "|".join(sorted(alternatives, key=len, reverse=True))
+        # Hyphens count as part of a word so class names like "error-button" don't match
+        groups.append(rf"(?P<{category}>(?<![\w-])(?:{alternatives})(?![\w-]))")
+    return re.compile("|".join(groups), re.IGNORECASE)
+
+
+class LeakScanner:
+    """Scan texts for sensitive terms, reporting category and position."""
+
+    def __init__(self, categories: Optional[Iterable[str]] = None):
+        """Initialize scanner for all or selected categories."""
+        categories = (
+            frozenset(categories)
+            if categories is not None
+            else frozenset(LEAK_PATTERNS)
+        )
+        unknown = categories - set(LEAK_PATTERNS)
+        if unknown:
+            raise ValueError(
+                f"Unknown leak categories {sorted(unknown)}, "
+                f"expected {tuple(LEAK_PATTERNS)}"
+            )
+        self.categories = categories
+        self._hints = [
+            (index, hint)
+            for index, (category, _, hint) in enumerate(_TERMS)
+            if category in categories
+        ]
+
+    def pattern_for(self, text: str) -> Optional[Pattern]:
+        """Get the pattern for terms whose literal hint occurs in the text, if any."""
+        lowered = text.lower()
+        present = frozenset(index for index, hint in self._hints if hint in lowered)
+        return _compile(present) if present else None
+
+    def scan(self, text: str) -> List[Leak]:
+        """Find all sensitive terms in a text."""
+        pattern = self.pattern_for(text)
+        if pattern is None:
+            return []
+        return [
+            Leak(match.lastgroup, match.group().lower(), match.start(), match.end())
+            for match in pattern.finditer(text)
+        ]
+
+    def scan_many(self, texts: Iterable[str]) -> List[List[Leak]]:
+        """Scan a batch of texts in one pass; positions are relative to each text."""
+        texts = [text.replace(_SEPARATOR, " ") for text in texts]
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        results: List[List[Leak]] = [[] for _ in texts]
+        joined = _SEPARATOR.join(texts)
+        pattern = self.pattern_for(joined)
+        if pattern is None:
+            return results
+        for match in pattern.finditer(joined):
+            index = bisect_right(offsets, match.start()) - 1
+            offset = offsets[index]
+            results[index].append(
+                Leak(
+                    match.lastgroup,
+                    match.group().lower(),
+                    match.start() - offset,
+                    match.end() - offset,
+                )
+            )
+        return results
+
+    def categories_in(self, text: str) -> Set[str]:
+        """Get categories of all sensitive terms in a text."""
+        return {leak.category for leak in self.scan(text)}
+
+    def terms_in(self, text: str) -> List[str]:
+        """Get distinct sensitive terms in order of first appearance."""
+        return list(dict.fromkeys(leak.term for leak in self.scan(text)))
+
+    def scan_response(self, response) -> List[Leak]:
+        """Scan the body of an HTTP response."""
+        return self.scan(response.text)
+
+    def scan_page(self, page) -> List[Leak]:
+        """Scan the visible text of a Playwright page, not its markup or class names."""
+        return self.scan(
+            page.evaluate("() => document.body ? document.body.innerText : ''")
+        )
+
+
+@lru_cache(maxsize=None)
+def get_scanner(categories: Optional[FrozenSet[str]] = None) -> LeakScanner:
+    """Get a shared scanner for all or selected categories."""
+    return LeakScanner(categories)
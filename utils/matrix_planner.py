@@ -0,0 +1,227 @@
+"""
+Combinatorial test-matrix planner with pairwise reduction and pruning.
+
+Testing every payload class against every field and user persona multiplies
+quickly (e.g. 30 classes x 3 fields x 4 personas = 360 logins). The planner
+instead builds a pairwise covering array: every pair of values of any two
+dimensions appears in at least one case, which takes roughly
+``largest dimension x second largest`` cases.
+
+Cases are handed out round-robin over the pruning dimension (by default the
+payload class), and the caller records the response signature of each case.
+A class whose first ``stable_after`` cases all produced the same signature is
+treated as one equivalence class by the application and its remaining cases
+are skipped. Each case of a class uses the next payload of that class, so the
+concrete payloads rotate and coverage keeps growing as classes are added.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+# (dimension index, value index) pairs covered by a case
+Pair = Tuple[Tuple[int, int], Tuple[int, int]]
+
+# Login form fields a payload can be injected into
+LOGIN_FIELDS = ("username", "password", "both")
+
+
+def pairwise(
+    dimensions: Mapping[str, Sequence], seed: int = 0, candidates: int = 20
+) -> List[Dict[str, object]]:
+    """Build a pairwise covering array for the dimensions, reproducibly per seed.
+
+    Greedy (AETG-style): each case starts from an uncovered pair and fills the
+    remaining dimensions with the values covering the most uncovered pairs;
+    the best of ``candidates`` attempts is kept.
+    """
+    names = list(dimensions)
+    values = [list(dimensions[name]) for name in names]
+    empty = [name for name, options in zip(names, values) if not options]
+    if empty:
+        raise ValueError(f"Dimensions without values: {empty}")
+    if len(names) < 2:
+        return [{name: value} for name in names for value in values[0]]
+
+    rng = random.Random(seed)
+    uncovered: Set[Pair] = {
+        ((i, a), (j, b))
+        for i in range(len(names))
+        for j in range(i + 1, len(names))
+        for a in range(len(values[i]))
+        for b in range(len(values[j]))
+    }
+    rows: List[Tuple[int, ...]] = []
+    while uncovered:
+        ordered = sorted(uncovered)
+        best: Optional[Tuple[int, ...]] = None
+        best_gain = -1
+        for _ in range(candidates):
+            (i, a), (j, b) = rng.choice(ordered)
+            row = {i: a, j: b}
+            rest = [index for index in range(len(names)) if index not in row]
+            rng.shuffle(rest)
+            for index in rest:
+                row[index] = max(
+                    range(len(values[index])),
+                    key=lambda value: (
+                        _gain(uncovered, {**row, index: value}, index),
+                        rng.random(),
+                    ),
+                )
+            complete = tuple(row[index] for index in range(len(names)))
+            gain = len(_pairs(complete) & uncovered)
+            if gain > best_gain:
+                best, best_gain = complete, gain
+        uncovered -= _pairs(best)
+        rows.append(best)
+    return [
+        {
+            name: values[index][value]
+            for index, (name, value) in enumerate(zip(names, row))
+        }
+        for row in rows
+    ]
+
+
+def _pairs(row: Tuple[int, ...]) -> Set[Pair]:
+    """Get all pairs covered by a complete row."""
+    return {
+        ((i, row[i]), (j, row[j]))
+        for i in range(len(row))
+        for j in range(i + 1, len(row))
+    }
+
+
+def _gain(uncovered: Set[Pair], row: Mapping[int, int], index: int) -> int:
+    """Count uncovered pairs between a newly set dimension and those already set."""
+    return sum(
+        (
+            ((other, row[other]), (index, row[index]))
+            if other < index
+            else ((index, row[index]), (other, row[other]))
+        )
+        in uncovered
+        for other in row
+        if other != index
+    )
+
+
+@dataclass(frozen=True)
+class MatrixCase:
+    """One planned combination and the concrete payload chosen for it."""
+
+    values: Tuple[Tuple[str, object], ...]
+    payload: str
+
+    def __getitem__(self, name: str):
+        """Get the value of a dimension."""
+        return dict(self.values)[name]
+
+    def __str__(self) -> str:
+        """String representation of the case."""
+        return (
+            ", ".join(f"{name}={value}" for name, value in self.values)
+            + f", payload={self.payload!r}"
+        )
+
+
+@dataclass
+class MatrixPlanner:
+    """Plan, hand out and prune cases of a payload x field x persona matrix.
+
+    ``representatives`` maps each value of the ``prune_by`` dimension (a
+    payload class) to the concrete payloads that are rotated through.
+    """
+
+    representatives: Mapping[str, Sequence[str]]
+    dimensions: Mapping[str, Sequence]
+    prune_by: str = "payload_class"
+    stable_after: int = 3
+    seed: int = 0
+    observed: Dict[str, List[Hashable]] = field(default_factory=dict)
+    skipped: List[MatrixCase] = field(default_factory=list)
+
+    def __post_init__(self):
+        """Build the covering array."""
+        if self.stable_after < 1:
+            raise ValueError("stable_after must be at least 1")
+        empty = [
+            name for name, payloads in self.representatives.items() if not payloads
+        ]
+        if empty:
+            raise ValueError(f"Payload classes without payloads: {empty}")
+        self.plan = pairwise(
+            {self.prune_by: list(self.representatives), **self.dimensions}, self.seed
+        )
+
+    @property
+    def full_size(self) -> int:
+        """Get the number of cases of the exhaustive matrix."""
+        size = len(self.representatives)
+        for values in self.dimensions.values():
+            size *= len(values)
+        return size
+
+    def __len__(self) -> int:
+        """Get the number of planned (pairwise) cases."""
+        return len(self.plan)
+
+    def __iter__(self) -> Iterator[MatrixCase]:
+        """Yield cases round-robin over payload classes, skipping pruned classes."""
+        by_class: Dict[str, List[Dict[str, object]]] = {}
+        for row in self.plan:
+            by_class.setdefault(row[self.prune_by], []).append(row)
+        rounds = max(len(rows) for rows in by_class.values())
+        for position in range(rounds):
+            for payload_class, rows in by_class.items():
+                if position >= len(rows):
+                    continue
+                payloads = self.representatives[payload_class]
+                case = MatrixCase(
+                    tuple(rows[position].items()), payloads[position % len(payloads)]
+                )
+                if self.is_pruned(payload_class):
+                    self.skipped.append(case)
+                    continue
+                yield case
+
+    def record(self, case: MatrixCase, signature: Hashable) -> None:
+        """Record the response signature observed for a case."""
+        self.observed.setdefault(case[self.prune_by], []).append(signature)
+
+    def is_pruned(self, payload_class: str) -> bool:
+        """Check if a class gave one signature for its first ``stable_after`` cases."""
+        signatures = self.observed.get(payload_class, [])
+        return len(signatures) >= self.stable_after and len(set(signatures)) == 1
+
+    def summary(self) -> str:
+        """Get a one-line account of the reduction."""
+        run = sum(len(signatures) for signatures in self.observed.values())
+        pruned = sum(
+            self.is_pruned(payload_class) for payload_class in self.representatives
+        )
+        return (
+            f"{run} cases run, {len(self.skipped)} skipped in {pruned} stable classes "
+            f"(pairwise plan {len(self)}, exhaustive {self.full_size})"
+        )
+
+
+def login_credentials(case: MatrixCase, personas: Mapping[str, str]) -> Tuple[str, str]:
+    """Get the username and password to submit for a login matrix case."""
+    persona = case["persona"]
+    if case["field"] == "username":
+        return case.payload, personas[persona]
+    if case["field"] == "password":
+        return persona, case.payload
+    return case.payload, case.payload
@@ -0,0 +1,379 @@
+"""
+Process-pool orchestrator running the API and UI suites side by side.
+
+Each suite gets its own pool of long-lived pytest worker processes, sized
+independently: API tests are I/O-bound and take many workers per core, UI
+tests are bound by the browser each worker keeps open. Workers load this
+module as a pytest plugin (``-p utils.orchestrator``), connect back over a
+local ``multiprocessing.connection`` channel, pull work one unit at a time and
+stream every result back, so no worker idles while its pool still has work and
+results are rendered live as they arrive.
+
+A unit is either one item or every item of a class that shares state (the
+``xdist_group`` conftest puts on classes not marked ``isolated``), so the
+orchestrator keeps the same grouping guarantees as ``--dist loadgroup``.
+
+Usage:
+    python run_tests.py --orchestrate --api-workers 8 --ui-workers 4
+"""
+
+import os
+import queue
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+ADDRESS_ENV = "ORCHESTRATOR_ADDRESS"
+AUTHKEY_ENV = "ORCHESTRATOR_AUTHKEY"
+POOL_ENV = "ORCHESTRATOR_POOL"
+WORKER_ENV = "ORCHESTRATOR_WORKER"
+
+OUTCOMES = ("passed", "failed", "error", "skipped")
+
+
+def pool_size(requested: int, per_core: int = 1, limit: int = 16) -> int:
+    """Resolve a worker count; 0 means ``per_core`` per core, up to ``limit``."""
+    return requested if requested > 0 else min(limit, per_core * (os.cpu_count() or 1))
+
+
+@dataclass(frozen=True)
+class ItemResult:
+    """Final outcome of one test item as reported by a worker."""
+
+    pool: str
+    nodeid: str
+    outcome: str
+    duration: float = 0.0
+    longrepr: str = ""
+
+
+@dataclass
+class Pool:
+    """One suite, the pytest arguments selecting it and its worker count."""
+
+    name: str
+    args: Sequence[str]
+    workers: int = 1
+    total: int = 0
+    units: Deque[List[str]] = field(default_factory=deque, repr=False)
+    loaded: bool = field(default=False, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def load(self, collected: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """Build work units from a worker's collection; later collections are ignored.
+
+        Every worker collects the same items, so the first one to finish
+        defines the work. Longest units go first so a big class does not
+        start last and hold up the end of the run.
+        """
+        with self.lock:
+            if self.loaded:
+                return
+            groups: Dict[str, List[str]] = {}
+            for nodeid, group in collected:
+                groups.setdefault(group or nodeid, []).append(nodeid)
+            self.units.extend(sorted(groups.values(), key=len, reverse=True))
+            self.total = sum(len(unit) for unit in self.units)
+            self.loaded = True
+
+    def next_unit(self) -> Optional[List[str]]:
+        """Take the next unit of work, or None when the pool is drained."""
+        with self.lock:
+            return self.units.popleft() if self.units else None
+
+
+class Orchestrator:
+    """Run several pools of pytest workers at once and render their results live."""
+
+    def __init__(
+        self,
+        pools: Sequence[Pool],
+        stream: TextIO = sys.stdout,
+        log_dir: str = "reports/orchestrator",
+        cwd: Optional[str] = None,
+    ):
+        """Initialize orchestrator; nothing starts until run()."""
+        self.pools = {pool.name: pool for pool in pools}
+        self.stream = stream
+        self.log_dir = Path(log_dir)
+        self.cwd = cwd
+        self.results: List[ItemResult] = []
+        self.crashed: List[str] = []
+        self._events: "queue.Queue[ItemResult]" = queue.Queue()
+        self._seen: Dict[str, set] = {name: set() for name in self.pools}
+        self._serving: List[threading.Thread] = []
+
+    def run(self) -> bool:
+        """Run every pool to completion; True when nothing failed."""
+        authkey = secrets.token_bytes(16)
+        started = time.perf_counter()
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+            threading.Thread(target=self._accept, args=(listener,), daemon=True).start()
+            host, port = listener.address
+            env = {
+                **os.environ,
+                ADDRESS_ENV: f"{host}:{port}",
+                AUTHKEY_ENV: authkey.hex(),
+            }
+            processes = [
+                self._spawn(pool, worker, env)
+                for pool in self.pools.values()
+                for worker in range(pool.workers)
+            ]
+            self._render_until_done(processes)
+        self._summary(time.perf_counter() - started)
+        return not self.crashed and not any(
+            result.outcome in ("failed", "error") for result in self.results
+        )
+
+    def _spawn(
+        self, pool: Pool, worker: int, env: Dict[str, str]
+    ) -> Tuple[str, subprocess.Popen]:
+        """Start one pytest worker of a pool, logging its output to a file."""
+        name = f"{pool.name}-{worker}"
+        command = [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-p",
+            "utils.orchestrator",
+            *pool.args,
+        ]
+        log = open(self.log_dir / f"{name}.log", "w")
+        process = subprocess.Popen(
+            command,
+            cwd=self.cwd,
+            env={**env, POOL_ENV: pool.name, WORKER_ENV: str(worker)},
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        log.close()
+        return name, process
+
+    def _accept(self, listener: Listener) -> None:
+        """Hand every connecting worker to its own serving thread."""
+        while True:
+            try:
+                connection = listener.accept()
+            except OSError:
+                return
+            thread = threading.Thread(
+                target=self._serve, args=(connection,), daemon=True
+            )
+            self._serving.append(thread)
+            thread.start()
+
+    def _serve(self, connection: Connection) -> None:
+        """Answer one worker's work requests and forward its results."""
+        assigned: set = set()
+        try:
+            _, pool_name, _ = connection.recv()
+            pool = self.pools[pool_name]
+            while True:
+                message = connection.recv()
+                kind = message[0]
+                if kind == "collected":
+                    pool.load(message[1])
+                elif kind == "next":
+                    unit = pool.next_unit()
+                    assigned.update(unit or ())
+                    connection.send(unit)
+                elif kind == "result":
+                    assigned.discard(message[1])
+                    self._events.put(ItemResult(pool.name, *message[1:]))
+        except (EOFError, OSError):
+            pass
+        finally:
+            connection.close()
+            for nodeid in sorted(assigned):
+                self._events.put(
+                    ItemResult(
+                        pool.name,
+                        nodeid,
+                        "error",
+                        longrepr="worker exited before reporting",
+                    )
+                )
+
+    def _render_until_done(self, processes: List[Tuple[str, subprocess.Popen]]) -> None:
+        """Render results as they stream in until every worker has exited."""
+        running = list(processes)
+        while running:
+            try:
+                self._record(self._events.get(timeout=0.1))
+            except queue.Empty:
+                pass
+            for name, process in list(running):
+                code = process.poll()
+                if code is None:
+                    continue
+                running.remove((name, process))
+                # 1: tests failed (reported already), 5: nothing selected
+                if code not in (0, 1, 5):
+                    self.crashed.append(
+                        f"{name} exited with code {code} "
+                        f"(see {self.log_dir / name}.log)"
+                    )
+        # Let serving threads forward what the last workers sent before exiting
+        time.sleep(0.2)
+        for thread in list(self._serving):
+            thread.join(timeout=5)
+        while not self._events.empty():
+            self._record(self._events.get())
+
+    def _record(self, result: ItemResult) -> None:
+        """Store and print one result, dropping duplicate collection errors."""
+        seen = self._seen[result.pool]
+        if result.nodeid in seen:
+            return
+        seen.add(result.nodeid)
+        self.results.append(result)
+        pool = self.pools[result.pool]
+        width = max(len(name) for name in self.pools)
+        print(
+            f"[{result.pool:<{width}} {len(seen):>4}/{max(pool.total, len(seen))}] "
+            f"{result.outcome.upper():<7} {result.nodeid} ({result.duration:.2f}s)",
+            file=self.stream,
+            flush=True,
+        )
+
+    def _summary(self, elapsed: float) -> None:
+        """Print failures and per-pool totals."""
+        out = self.stream
+        failures = [
+            result for result in self.results if result.outcome in ("failed", "error")
+        ]
+        if failures:
+            print("\n" + " FAILURES ".center(70, "="), file=out)
+            for result in failures:
+                print(
+                    f"\n{result.outcome.upper()} {result.nodeid}\n{result.longrepr}",
+                    file=out,
+                )
+        print("\n" + " ORCHESTRATOR SUMMARY ".center(70, "="), file=out)
+        for name, pool in self.pools.items():
+            counts = Counter(
+                result.outcome for result in self.results if result.pool == name
+            )
+            totals = ", ".join(
+                f"{counts[outcome]} {outcome}"
+                for outcome in OUTCOMES
+                if counts[outcome]
+            )
+            print(f"{name}: {totals or 'no tests'} ({pool.workers} workers)", file=out)
+        for crash in self.crashed:
+            print(f"crashed: {crash}", file=out)
+        print(f"Finished in {elapsed:.1f}s", file=out, flush=True)
+
+
+# Worker side: pytest plugin loaded with ``-p utils.orchestrator``
+
+_channel: Optional[Connection] = None
+_outcomes: Dict[str, List] = {}
+
+
+def _connect() -> Optional[Connection]:
+    """Connect to the orchestrator named in the environment, if any."""
+    address = os.environ.get(ADDRESS_ENV)
+    if not address:
+        return None
+    host, port = address.rsplit(":", 1)
+    connection = Client(
+        (host, int(port)), authkey=bytes.fromhex(os.environ[AUTHKEY_ENV])
+    )
+    connection.send(("hello", os.environ[POOL_ENV], os.environ.get(WORKER_ENV, "0")))
+    return connection
+
+
+def fold_report(state: Optional[List], report) -> List:
+    """Fold a setup/call/teardown report into ``[outcome, duration, longrepr]``."""
+    outcome, duration, longrepr = state or ["passed", 0.0, ""]
+    duration += report.duration
+    if report.failed:
+        failed = "failed" if report.when == "call" else "error"
+        if outcome == "passed" or failed == "failed":
+            outcome = failed
+        longrepr = longrepr or report.longreprtext
+    elif report.skipped and outcome == "passed":
+        outcome = "skipped"
+    return [outcome, duration, longrepr]
+
+
+def pytest_configure(config) -> None:
+    """Join the orchestrator when started as one of its workers."""
+    global _channel
+    if _channel is None:
+        _channel = _connect()
+
+
+def pytest_collectreport(report) -> None:
+    """Report collection errors, which never reach the run loop."""
+    if _channel is not None and report.failed:
+        _channel.send(("result", report.nodeid, "error", 0.0, report.longreprtext))
+
+
+def pytest_collection_finish(session) -> None:
+    """Send the collected items and their groups to the orchestrator."""
+    if _channel is None:
+        return
+    collected = []
+    for item in session.items:
+        marker = item.get_closest_marker("xdist_group")
+        collected.append(
+            (item.nodeid, marker.args[0] if marker and marker.args else None)
+        )
+    _channel.send(("collected", collected))
+
+
+def pytest_runtestloop(session):
+    """Run units handed out by the orchestrator until its pool is drained."""
+    if _channel is None or session.testsfailed or session.config.option.collectonly:
+        return None
+    items = {item.nodeid: item for item in session.items}
+    pending: Deque = deque()
+    drained = False
+    while True:
+        # Keep one item of look-ahead so fixtures are torn down at the right time
+        if len(pending) < 2 and not drained:
+            _channel.send(("next",))
+            unit = _channel.recv()
+            if unit is None:
+                drained = True
+            else:
+                pending.extend(items[nodeid] for nodeid in unit)
+            continue
+        if not pending:
+            break
+        item = pending.popleft()
+        session.config.hook.pytest_runtest_protocol(
+            item=item, nextitem=pending[0] if pending else None
+        )
+        if session.shouldfail or session.shouldstop:
+            break
+    return True
+
+
+def pytest_runtest_logreport(report) -> None:
+    """Stream a test's combined outcome once its teardown has finished."""
+    if _channel is None:
+        return
+    state = _outcomes[report.nodeid] = fold_report(_outcomes.get(report.nodeid), report)
+    if report.when == "teardown":
+        del _outcomes[report.nodeid]
+        _channel.send(("result", report.nodeid, *state))
+
+
+def pytest_unconfigure(config) -> None:
+    """Close the channel so the orchestrator sees the worker finish."""
+    global _channel
+    if _channel is not None:
+        _channel.close()
+        _channel = None
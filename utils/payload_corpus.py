@@ -0,0 +1,364 @@
+"""
+Indexed, deduplicated corpus of security testing payloads.
+
+Payloads live in a SQLite database indexed by category, subcategory, tag,
+encoding and target field. Payloads are deduplicated per category by their
+normalized form (NFKC, whitespace collapsed); case is kept, so case-variation
+bypasses such as ``UnIoN`` or ``<ScRiPt>`` stay distinct. Queries stream rows
+from a cursor in batches, so the suite can use corpora of tens of thousands of
+payloads without loading them into memory.
+
+The built-in ``SecurityPayloads`` are always seeded; larger corpora are imported
+once from JSONL into an on-disk database selected with ``PAYLOAD_CORPUS``.
+
+Usage:
+    python -m utils.payload_corpus import payloads.jsonl --db reports/payloads.sqlite
+    python -m utils.payload_corpus stats --db reports/payloads.sqlite
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import unicodedata
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from loguru import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS payloads (
+    id INTEGER PRIMARY KEY,
+    payload TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    category TEXT NOT NULL,
+    subcategory TEXT NOT NULL DEFAULT '',
+    encoding TEXT NOT NULL DEFAULT 'plain',
+    target_field TEXT NOT NULL DEFAULT 'any',
+    tags TEXT NOT NULL DEFAULT '',
+    UNIQUE (category, normalized)
+);
+CREATE TABLE IF NOT EXISTS payload_tags (
+    tag TEXT NOT NULL,
+    payload_id INTEGER NOT NULL REFERENCES payloads (id),
+    PRIMARY KEY (tag, payload_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_payloads_category ON payloads (category, subcategory);
+CREATE INDEX IF NOT EXISTS idx_payloads_encoding ON payloads (encoding);
+CREATE INDEX IF NOT EXISTS idx_payloads_target_field ON payloads (target_field);
+"""
+
+_COLUMNS = "id, payload, category, subcategory, encoding, target_field, tags"
+
+# Filters accepted by iter/count/sample and the column they query
+_FILTERS = ("category", "subcategory", "encoding", "target_field")
+
+# Deterministic pseudo-random order (Knuth multiplicative hash of id + seed)
+_RANK = "((p.id + :seed) * 2654435761) % 4294967296"
+
+# SecurityPayloads attribute -> corpus category
+_BUILTIN_CATEGORIES = {
+    "SQL_INJECTION": "sql_injection",
+    "XSS_PAYLOADS": "xss",
+    "COMMAND_INJECTION": "command_injection",
+    "LDAP_INJECTION": "ldap_injection",
+    "PATH_TRAVERSAL": "path_traversal",
+    "FORMAT_STRING": "format_string",
+    "NULL_BYTE": "null_byte",
+    "ENCODING_BYPASS": "encoding_bypass",
+}
+
+
+class Payload(NamedTuple):
+    """Single corpus entry."""
+
+    id: int
+    payload: str
+    category: str
+    subcategory: str
+    encoding: str
+    target_field: str
+    tags: Tuple[str, ...]
+
+
+def normalize(payload: str) -> str:
+    """Get the form payloads are deduplicated by."""
+    return " ".join(unicodedata.normalize("NFKC", payload).split())
+
+
+class PayloadCorpus:
+    """SQLite-backed payload store with streaming queries and stratified sampling."""
+
+    def __init__(self, path: str = ":memory:", sample_size: int = 8, seed: int = 0):
+        """Initialize corpus, creating the schema if needed."""
+        self.path = path
+        self.sample_size = sample_size
+        self.seed = seed
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def add(
+        self,
+        payload: str,
+        category: str,
+        subcategory: str = "",
+        tags: Sequence[str] = (),
+        encoding: str = "plain",
+        target_field: str = "any",
+    ) -> bool:
+        """Add a payload, returning False if an equivalent one already exists."""
+        with self._connection:
+            return self._insert(
+                payload, category, subcategory, tags, encoding, target_field
+            )
+
+    def add_many(self, records: Iterable[Mapping]) -> int:
+        """Add payload records in one transaction, returning how many were new."""
+        added = 0
+        with self._connection:
+            for record in records:
+                added += self._insert(
+                    record["payload"],
+                    record["category"],
+                    record.get("subcategory", ""),
+                    record.get("tags", ()),
+                    record.get("encoding", "plain"),
+                    record.get("target_field", "any"),
+                )
+        return added
+
+    def import_jsonl(self, path: str) -> int:
+        """Stream payload records from a JSONL file into the corpus."""
+        with open(path, encoding="utf-8") as lines:
+            added = self.add_many(json.loads(line) for line in lines if line.strip())
+        logger.info(f"Imported {added} new payloads from {path}")
+        return added
+
+    def seed_builtin(self) -> int:
+        """Add the built-in SecurityPayloads collections."""
+        from .security_payloads import SecurityPayloads
+
+        critical = {
+            payload
+            for payloads in SecurityPayloads.get_critical_payloads().values()
+            for payload in payloads
+        }
+        records = []
+        for attribute, category in _BUILTIN_CATEGORIES.items():
+            collection = getattr(SecurityPayloads, attribute)
+            groups = (
+                collection.items()
+                if isinstance(collection, dict)
+                else [("", collection)]
+            )
+            for subcategory, payloads in groups:
+                encoding = subcategory if category == "encoding_bypass" else "plain"
+                for payload in payloads:
+                    tags = (
+                        ("builtin", "critical") if payload in critical else ("builtin",)
+                    )
+                    records.append(
+                        {
+                            "payload": payload,
+                            "category": category,
+                            "subcategory": subcategory,
+                            "encoding": encoding,
+                            "tags": tags,
+                        }
+                    )
+        return self.add_many(records)
+
+    def iter(
+        self, tag: Optional[str] = None, batch_size: int = 500, **filters: str
+    ) -> Iterator[Payload]:
+        """Stream payloads matching the filters in insertion order."""
+        where, params = self._where(tag, filters)
+        cursor = self._connection.execute(
+            f"SELECT {self._prefixed()} FROM payloads p {where} ORDER BY p.id", params
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield _payload(row)
+
+    def payloads(self, tag: Optional[str] = None, **filters: str) -> List[str]:
+        """Get payload strings matching the filters."""
+        return [entry.payload for entry in self.iter(tag, **filters)]
+
+    def count(self, tag: Optional[str] = None, **filters: str) -> int:
+        """Count payloads matching the filters."""
+        where, params = self._where(tag, filters)
+        return self._connection.execute(
+            f"SELECT COUNT(*) FROM payloads p {where}", params
+        ).fetchone()[0]
+
+    def sample(
+        self,
+        per_stratum: Optional[int] = None,
+        stratify: str = "subcategory",
+        seed: Optional[int] = None,
+        tag: Optional[str] = None,
+        **filters: str,
+    ) -> List[Payload]:
+        """Pick up to ``per_stratum`` payloads from each stratum, reproducibly per seed.
+
+        Every value of the ``stratify`` column (e.g. each SQL injection
+        technique) is represented, however unevenly the corpus is populated.
+        """
+        if stratify not in _FILTERS:
+            raise ValueError(
+                f"Cannot stratify by '{stratify}', expected one of {_FILTERS}"
+            )
+        where, params = self._where(tag, filters)
+        params.update(
+            {
+                "seed": self.seed if seed is None else seed,
+                "per_stratum": self.sample_size if per_stratum is None else per_stratum,
+            }
+        )
+        rows = self._connection.execute(
+            f"""SELECT {_COLUMNS} FROM (
+                SELECT {self._prefixed()},
+                       ROW_NUMBER() OVER (
+                           PARTITION BY p.{stratify} ORDER BY {_RANK}
+                       ) AS position
+                FROM payloads p {where}
+            ) WHERE position <= :per_stratum ORDER BY {stratify}, position""",
+            params,
+        )
+        return [_payload(row) for row in rows]
+
+    def strata(self, stratify: str = "subcategory", **filters: str) -> Dict[str, int]:
+        """Get payload counts per stratum."""
+        if stratify not in _FILTERS:
+            raise ValueError(
+                f"Cannot stratify by '{stratify}', expected one of {_FILTERS}"
+            )
+        where, params = self._where(None, filters)
+        rows = self._connection.execute(
+            f"SELECT p.{stratify}, COUNT(*) FROM payloads p {where} "
+            f"GROUP BY p.{stratify}",
+            params,
+        )
+        return dict(rows.fetchall())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        """Get total number of payloads."""
+        return self.count()
+
+    def _insert(
+        self, payload, category, subcategory, tags, encoding, target_field
+    ) -> bool:
+        """Insert one payload inside the caller's transaction."""
+        tags = tuple(dict.fromkeys(tags))
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO payloads (payload, normalized, category, "
+            "subcategory, encoding, target_field, tags) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                payload,
+                normalize(payload),
+                category,
+                subcategory,
+                encoding,
+                target_field,
+                ",".join(tags),
+            ),
+        )
+        if not cursor.rowcount:
+            return False
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO payload_tags (tag, payload_id) VALUES (?, ?)",
+            [(tag, cursor.lastrowid) for tag in tags],
+        )
+        return True
+
+    def _where(
+        self, tag: Optional[str], filters: Mapping[str, str]
+    ) -> Tuple[str, Dict]:
+        """Build the WHERE clause for tag and column filters."""
+        clauses, params = [], {}
+        for name, value in filters.items():
+            if name not in _FILTERS:
+                raise ValueError(
+                    f"Unknown payload filter '{name}', expected one of {_FILTERS}"
+                )
+            if value is not None:
+                clauses.append(f"p.{name} = :{name}")
+                params[name] = value
+        if tag is not None:
+            clauses.append(
+                "p.id IN (SELECT payload_id FROM payload_tags WHERE tag = :tag)"
+            )
+            params["tag"] = tag
+        return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def _prefixed() -> str:
+        """Get the selected columns qualified with the table alias."""
+        return ", ".join(f"p.{column.strip()}" for column in _COLUMNS.split(","))
+
+
+def _payload(row: tuple) -> Payload:
+    """Build a Payload from a result row."""
+    *fields, tags = row
+    return Payload(*fields, tuple(tags.split(",")) if tags else ())
+
+
+_corpus: Dict[str, PayloadCorpus] = {}
+
+
+def get_corpus() -> PayloadCorpus:
+    """Get the process-wide corpus configured from settings."""
+    corpus = _corpus.get("current")
+    if corpus is None:
+        from config.settings import get_settings
+
+        settings = get_settings()
+        corpus = PayloadCorpus(
+            settings.payload_corpus or ":memory:",
+            sample_size=settings.payload_sample_size,
+            seed=settings.payload_seed,
+        )
+        corpus.seed_builtin()
+        _corpus["current"] = corpus
+    return corpus
+
+
+def main() -> None:
+    """Command-line entry point for building payload corpora."""
+    parser = argparse.ArgumentParser(description="Security payload corpus")
+    parser.add_argument("action", choices=["import", "stats"])
+    parser.add_argument("files", nargs="*", help="JSONL files to import")
+    parser.add_argument("--db", required=True, help="SQLite database path")
+    args = parser.parse_args()
+
+    corpus = PayloadCorpus(args.db)
+    if args.action == "import":
+        corpus.seed_builtin()
+        for path in args.files:
+            corpus.import_jsonl(path)
+    strata = {
+        category: corpus.strata(category=category)
+        for category in corpus.strata("category")
+    }
+    print(json.dumps({"total": len(corpus), "categories": strata}, indent=2))
+    corpus.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,85 @@
 """
 Security Testing Payloads for Injection Testing.
+
+These collections seed ``utils.payload_corpus``; tests should query the corpus
+rather than these class attributes.
 """
 
+import re
+import string
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Iterator, Tuple, Union
+
+# Character classes buffer payloads are generated from
+BUFFER_CHARSETS = {
+    'repeat': "A",
+    'alpha': string.ascii_letters,
+    'alnum': string.ascii_letters + string.digits,
+    'digits': string.digits,
+    'printable': string.ascii_letters + string.digits + string.punctuation,
+    'unicode': "A\u00e9\u0416\u4e2d\U0001f600",
+    'null': "\x00",
+}
+MAX_BUFFER_SIZE = 10 * 1024 * 1024
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(B|KB|MB)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 * 1024}
+
+
+def parse_size(size: Union[int, str]) -> int:
+    """Parse a size spec such as 512, "1KB" or "2.5MB" into characters."""
+    if isinstance(size, int):
+        chars = size
+    else:
+        match = _SIZE_PATTERN.match(size)
+        if not match:
+            raise ValueError(f"Invalid size spec '{size}', expected e.g. 1KB or 10MB")
+        chars = int(float(match.group(1)) * _SIZE_UNITS[(match.group(2) or "B").upper()])
+    if not 0 < chars <= MAX_BUFFER_SIZE:
+        raise ValueError(f"Buffer size must be between 1 and {MAX_BUFFER_SIZE} characters, got {chars}")
+    return chars
+
+
+def iter_buffer_chunks(size: Union[int, str], charset: str = 'repeat', chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """Stream a buffer payload in chunks without building the whole string."""
+    if charset not in BUFFER_CHARSETS:
+        raise ValueError(f"Unknown charset '{charset}', expected one of {tuple(BUFFER_CHARSETS)}")
+    remaining = parse_size(size)
+    alphabet = BUFFER_CHARSETS[charset]
+    # Slicing one cyclic pattern at the running offset keeps the sequence
+    # identical whatever chunk size is used
+    pattern = alphabet * (min(chunk_size, remaining) // len(alphabet) + 2)
+    offset = 0
+    while remaining > 0:
+        length = min(chunk_size, remaining)
+        yield pattern[offset:offset + length]
+        offset = (offset + length) % len(alphabet)
+        remaining -= length
+
+
+def generate_buffer_payload(size: Union[int, str], charset: str = 'repeat') -> str:
+    """Generate a buffer payload of the given size on demand."""
+    return "".join(iter_buffer_chunks(size, charset))
+
+
+class _BufferPayloads(Mapping):
+    """Named buffer payloads generated on access instead of at import time."""
+    
+    SIZES = {'small': 100, 'medium': 1000, 'large': 10000, 'huge': 100000}
+    
+    def __getitem__(self, name: str) -> str:
+        """Generate the named payload."""
+        return generate_buffer_payload(self.SIZES[name])
+    
+    def __iter__(self):
+        """Iterate over payload names."""
+        return iter(self.SIZES)
+    
+    def __len__(self) -> int:
+        """Get number of named payloads."""
+        return len(self.SIZES)
+
+
 class SecurityPayloads:
     """Collection of security testing payloads for various injection attacks."""
     
@@ -31,6 +109,8 @@ class SecurityPayloads:
             "' UNION SELECT user() --",
             "admin' UNION SELECT 1,2,3 --",
             "admin' UNION SELECT NULL,NULL,NULL --",
+            "admin' UNION ALL SELECT 1,2,3 --",
+            "admin' UNION SELECT @@version --",
         ],
         'time_based': [
             "'; WAITFOR DELAY '00:00:05' --",
@@ -40,6 +120,11 @@ class SecurityPayloads:
             "'; pg_sleep(5) --",
             "' AND pg_sleep(5) --",
             "'; BENCHMARK(5000000,MD5(1)) --",
+            "admin'; WAITFOR DELAY '00:00:05' --",
+            "admin' AND (SELECT COUNT(*) FROM sysobjects) > 0 WAITFOR DELAY '00:00:05' --",
+            "admin'; SELECT SLEEP(5) --",
+            "admin' AND SLEEP(5) --",
+            "admin'; pg_sleep(5) --",
         ],
         'error_based': [
             "' AND EXTRACTVALUE(1, CONCAT(0x7e, (SELECT version()), 0x7e)) --",
@@ -47,6 +132,10 @@ class SecurityPayloads:
             "' AND 1=CONVERT(int,(SELECT @@version)) --",
             "' AND 1=CAST((SELECT @@version) AS int) --",
             "' AND 1=(SELECT TOP 1 table_name FROM information_schema.tables) --",
+            "admin' AND EXTRACTVALUE(1, CONCAT(0x7e, (SELECT version()), 0x7e)) --",
+            "admin' AND (SELECT * FROM (SELECT COUNT(*),CONCAT(version(),FLOOR(RAND(0)*2))x FROM information_schema.tables GROUP BY x)a) --",
+            "admin' AND 1=CONVERT(int,(SELECT @@version)) --",
+            "admin' AND 1=CAST((SELECT @@version) AS int) --",
         ],
         'boolean_based': [
             "' AND 1=1 --",
@@ -114,6 +203,15 @@ class SecurityPayloads:
         "&& net user",
         "; uname -a",
         "| ps aux",
+        # Appended to a valid username, as submitted through the login form
+        "admin; cat /etc/passwd",
+        "admin && dir",
+        "admin | whoami",
+        "admin`id`",
+        "admin$(whoami)",
+        "admin; ls -la",
+        "admin & net user",
+        "admin || ping 127.0.0.1",
     ]
     
     # LDAP Injection Payloads
@@ -127,6 +225,10 @@ class SecurityPayloads:
         "*)|(objectClass=*",
         "admin)(&(password=*))",
         "*)(uid=*))(|(uid=*",
+        "admin)(&)",
+        "admin)(|(objectClass=*))",
+        "admin))(|(objectClass=*",
+        "admin)(&(objectClass=*)(objectClass=*))",
     ]
     
     # Path Traversal Payloads
@@ -163,6 +265,9 @@ class SecurityPayloads:
         "admin\x00",
         "admin%00",
         "password\x00extra",
+        "admin\x00password",
+        "admin%00.txt",
+        "admin\x00\x00\x00",
     ]
     
     # Encoding Bypass Payloads
@@ -187,29 +292,20 @@ class SecurityPayloads:
         ]
     }
     
-    # Buffer Overflow Simulation
-    BUFFER_OVERFLOW = {
-        'small': "A" * 100,
-        'medium': "A" * 1000,
-        'large': "A" * 10000,
-        'huge': "A" * 100000,
-    }
+    # Buffer Overflow Simulation (generated on access, see generate_buffer_payload)
+    BUFFER_OVERFLOW = _BufferPayloads()
     
     @classmethod
-    def get_all_sql_payloads(cls):
-        """Get all SQL injection payloads."""
-        all_payloads = []
-        for category in cls.SQL_INJECTION.values():
-            all_payloads.extend(category)
-        return all_payloads
+    @lru_cache(maxsize=None)
+    def get_all_sql_payloads(cls) -> Tuple[str, ...]:
+        """Get all SQL injection payloads (built once and cached)."""
+        return tuple(payload for category in cls.SQL_INJECTION.values() for payload in category)
     
     @classmethod
-    def get_all_xss_payloads(cls):
-        """Get all XSS payloads."""
-        all_payloads = []
-        for category in cls.XSS_PAYLOADS.values():
-            all_payloads.extend(category)
-        return all_payloads
+    @lru_cache(maxsize=None)
+    def get_all_xss_payloads(cls) -> Tuple[str, ...]:
+        """Get all XSS payloads (built once and cached)."""
+        return tuple(payload for category in cls.XSS_PAYLOADS.values() for payload in category)
     
     @classmethod
     def get_critical_payloads(cls):
@@ -227,69 +323,49 @@ class SecurityTestHelpers:
     
     @staticmethod
     def check_for_sensitive_data_leak(error_message: str) -> list:
-        """Check if error message contains sensitive information."""
-        sensitive_keywords = [
-            'mysql', 'sql', 'database', 'table', 'column', 'syntax', 'version',
-            'oracle', 'postgresql', 'sqlite', 'mongodb', 'redis',
-            'error', 'exception', 'stack', 'trace', 'debug',
-            'admin', 'root', 'password', 'username', 'credential',
-            'path', 'directory', 'file', 'system', 'server',
-            'connection', 'driver', 'port', 'host', 'localhost'
-        ]
+        """Check if error message contains sensitive information.
         
-        found_keywords = []
-        error_lower = error_message.lower()
-        
-        for keyword in sensitive_keywords:
-            if keyword in error_lower:
-                found_keywords.append(keyword)
-                
-        return found_keywords
+        Returns the distinct sensitive terms found, see ``utils.leak_scanner``
+        for positions and categories.
+        """
+        from .leak_scanner import get_scanner
+        return get_scanner().terms_in(error_message)
     
     @staticmethod
     def measure_response_time(func, *args, **kwargs):
-        """Measure response time for time-based injection detection."""
-        import time
-        start_time = time.time()
+        """Measure response time (seconds) of a single call.
+        
+        A single sample is noisy; use ``compare_response_times`` to decide
+        whether a payload causes a delay.
+        """
+        from time import perf_counter_ns
+        start_time = perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        return result, (end_time - start_time)
+        return result, (perf_counter_ns() - start_time) / 1e9
     
     @staticmethod
-    def check_for_xss_execution(page):
-        """Check if XSS payload was executed."""
-        try:
-            # Check for alert dialogs
-            page.wait_for_function("window.alert", timeout=1000)
-            return True
-        except:
-            return False
+    def compare_response_times(payload_func, control_func, threshold_ms: float = 2000.0, seed: int = 0):
+        """Compare payload vs. control timing with interleaved trials and a sequential test."""
+        from .timing_analysis import TimingAnalyzer
+        return TimingAnalyzer(threshold_ms=threshold_ms, seed=seed).compare(payload_func, control_func)
     
     @staticmethod
-    def generate_fuzzing_data(base_string: str, mutations: int = 100):
-        """Generate fuzzing data for testing."""
-        import random
-        import string
+    def check_for_xss_execution(page):
+        """Check if an XSS payload executed since the last check.
         
-        fuzzing_data = []
+        Relies on the sentinel from ``utils.xss_sentinel`` being installed in
+        the page's context (see the ``xss_sentinel`` fixture).
+        """
+        from .xss_sentinel import drain
+        return bool(drain(page))
+    
+    @staticmethod
+    def generate_fuzzing_data(base_string: str, mutations: int = 100, seed: int = 0):
+        """Generate unique, reproducible fuzzing data for testing.
         
-        for _ in range(mutations):
-            # Random character insertion
-            pos = random.randint(0, len(base_string))
-            char = random.choice(string.printable)
-            mutated = base_string[:pos] + char + base_string[pos:]
-            fuzzing_data.append(mutated)
-            
-            # Random character deletion
-            if len(base_string) > 1:
-                pos = random.randint(0, len(base_string) - 1)
-                mutated = base_string[:pos] + base_string[pos + 1:]
-                fuzzing_data.append(mutated)
-            
-            # Random character replacement
-            pos = random.randint(0, len(base_string) - 1)
-            char = random.choice(string.printable)
-            mutated = base_string[:pos] + char + base_string[pos + 1:]
-            fuzzing_data.append(mutated)
+        Delegates to ``utils.fuzzer.Fuzzer``; use it directly for
+        feedback-guided runs against a target.
+        """
+        from .fuzzer import Fuzzer
         
-        return fuzzing_data 
\ No newline at end of file
+        return list(Fuzzer(seed).mutations(base_string, mutations * 3))
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Direct seeding of SauceDemo application state into a browser context.
+
+SauceDemo keeps its whole client state in the browser: the logged-in user in
+the ``session-username`` cookie and the cart in the ``cart-contents``
+localStorage entry (a JSON list of product ids). Writing those directly lets a
+UI test open the page under test with its preconditions in place instead of
+logging in and clicking "Add to cart" first.
+
+Usage:
+    state = AppState("standard_user", cart=("Sauce Labs Backpack",))
+    state.apply(context)                  # existing context: cookies + init script
+    browser.new_context(storage_state=state.storage_state())  # new context
+    pages.cart.open()
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext
+
+SAUCEDEMO_URL = "https://www.saucedemo.com/v1/"
+
+SESSION_COOKIE = "session-username"
+CART_KEY = "cart-contents"
+
+# Product name -> the id SauceDemo stores in the cart
+PRODUCT_IDS: Dict[str, int] = {
+    "Sauce Labs Backpack": 4,
+    "Sauce Labs Bike Light": 0,
+    "Sauce Labs Bolt T-Shirt": 1,
+    "Sauce Labs Fleece Jacket": 5,
+    "Sauce Labs Onesie": 2,
+    "Test.allTheThings() T-Shirt (Red)": 3,
+}
+
+# Writes localStorage once per tab, so changes the test makes afterwards
+# (e.g. removing an item) survive later navigations.
+_SEED_SCRIPT = """(() => {
+    const seed = %s;
+    if (location.origin !== seed.origin) return;
+    if (sessionStorage.getItem("__seeded_state") === seed.id) return;
+    for (const [name, value] of Object.entries(seed.items)) {
+        localStorage.setItem(name, value);
+    }
+    sessionStorage.setItem("__seeded_state", seed.id);
+})();"""
+
+
+@dataclass(frozen=True)
+class AppState:
+    """Target SauceDemo state: who is logged in and what is in the cart."""
+
+    username: Optional[str] = None
+    cart: Tuple[str, ...] = ()
+    url: str = SAUCEDEMO_URL
+
+    def __post_init__(self):
+        """Validate cart product names."""
+        object.__setattr__(self, "cart", tuple(self.cart))
+        unknown = [name for name in self.cart if name not in PRODUCT_IDS]
+        if unknown:
+            raise ValueError(
+                f"Unknown products {unknown}, expected names from {list(PRODUCT_IDS)}"
+            )
+
+    @property
+    def origin(self) -> str:
+        """Get the origin the state belongs to."""
+        parts = urlsplit(self.url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def with_cart(self, *products: str) -> "AppState":
+        """Get the same state with the given products in the cart."""
+        return replace(self, cart=products)
+
+    def cookies(self) -> List[dict]:
+        """Get the cookies of the state."""
+        if self.username is None:
+            return []
+        return [{"name": SESSION_COOKIE, "value": self.username, "url": self.origin}]
+
+    def local_storage(self) -> Dict[str, str]:
+        """Get the localStorage entries of the state."""
+        if not self.cart:
+            return {}
+        return {
+            CART_KEY: json.dumps(
+                [PRODUCT_IDS[name] for name in self.cart], separators=(",", ":")
+            )
+        }
+
+    def storage_state(self) -> dict:
+        """Get the state as a Playwright ``storage_state`` for ``new_context``."""
+        cookies = [
+            {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": urlsplit(self.origin).hostname,
+                "path": "/",
+                "expires": -1,
+                "httpOnly": False,
+                "secure": self.origin.startswith("https"),
+                "sameSite": "Lax",
+            }
+            for cookie in self.cookies()
+        ]
+        local_storage = [
+            {"name": name, "value": value}
+            for name, value in self.local_storage().items()
+        ]
+        origins = (
+            [{"origin": self.origin, "localStorage": local_storage}]
+            if local_storage
+            else []
+        )
+        return {"cookies": cookies, "origins": origins}
+
+    def init_script(self) -> str:
+        """Get a script writing the localStorage entries before any page script."""
+        items = self.local_storage()
+        seed_id = hashlib.sha1(json.dumps(items, sort_keys=True).encode()).hexdigest()[
+            :12
+        ]
+        return _SEED_SCRIPT % json.dumps(
+            {"origin": self.origin, "items": items, "id": seed_id}
+        )
+
+    def apply(self, context: BrowserContext) -> "AppState":
+        """Seed the state into an existing context, from its next navigation on."""
+        cookies = self.cookies()
+        if cookies:
+            context.add_cookies(cookies)
+        if self.cart:
+            context.add_init_script(self.init_script())
+        return self
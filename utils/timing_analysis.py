@@ -0,0 +1,164 @@
+"""
+Statistical timing analysis for time-based injection detection.
+
+Instead of timing a payload once against a fixed cut-off, payload and control
+actions are run in randomized interleaved pairs, so drift in network or browser
+speed hits both arms equally. After every pair a one-sided Mann-Whitney U
+test asks two questions:
+
+* is the payload slower than the control by more than half of
+  ``threshold_ms``?  -> ``slower``
+* is the payload *not* slower than the control by ``threshold_ms`` or more?
+  -> ``not-slower``
+
+Sampling stops as soon as either is significant. Significance uses a
+per-look alpha of ``alpha / number of looks`` (Bonferroni), so the repeated
+looks do not inflate the false positive rate. Clear-cut cases are decided
+after a handful of pairs.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from statistics import median
+from time import perf_counter_ns
+from typing import Any, Callable, List, Sequence
+
+
+@dataclass
+class TimingVerdict:
+    """Result of a payload vs. control timing comparison."""
+
+    verdict: str
+    p_slower: float
+    p_not_slower: float
+    payload_ms: List[float] = field(repr=False)
+    control_ms: List[float] = field(repr=False)
+
+    @property
+    def slower(self) -> bool:
+        """Check if the payload was significantly slower than the control."""
+        return self.verdict == "slower"
+
+    @property
+    def samples(self) -> int:
+        """Get number of trials per arm."""
+        return len(self.payload_ms)
+
+    @property
+    def delta_ms(self) -> float:
+        """Get difference of median response times."""
+        return median(self.payload_ms) - median(self.control_ms)
+
+    def __str__(self) -> str:
+        """String representation of the verdict."""
+        return (
+            f"{self.verdict} after {self.samples} trials "
+            f"(median delta {self.delta_ms:.0f}ms, p_slower={self.p_slower:.4f}, "
+            f"p_not_slower={self.p_not_slower:.4f})"
+        )
+
+
+def mann_whitney_greater(first: Sequence[float], second: Sequence[float]) -> float:
+    """One-sided Mann-Whitney U p-value for ``first`` tending to exceed ``second``.
+
+    Uses the normal approximation with tie and continuity correction.
+    """
+    n1, n2 = len(first), len(second)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted(
+        [(value, 0) for value in first] + [(value, 1) for value in second]
+    )
+    rank_sum = 0.0
+    tie_term = 0
+    index = 0
+    while index < len(combined):
+        end = index
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        # Tied values share the average of their 1-based ranks
+        average_rank = (index + end) / 2 + 1
+        ties = end - index + 1
+        tie_term += ties**3 - ties
+        rank_sum += average_rank * sum(
+            1 for _, group in combined[index : end + 1] if group == 0
+        )
+        index = end + 1
+
+    n = n1 + n2
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class TimingAnalyzer:
+    """Sequential, interleaved timing comparison of a payload against a control."""
+
+    def __init__(
+        self,
+        threshold_ms: float = 2000.0,
+        alpha: float = 0.05,
+        min_samples: int = 4,
+        max_samples: int = 10,
+        seed: int = 0,
+    ):
+        """Initialize analyzer.
+
+        ``threshold_ms`` is the slowdown that counts as an injected delay;
+        payloads slower by less are reported as ``not-slower``.
+        """
+        if not 2 <= min_samples <= max_samples:
+            raise ValueError("Expected 2 <= min_samples <= max_samples")
+        self.threshold_ms = threshold_ms
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.rng = random.Random(seed)
+
+    @property
+    def alpha_per_look(self) -> float:
+        """Get significance level of each sequential look."""
+        return self.alpha / (self.max_samples - self.min_samples + 1)
+
+    def compare(
+        self, payload: Callable[[], Any], control: Callable[[], Any]
+    ) -> TimingVerdict:
+        """Time payload and control in randomized pairs until a verdict is reached."""
+        payload_ms: List[float] = []
+        control_ms: List[float] = []
+        p_slower = p_not_slower = 1.0
+        arms = [(payload, payload_ms), (control, control_ms)]
+        for trial in range(1, self.max_samples + 1):
+            self.rng.shuffle(arms)
+            for action, samples in arms:
+                samples.append(_time_ms(action))
+            if trial < self.min_samples:
+                continue
+            p_slower = mann_whitney_greater(
+                [value - self.threshold_ms / 2 for value in payload_ms], control_ms
+            )
+            p_not_slower = mann_whitney_greater(
+                control_ms, [value - self.threshold_ms for value in payload_ms]
+            )
+            if p_slower < self.alpha_per_look:
+                return TimingVerdict(
+                    "slower", p_slower, p_not_slower, payload_ms, control_ms
+                )
+            if p_not_slower < self.alpha_per_look:
+                return TimingVerdict(
+                    "not-slower", p_slower, p_not_slower, payload_ms, control_ms
+                )
+        return TimingVerdict(
+            "inconclusive", p_slower, p_not_slower, payload_ms, control_ms
+        )
+
+
+def _time_ms(action: Callable[[], Any]) -> float:
+    """Run an action and return its duration in milliseconds."""
+    start = perf_counter_ns()
+    action()
+    return (perf_counter_ns() - start) / 1e6
@@ -0,0 +1,74 @@
+"""
+Profiler for time spent in negative waits.
+
+A negative wait is an "eventually" check that ran into its timeout, e.g.
+waiting for an element that never appears. Each one costs the full timeout,
+so the total is reported at the end of the session to make such waits
+visible.
+"""
+
+from typing import Dict, List, Tuple
+
+# (wait key, duration in ms)
+Wait = Tuple[str, float]
+
+
+class WaitProfiler:
+    """Collect negative waits per test and aggregate them for the session."""
+
+    def __init__(self):
+        """Initialize wait profiler."""
+        self._pending: List[Wait] = []
+        self.by_key: Dict[str, List[float]] = {}
+        self.by_test: Dict[str, float] = {}
+
+    def record(self, key: str, duration_ms: float) -> None:
+        """Record a wait that ended in its timeout."""
+        self._pending.append((key, round(duration_ms, 1)))
+
+    def drain(self) -> List[Wait]:
+        """Get and clear waits recorded since the last drain."""
+        waits, self._pending = self._pending, []
+        return waits
+
+    def add(self, nodeid: str, waits: List[Wait]) -> None:
+        """Add waits reported by a test, possibly from another xdist worker."""
+        for key, duration_ms in waits:
+            self.by_key.setdefault(key, []).append(duration_ms)
+            self.by_test[nodeid] = self.by_test.get(nodeid, 0.0) + duration_ms
+
+    @property
+    def total_ms(self) -> float:
+        """Get total time spent in negative waits."""
+        return sum(self.by_test.values())
+
+    def summary(self, top: int = 5) -> List[str]:
+        """Get report lines with totals and the most expensive waits and tests."""
+        if not self.by_test:
+            return []
+        count = sum(len(durations) for durations in self.by_key.values())
+        lines = [
+            f"{count} negative waits cost {self.total_ms / 1000:.1f}s "
+            f"in {len(self.by_test)} tests"
+        ]
+        keys = sorted(self.by_key.items(), key=lambda item: sum(item[1]), reverse=True)
+        for key, durations in keys[:top]:
+            lines.append(
+                f"  {sum(durations) / 1000:7.1f}s  {len(durations):4d}x  {key}"
+            )
+        tests = sorted(self.by_test.items(), key=lambda item: item[1], reverse=True)
+        lines.append("Slowest tests by negative wait time:")
+        for nodeid, duration_ms in tests[:top]:
+            lines.append(f"  {duration_ms / 1000:7.1f}s  {nodeid}")
+        return lines
+
+
+_profiler: Dict[str, WaitProfiler] = {}
+
+
+def get_wait_profiler() -> WaitProfiler:
+    """Get the process-wide wait profiler."""
+    profiler = _profiler.get("current")
+    if profiler is None:
+        profiler = _profiler["current"] = WaitProfiler()
+    return profiler
@@ -0,0 +1,218 @@
+"""
+In-page XSS execution detector.
+
+``SENTINEL_SCRIPT`` is installed once per browser context with
+``add_init_script``, so it runs in every document before any page script. It
+hooks the places an injected payload ends up executing:
+
+* dialogs: ``alert``, ``confirm`` and ``prompt`` (suppressed, so they never block)
+* code sinks: ``Function`` and string ``setTimeout``/``setInterval``, only for
+  code containing a payload marker, so library calls such as
+  ``Function("return this")`` are not flagged
+* ``document.write``/``writeln``
+* DOM mutations adding inline or cross-origin scripts, ``on*`` handler
+  attributes or ``javascript:`` URLs in URL attributes (``href``, ``src``,
+  ``action``, ...) after the page has loaded; text such as an input ``value``
+  is never treated as a URL
+* navigation attempts: ``window.open`` and cross-origin or ``javascript:``
+  navigations (where the Navigation API is available)
+
+``eval`` itself is left untouched: replacing it would turn every direct eval
+into an indirect one and change its scope. A payload run through ``eval`` is
+still caught by the dialog, DOM and navigation hooks.
+
+Events go to an in-page buffer that is mirrored to ``sessionStorage``, so
+events from a document that navigated away are not lost. ``drain`` reads and
+clears the buffer in one call, so checking a whole batch of payloads is
+instant.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import List, Sequence
+
+# Strings every built-in XSS payload contains; code sinks only record code with one
+DEFAULT_MARKERS = ("XSS", "evil.com")
+
+_SENTINEL_TEMPLATE = r"""(() => {
+    if (window.__xssSentinel) return;
+    const KEY = "__xss_sentinel";
+    const MARKERS = __XSS_MARKERS__;
+    const marked = code =>
+        typeof code === "string" && MARKERS.some(marker => code.includes(marker));
+    const events = [];
+    try {
+        events.push(...JSON.parse(sessionStorage.getItem(KEY) || "[]"));
+    } catch (e) {}
+    let loaded = document.readyState !== "loading";
+    const record = (kind, detail) => {
+        events.push({
+            kind: kind, detail: String(detail).slice(0, 200), url: location.href,
+        });
+        try { sessionStorage.setItem(KEY, JSON.stringify(events)); } catch (e) {}
+    };
+    Object.defineProperty(window, "__xssSentinel", {value: {
+        drain() {
+            const drained = events.splice(0);
+            try { sessionStorage.removeItem(KEY); } catch (e) {}
+            return drained;
+        },
+    }});
+
+    window.alert = message => { record("dialog", "alert: " + message); };
+    window.confirm = message => {
+        record("dialog", "confirm: " + message);
+        return false;
+    };
+    window.prompt = message => {
+        record("dialog", "prompt: " + message);
+        return null;
+    };
+
+    const recordFunction = args => {
+        const body = args.length ? String(args[args.length - 1]) : "";
+        if (marked(body)) record("eval", "Function: " + body);
+    };
+    window.Function = new Proxy(window.Function, {
+        apply(target, self, args) {
+            recordFunction(args);
+            return Reflect.apply(target, self, args);
+        },
+        construct(target, args, newTarget) {
+            recordFunction(args);
+            return Reflect.construct(target, args, newTarget);
+        },
+    });
+    for (const name of ["setTimeout", "setInterval"]) {
+        const native = window[name];
+        window[name] = function (handler, ...rest) {
+            if (marked(handler)) record("eval", name + ": " + handler);
+            return native.call(this, handler, ...rest);
+        };
+    }
+    for (const name of ["write", "writeln"]) {
+        const native = Document.prototype[name];
+        Document.prototype[name] = function (...markup) {
+            if (loaded) record("document-write", markup.join(""));
+            return native.apply(this, markup);
+        };
+    }
+
+    const crossOrigin = url => {
+        try {
+            return new URL(url, location.href).origin !== location.origin;
+        } catch (e) {
+            return false;
+        }
+    };
+    const isJavascriptUrl = value => /^\s*javascript:/i.test(String(value));
+    // Attributes a browser follows as URLs (tag-specific ones name their tag)
+    const URL_ATTRIBUTES = new Map([
+        ["href", null], ["src", null], ["action", null], ["formaction", null],
+        ["xlink:href", null], ["data", "OBJECT"],
+    ]);
+    const inspectAttribute = (element, name, value) => {
+        if (value === null || value === undefined) return;
+        name = name.toLowerCase();
+        if (name.startsWith("on")) {
+            record("handler", name + "=" + value);
+        } else if (URL_ATTRIBUTES.has(name)
+                   && [null, element.tagName].includes(URL_ATTRIBUTES.get(name))
+                   && isJavascriptUrl(value)) {
+            record("javascript-url", name + "=" + value);
+        }
+    };
+    const inspect = element => {
+        if (element.nodeType !== Node.ELEMENT_NODE) return;
+        const script = element.tagName === "SCRIPT";
+        if (script && (!element.src || crossOrigin(element.src))) {
+            record("script", element.src || element.textContent);
+        }
+        for (const attribute of element.attributes) {
+            inspectAttribute(element, attribute.name, attribute.value);
+        }
+    };
+    new MutationObserver(mutations => {
+        if (!loaded) return;
+        for (const mutation of mutations) {
+            if (mutation.type === "attributes") {
+                // Only the changed attribute: typed text in a value is not a URL
+                const target = mutation.target, name = mutation.attributeName;
+                const value = mutation.attributeNamespace
+                    ? target.getAttributeNS(mutation.attributeNamespace, name)
+                    : target.getAttribute(name);
+                inspectAttribute(target, name, value);
+            }
+            for (const node of mutation.addedNodes) {
+                inspect(node);
+                if (node.querySelectorAll) node.querySelectorAll("*").forEach(inspect);
+            }
+        }
+    }).observe(document, {childList: true, subtree: true, attributes: true});
+    document.addEventListener("DOMContentLoaded", () => { loaded = true; });
+
+    const nativeOpen = window.open;
+    window.open = function (url, ...rest) {
+        record("navigation", "window.open: " + url);
+        return nativeOpen.call(this, url, ...rest);
+    };
+    if (window.navigation) {
+        window.navigation.addEventListener("navigate", event => {
+            const url = event.destination.url;
+            if (isJavascriptUrl(url) || crossOrigin(url)) record("navigation", url);
+        });
+    }
+})()"""
+
+
+def sentinel_script(markers: Sequence[str] = DEFAULT_MARKERS) -> str:
+    """Get the sentinel script recording code that contains one of ``markers``."""
+    return _SENTINEL_TEMPLATE.replace("__XSS_MARKERS__", json.dumps(list(markers)))
+
+
+SENTINEL_SCRIPT = sentinel_script()
+
+_DRAIN_SCRIPT = "() => window.__xssSentinel ? window.__xssSentinel.drain() : []"
+
+
+@dataclass(frozen=True)
+class XssEvent:
+    """Script execution observed by the sentinel."""
+
+    kind: str
+    detail: str
+    url: str
+
+    def __str__(self) -> str:
+        """String representation of the event."""
+        return f"{self.kind}: {self.detail} ({self.url})"
+
+
+def drain(page) -> List[XssEvent]:
+    """Get and clear the events recorded in a page."""
+    return [XssEvent(**event) for event in page.evaluate(_DRAIN_SCRIPT)]
+
+
+class XssSentinel:
+    """XSS sentinel installed in a browser context."""
+
+    def __init__(self, context, markers: Sequence[str] = DEFAULT_MARKERS):
+        """Initialize sentinel for a Playwright browser context.
+
+        ``markers`` are the strings the test's payloads contain; code sinks
+        only record code containing one of them.
+        """
+        self.context = context
+        self.script = sentinel_script(markers)
+
+    def install(self) -> "XssSentinel":
+        """Install into all future documents and the pages that are already open."""
+        self.context.add_init_script(self.script)
+        for page in self.context.pages:
+            page.evaluate(self.script)
+        return self
+
+    def drain(self, page=None) -> List[XssEvent]:
+        """Get and clear events of one page, or of all pages in the context."""
+        pages = [page] if page is not None else self.context.pages
+        return [event for page in pages for event in drain(page)]